@@ -0,0 +1,254 @@
+"""Scene-scale benchmarks for the SkyEngine core.
+
+Runs the engine against the headless skyExplorer stand-in at several scene
+sizes and writes the timings as JSON:
+
+    python benchmark_engine.py --output results.json
+    python benchmark_engine.py --sizes 10 1000 --baseline results.json
+
+With --baseline, the fastest run of every (benchmark, size) is compared
+against the stored one (the minimum is far less noisy than the median for
+short benchmarks) and the exit status is 1 when any of them is more than
+--threshold slower.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+# The suite measures engine overhead, so it always runs on the stand-in backend
+os.environ.setdefault("SKY_ENGINE_BACKEND", "headless")
+
+import sky_engine
+from sky_engine import (SkyEngine, Capture, GameObject, PlanetComponent, ConstellationComponent,
+                        Planet, Constellation, Vec, keyframe)
+import sky_explorer_headless
+
+DEFAULT_SIZES = [10, 1000, 10000, 100000]
+
+# Children per chain in the set_position hierarchy benchmark
+HIERARCHY_DEPTH = 10
+
+class Scene:
+    """One engine reused across sizes; each benchmark builds what it needs from an empty scene"""
+
+    def __init__(self):
+        self.engine = SkyEngine()
+
+    def reset(self):
+        self.engine.clear_all_objects()
+        sky_engine.all_frames.clear()
+
+    def planets(self, count: int) -> List[GameObject]:
+        objects = []
+        for index in range(count):
+            obj = self.engine.create_object(f"Planet{index}")
+            obj.add_component(PlanetComponent(Planet.PlanetName.Mars))
+            objects.append(obj)
+        return objects
+
+    def constellations(self, count: int) -> List[GameObject]:
+        objects = []
+        for index in range(count):
+            obj = self.engine.create_object(f"Constellation{index}")
+            obj.add_component(ConstellationComponent(Constellation.ConstellationName.UMa))
+            objects.append(obj)
+        return objects
+
+    def chains(self, count: int) -> List[GameObject]:
+        """count objects as chains of HIERARCHY_DEPTH, returning the chain roots"""
+        engine = self.engine
+        roots = []
+        for index in range(0, count, HIERARCHY_DEPTH):
+            parent = engine.create_object(f"Root{index}")
+            parent.add_component(PlanetComponent(Planet.PlanetName.Earth))
+            roots.append(parent)
+            for depth in range(1, min(HIERARCHY_DEPTH, count - index)):
+                child = GameObject(f"Node{index + depth}", engine)
+                child.add_component(PlanetComponent(Planet.PlanetName.Mars))
+                parent.add_child(child)
+                parent = child
+        return roots
+
+def bench_create_add_component(scene: Scene, size: int) -> Callable[[], None]:
+    def run():
+        scene.planets(size)
+    return run
+
+def bench_set_position_hierarchy(scene: Scene, size: int) -> Callable[[], None]:
+    roots = scene.chains(size)
+    offset = [0.0]
+
+    def run():
+        offset[0] += 1.0
+        for index, root in enumerate(roots):
+            root.set_position(Vec(offset[0], index, 0))
+        scene.engine.apply_transforms()
+    return run
+
+def bench_get_object_by_id(scene: Scene, size: int) -> Callable[[], None]:
+    ids = [obj.id for obj in scene.planets(size)]
+    engine = scene.engine
+
+    def run():
+        for object_id in ids:
+            engine.get_object_by_id(object_id)
+    return run
+
+def bench_edit_all_planets(scene: Scene, size: int) -> Callable[[], None]:
+    scene.planets(size)
+    density = [0.0]
+
+    def run():
+        # A new value each run so the sent-value cache cannot skip the calls
+        density[0] += 0.1
+        scene.engine.edit_all_planets(tree_density=density[0], clouds_intensity=density[0])
+    return run
+
+def bench_set_constellation_display_mode(scene: Scene, size: int) -> Callable[[], None]:
+    scene.constellations(size)
+
+    def run():
+        for mode in ('lines_only', 'art_only', 'labels_only', 'all', 'none'):
+            scene.engine.set_constellation_display_mode(mode)
+    return run
+
+def bench_capture_record(scene: Scene, size: int) -> Callable[[], None]:
+    engine = scene.engine
+
+    def run():
+        capture = Capture(engine)
+        capture.start()
+        for index in range(size):
+            engine.set_camera_zoom(1.0 + index % 10)
+        capture.stop()
+    return run
+
+def bench_capture_replay(scene: Scene, size: int) -> Callable[[], None]:
+    engine = scene.engine
+    capture = Capture(engine)
+    capture.start()
+    for index in range(size):
+        engine.set_camera_zoom(1.0 + index % 10)
+    capture.stop()
+    return capture.run_capture
+
+def bench_run_all_keyframes(scene: Scene, size: int) -> Callable[[], None]:
+    engine = scene.engine
+    for index in range(size):
+        @keyframe(0.0, 0.0, index)
+        def cue(sky_engine, zoom=1.0 + index % 10):
+            sky_engine.set_camera_zoom(zoom)
+    return engine.runAll
+
+BENCHMARKS: Dict[str, Callable[[Scene, int], Callable[[], None]]] = {
+    'create_object_add_component': bench_create_add_component,
+    'set_position_hierarchy': bench_set_position_hierarchy,
+    'get_object_by_id': bench_get_object_by_id,
+    'edit_all_planets': bench_edit_all_planets,
+    'set_constellation_display_mode': bench_set_constellation_display_mode,
+    'capture_record': bench_capture_record,
+    'capture_replay': bench_capture_replay,
+    'run_all_zero_length_keyframes': bench_run_all_keyframes,
+}
+
+# Benchmarks that build their own scene in the timed call and need a fresh one per repeat
+REBUILT_PER_REPEAT = {'create_object_add_component'}
+
+def run_benchmarks(sizes: List[int], names: List[str], repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    scene = Scene()
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in names:
+        factory = BENCHMARKS[name]
+        results[name] = {}
+        for size in sizes:
+            timings = []
+            scene.reset()
+            run = factory(scene, size)
+            for _ in range(repeat):
+                if name in REBUILT_PER_REPEAT:
+                    scene.reset()
+                    run = factory(scene, size)
+                sky_explorer_headless.reset_calls()
+                start = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - start)
+            median = statistics.median(timings)
+            results[name][str(size)] = {
+                'median_s': median,
+                'min_s': min(timings),
+                'per_item_us': median / size * 1e6,
+                'backend_calls': sum(sky_explorer_headless.call_counts.values()),
+            }
+            print(f"{name:34s} {size:>7d}  median {median * 1e3:10.2f} ms  "
+                  f"({median / size * 1e6:8.2f} us/item)", flush=True)
+        scene.reset()
+    return results
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Names of (benchmark, size) pairs slower than the baseline by more than threshold"""
+    regressions = []
+    print(f"\n{'benchmark':34s} {'size':>7s} {'baseline ms':>12s} {'current ms':>12s} {'ratio':>7s}")
+    for name, by_size in results.items():
+        for size, current in by_size.items():
+            previous = baseline.get('results', {}).get(name, {}).get(size)
+            if previous is None:
+                continue
+            ratio = current['min_s'] / previous['min_s'] if previous['min_s'] else float('inf')
+            flag = ""
+            if ratio > 1.0 + threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name}[{size}]")
+            print(f"{name:34s} {size:>7s} {previous['min_s'] * 1e3:12.2f} "
+                  f"{current['min_s'] * 1e3:12.2f} {ratio:7.2f}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="scene sizes in GameObjects")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="run only these benchmarks")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per benchmark and size")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds of simulated backend latency per call")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare against a JSON file written by --output")
+    parser.add_argument('--threshold', type=float, default=0.10, help="allowed slowdown before a regression is reported")
+    args = parser.parse_args()
+
+    sky_engine.configure_logging(console=False, performance=True, level='WARNING')
+    sky_explorer_headless.configure(latency=args.latency, record=False)
+
+    names = args.only or list(BENCHMARKS)
+    results = run_benchmarks(args.sizes, names, args.repeat)
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'backend_latency_s': args.latency,
+            'hierarchy_depth': HIERARCHY_DEPTH,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nNo regressions")
+
+if __name__ == "__main__":
+    main()
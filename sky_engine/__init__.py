@@ -0,0 +1,70 @@
+"""Game-object layer over skyExplorer.
+
+The core (SkyEngine, GameObject, Component, transforms, logging) is imported
+with the package. Component families, capture, culling/LOD and the asyncio
+facade live in submodules that are imported on first attribute access, so
+
+    from sky_engine import SkyEngine, SunComponent
+
+loads only what a show script uses. ``from sky_engine import *`` still
+provides every name, including the skyExplorer ones.
+"""
+import importlib
+
+from ._backend import *
+from ._backend import Vec4
+from .logs import log, RingBufferHandler, configure_logging, set_performance_mode, dump_log_buffer
+from .bridge import BridgeProfiler, BridgeProxy, sky_method, get_capability_table
+from .catalog import EnumCatalog, get_catalog, resolve_enum, engine_enums, build_catalogs
+from .component import Component, SkyProperty
+from .transforms import TransformStore, SpatialIndex, TRAVERSAL_ORDERS, iter_hierarchy
+from .game_object import GameObject, ObjectPool
+from .engine import (SkyEngine, UpdateScheduler, CommandQueue, UPDATE_PHASES, STARTUP_TIMEOUT,
+                     STARTUP_POLL_INTERVAL, reset_scene, keyframe, frame, all_frames)
+
+# Public name -> submodule it is imported from on first access
+_LAZY_SUBMODULES = {
+    'PlanetComponent': 'components',
+    'ConstellationComponent': 'components',
+    'SunComponent': 'components',
+    'TextComponent': 'components',
+    'AsteroidComponent': 'components',
+    'CometComponent': 'components',
+    'SatelliteComponent': 'components',
+    'StarsComponent': 'components',
+    'AudioComponent': 'audio',
+    'AudioLayerComponent': 'audio',
+    'ClockComponent': 'timekeeping',
+    'DateManagerComponent': 'timekeeping',
+    'FrustumCuller': 'camera',
+    'LODBand': 'camera',
+    'PlanetLODManager': 'camera',
+    'Capture': 'capture',
+    'AsyncSkyEngine': 'async_engine',
+    'test_sky_engine': 'examples',
+}
+
+# Module globals that are rebound at runtime, so always read from their module
+_LIVE_GLOBALS = {
+    'global_animator': 'engine',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        value = getattr(importlib.import_module(f".{_LAZY_SUBMODULES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    if name in _LIVE_GLOBALS:
+        return getattr(importlib.import_module(f".{_LIVE_GLOBALS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LIVE_GLOBALS))
+
+# Submodules bound as package attributes by the imports above are not part of the API
+_SUBMODULES = {'importlib', 'logs', 'bridge', 'catalog', 'component', 'transforms', 'game_object', 'engine'}
+
+__all__ = sorted(
+    {name for name in globals() if not name.startswith('_') and name not in _SUBMODULES}
+    | set(_LAZY_SUBMODULES) | set(_LIVE_GLOBALS)
+)
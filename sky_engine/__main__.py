@@ -0,0 +1,3 @@
+from .examples import test_sky_engine
+
+test_sky_engine()
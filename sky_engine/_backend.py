@@ -0,0 +1,10 @@
+"""skyExplorer bindings, or the headless stand-in when SKY_ENGINE_BACKEND=headless"""
+import os
+
+# SKY_ENGINE_BACKEND=headless runs on the pure-Python stand-in (sky_explorer_headless)
+if os.environ.get("SKY_ENGINE_BACKEND", "").lower() == "headless":
+    from sky_explorer_headless import *
+    from sky_explorer_headless import Vec4
+else:
+    from skyExplorer import *
+    from skyExplorer import Vec4
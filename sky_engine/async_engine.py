@@ -0,0 +1,76 @@
+"""Asyncio facade over SkyEngine"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+import asyncio
+import functools
+
+from .engine import SkyEngine, _run_keyframe
+
+class AsyncSkyEngine:
+    """Asyncio facade over SkyEngine for shows driven alongside UI and sensor input.
+    
+    Engine methods are available as coroutines, e.g.
+    
+        engine = await AsyncSkyEngine.create()
+        await engine.go_to_planet(Planet.PlanetName.Mars)
+        await engine.keyframe(2.0, 1.0, cue)
+    
+    Every call runs on one dedicated backend thread, so skyExplorer only ever
+    sees calls from a single thread, in the order they were awaited; waits
+    (startup, keyframe holds) are asyncio sleeps, so many independent cue
+    chains can be in flight on one event loop.
+    """
+    
+    def __init__(self, sky_engine: 'SkyEngine' = None, executor: ThreadPoolExecutor = None):
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="sky-backend")
+        self._owns_executor = executor is None
+        self.sky_engine = sky_engine
+    
+    @classmethod
+    async def create(cls, executor: ThreadPoolExecutor = None, **engine_options) -> 'AsyncSkyEngine':
+        """Build the SkyEngine on the backend thread without blocking the event loop"""
+        facade = cls(executor=executor)
+        facade.sky_engine = await facade.run(SkyEngine, **engine_options)
+        return facade
+    
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) on the backend thread and return its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def call(self, method_name: str, *args, **kwargs) -> Any:
+        """Run a SkyEngine method on the backend thread"""
+        # Resolved on the backend thread, so a keyframe capture never sees another chain's calls
+        return await self.run(lambda: getattr(self.sky_engine, method_name)(*args, **kwargs))
+    
+    def __getattr__(self, name: str):
+        attribute = getattr(self.sky_engine, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+        
+        async def method(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+        
+        method.__name__ = name
+        method.__doc__ = attribute.__doc__
+        return method
+    
+    async def keyframe(self, transition_time: float, duration: float, func: Callable, *args, **kwargs) -> Any:
+        """Awaitable keyframe: func(sky_engine, *args) is captured and replayed, then held for duration"""
+        result = await self.run(_run_keyframe, transition_time, func, (self.sky_engine,) + args, kwargs)
+        await asyncio.sleep(transition_time + duration)
+        return result
+    
+    async def close(self):
+        """Wait for pending backend calls and stop the backend thread (if this facade created it)"""
+        await self.run(lambda: None)
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+    
+    async def __aenter__(self) -> 'AsyncSkyEngine':
+        if self.sky_engine is None:
+            self.sky_engine = await self.run(SkyEngine)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
@@ -0,0 +1,136 @@
+"""Audio playback components"""
+from ._backend import Audio, AudioLayer
+from .component import Component
+from .logs import log
+
+class AudioComponent(Component):
+    """Component for audio playback"""
+    
+    lazy_backend = True
+    
+    setter_attributes = ('volume',)
+    
+    def __init__(self, audio_file: str = None):
+        super().__init__("Audio")
+        self.audio_file = None
+        self.volume = 1.0  # Default volume
+        
+        if audio_file:
+            self.load_audio(audio_file)
+    
+    def _create_sky_object(self):
+        return Audio()
+    
+    def load_audio(self, audio_file: str):
+        """Load an audio file"""
+        # Audio.load expects (outputId, filename)
+        # Use outputId 0 as default
+        self._backend_call('load', 0, audio_file)
+        self.audio_file = audio_file
+        log.debug("Loaded audio file: %s", audio_file)
+    
+    def play(self):
+        """Play audio"""
+        if self.ensure_sky_object():
+            self.sky_object.play()
+            log.debug("Audio playing")
+    
+    def pause(self):
+        """Pause audio"""
+        if self.sky_object:
+            self.sky_object.pause()
+            log.debug("Audio paused")
+    
+    def stop(self):
+        """Stop audio"""
+        if self.sky_object:
+            self.sky_object.stop()
+            log.debug("Audio stopped")
+    
+    def seek(self, time: float):
+        """Seek to specific time"""
+        if self.sky_object:
+            self.sky_object.seek(time)
+            log.debug("Audio seeked to: %s", time)
+    
+    def set_volume(self, volume: float):
+        """Set volume (0-1)"""
+        self.volume = volume
+        self._backend_call('setVolume', volume)
+        log.debug("Audio volume: %s", volume)
+    
+    def set_volume_db(self, volume_db: float):
+        """Set volume in decibels"""
+        self._backend_call('setVolumeDb', volume_db)
+        log.debug("Audio volume dB: %s", volume_db)
+    
+    def clear(self):
+        """Clear audio"""
+        if self.sky_object:
+            self.sky_object.clear()
+            log.debug("Audio cleared")
+
+class AudioLayerComponent(Component):
+    """Component for layered audio management"""
+    
+    def __init__(self):
+        super().__init__("AudioLayer")
+        self.layers = {}
+        self.sky_object = AudioLayer()
+    
+    def add_layer(self, layer_name: str, audio_file: str):
+        """Add audio layer"""
+        if layer_name not in self.layers:
+            self.layers[layer_name] = Audio()
+            self.layers[layer_name].load(audio_file)
+            log.debug("Audio layer added: %s -> %s", layer_name, audio_file)
+    
+    def play_layer(self, layer_name: str):
+        """Play specific layer"""
+        if layer_name in self.layers:
+            self.layers[layer_name].play()
+            log.debug("Audio layer playing: %s", layer_name)
+    
+    def pause_layer(self, layer_name: str):
+        """Pause specific layer"""
+        if layer_name in self.layers:
+            self.layers[layer_name].pause()
+            log.debug("Audio layer paused: %s", layer_name)
+    
+    def stop_layer(self, layer_name: str):
+        """Stop specific layer"""
+        if layer_name in self.layers:
+            self.layers[layer_name].stop()
+            log.debug("Audio layer stopped: %s", layer_name)
+    
+    def set_layer_volume(self, layer_name: str, volume: float):
+        """Set volume for specific layer"""
+        if layer_name in self.layers:
+            self.layers[layer_name].setVolume(volume)
+            log.debug("Audio layer volume set: %s -> %s", layer_name, volume)
+    
+    def remove_layer(self, layer_name: str):
+        """Remove audio layer"""
+        if layer_name in self.layers:
+            self.layers[layer_name].clear()
+            del self.layers[layer_name]
+            log.debug("Audio layer removed: %s", layer_name)
+    
+    def play_all_layers(self):
+        """Play all layers"""
+        for layer_name in self.layers:
+            self.layers[layer_name].play()
+        log.debug("All audio layers playing")
+    
+    def stop_all_layers(self):
+        """Stop all layers"""
+        for layer_name in self.layers:
+            self.layers[layer_name].stop()
+        log.debug("All audio layers stopped")
+    
+    def clear_all_layers(self):
+        """Clear all layers"""
+        for layer_name in self.layers:
+            self.layers[layer_name].clear()
+        self.layers.clear()
+        log.debug("All audio layers cleared")
@@ -0,0 +1,196 @@
+"""Capability tables and call profiling for the skyExplorer bridge"""
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Optional, Tuple
+from collections import deque
+import functools
+import json
+import os
+import threading
+import numpy as np
+
+# skyExplorer class -> {method name: unbound method, or None when unsupported}
+_capability_tables: Dict[type, Dict[str, Optional[Callable]]] = {}
+
+def sky_method(sky_object, name: str) -> Optional[Callable]:
+    """Unbound method of sky_object's skyExplorer class, or None if the class lacks it.
+    
+    Each (class, name) pair is probed once and cached, so hot paths pay a
+    dict lookup instead of a hasattr call; invoke the result as
+    method(sky_object, *args).
+    """
+    sky_class = type(sky_object)
+    if sky_class is BridgeProxy:
+        return sky_object._profiler.unbound(type(sky_object._target), name)
+    table = _capability_tables.get(sky_class)
+    if table is None:
+        table = _capability_tables[sky_class] = {}
+    try:
+        return table[name]
+    except KeyError:
+        method = getattr(sky_class, name, None)
+        table[name] = method = method if callable(method) else None
+        return method
+
+def sky_property_value(sky_object, setter: str) -> Any:
+    """Current value of the property a set<Name> setter writes, or None if it cannot be read"""
+    value = getattr(sky_object, setter[3].lower() + setter[4:], None)
+    return None if callable(value) else value
+
+def get_capability_table(sky_class: type) -> Dict[str, bool]:
+    """Methods probed so far for a skyExplorer class and whether each is supported"""
+    return {name: method is not None for name, method in _capability_tables.get(sky_class, {}).items()}
+
+class BridgeProfiler:
+    """Timings of skyExplorer calls made through BridgeProxy wrappers.
+    
+    Keeps, per (class, method), the call count, cumulative time and the
+    latest max_samples latencies (for p50/p99), the number of calls in each
+    engine frame, and optionally one trace event per call for
+    write_chrome_trace(). Attribute assignments are recorded as 'name='.
+    """
+    
+    def __init__(self, trace: bool = True, max_samples: int = 10000, max_events: int = 200000):
+        self.trace = trace
+        self.max_samples = max_samples
+        self.counts: Dict[Tuple[str, str], int] = {}
+        self.total_ns: Dict[Tuple[str, str], int] = {}
+        self.samples: Dict[Tuple[str, str], deque] = {}
+        self.frame_calls: deque = deque(maxlen=max_samples)
+        self.events: deque = deque(maxlen=max_events)
+        self.frames = 0
+        self._calls_this_frame = 0
+        self._origin_ns = perf_counter_ns()
+        
+        # (sky class, method name) -> timed function(proxy, *args), or None when unsupported
+        self._unbound: Dict[Tuple[type, str], Optional[Callable]] = {}
+    
+    def record(self, key: Tuple[str, str], start_ns: int, end_ns: int):
+        """Account one call that ran from start_ns to end_ns"""
+        elapsed = end_ns - start_ns
+        count = self.counts.get(key)
+        if count is None:
+            self.counts[key] = 1
+            self.total_ns[key] = elapsed
+            self.samples[key] = deque([elapsed], maxlen=self.max_samples)
+        else:
+            self.counts[key] = count + 1
+            self.total_ns[key] += elapsed
+            self.samples[key].append(elapsed)
+        self._calls_this_frame += 1
+        if self.trace:
+            self.events.append((key, start_ns, elapsed, threading.get_ident()))
+    
+    def timed(self, key: Tuple[str, str], function: Callable) -> Callable:
+        """Wrap function so each call is recorded under key"""
+        record = self.record
+        
+        def call(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(key, start, perf_counter_ns())
+        return call
+    
+    def unbound(self, sky_class: type, name: str) -> Optional[Callable]:
+        """Timed counterpart of sky_method() taking a BridgeProxy as first argument"""
+        cache_key = (sky_class, name)
+        try:
+            return self._unbound[cache_key]
+        except KeyError:
+            pass
+        method = getattr(sky_class, name, None)
+        if callable(method):
+            timed = self.timed((sky_class.__name__, name), method)
+            
+            def proxy_method(proxy, *args, **kwargs):
+                return timed(proxy._target, *args, **kwargs)
+            self._unbound[cache_key] = proxy_method
+        else:
+            self._unbound[cache_key] = None
+        return self._unbound[cache_key]
+    
+    def end_frame(self):
+        """Close the current frame's call count"""
+        self.frame_calls.append(self._calls_this_frame)
+        if self.trace:
+            self.events.append((None, perf_counter_ns(), self._calls_this_frame, threading.get_ident()))
+        self._calls_this_frame = 0
+        self.frames += 1
+    
+    def reset(self):
+        """Drop everything recorded so far"""
+        self.counts.clear()
+        self.total_ns.clear()
+        self.samples.clear()
+        self.frame_calls.clear()
+        self.events.clear()
+        self.frames = 0
+        self._calls_this_frame = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Per (class, method) call statistics in milliseconds, plus per-frame call counts"""
+        calls = {}
+        for key, count in self.counts.items():
+            p50, p99 = np.percentile(np.fromiter(self.samples[key], dtype=np.float64), (50, 99)) / 1e6
+            calls[key] = {
+                'count': count,
+                'total_ms': self.total_ns[key] / 1e6,
+                'mean_ms': self.total_ns[key] / count / 1e6,
+                'p50_ms': float(p50),
+                'p99_ms': float(p99),
+            }
+        frame_calls = list(self.frame_calls)
+        return {
+            'calls': calls,
+            'frames': {
+                'count': self.frames,
+                'calls_per_frame': frame_calls,
+                'mean_calls_per_frame': float(np.mean(frame_calls)) if frame_calls else 0.0,
+                'max_calls_per_frame': max(frame_calls) if frame_calls else 0,
+                'calls_this_frame': self._calls_this_frame,
+            },
+        }
+    
+    def write_chrome_trace(self, filename: str):
+        """Write recorded calls as Chrome trace / Perfetto JSON (open in ui.perfetto.dev)"""
+        pid = os.getpid()
+        origin = self._origin_ns
+        events = []
+        for key, start_ns, value, thread_id in self.events:
+            if key is None:
+                events.append({'name': 'frame', 'ph': 'i', 's': 'p', 'pid': pid, 'tid': thread_id,
+                               'ts': (start_ns - origin) / 1000, 'args': {'calls': value}})
+            else:
+                events.append({'name': f"{key[0]}.{key[1]}", 'cat': key[0], 'ph': 'X', 'pid': pid,
+                               'tid': thread_id, 'ts': (start_ns - origin) / 1000, 'dur': value / 1000})
+        with open(filename, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+class BridgeProxy:
+    """Wraps a skyExplorer object so every method call and attribute assignment is timed"""
+    
+    __slots__ = ('_target', '_profiler')
+    
+    def __init__(self, target, profiler: BridgeProfiler):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_profiler', profiler)
+    
+    def __getattr__(self, name: str):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+        method = self._profiler.unbound(type(self._target), name)
+        if method is None:
+            return attribute
+        return functools.partial(method, self)
+    
+    def __setattr__(self, name: str, value: Any):
+        start = perf_counter_ns()
+        try:
+            setattr(self._target, name, value)
+        finally:
+            self._profiler.record((type(self._target).__name__, f"{name}="), start, perf_counter_ns())
+    
+    def __repr__(self) -> str:
+        return f"BridgeProxy({self._target!r})"
@@ -0,0 +1,217 @@
+"""View culling and distance-based planet detail"""
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import numpy as np
+
+from .components import PlanetComponent
+from .game_object import GameObject
+from .transforms import TransformStore
+
+if TYPE_CHECKING:
+    from .engine import SkyEngine
+
+class FrustumCuller:
+    """Dims cullable components whose objects fall outside the camera view.
+    
+    The view is the cone around the camera's forward axis (camera_rotation
+    HPR applied to +Z, as in look_at) with half-angle camera_fov / 2 plus a
+    margin in degrees. Objects are treated as spheres whose radius is their
+    mean world scale. Visibility for every candidate is computed in one
+    NumPy pass; skyExplorer is only called for objects whose state changes,
+    hidden ones going to culled_intensity and returning ones back to their
+    component's own intensity.
+    """
+    
+    def __init__(self, sky_engine: 'SkyEngine'):
+        self.sky_engine = sky_engine
+        self.enabled = False
+        self.margin = 5.0
+        self.culled_intensity = 0.0
+        self._culled: Dict[GameObject, None] = {}
+    
+    def _candidates(self) -> List[GameObject]:
+        """Registered objects carrying at least one cullable component"""
+        engine = self.sky_engine
+        candidates: Dict[GameObject, None] = {}
+        for component_type, objects in engine._objects_by_component_type.items():
+            for obj in objects:
+                component = obj.components.get(component_type)
+                if component is not None and component.cullable:
+                    candidates[obj] = None
+        return list(candidates)
+    
+    def visible_mask(self, objects: List[GameObject]) -> np.ndarray:
+        """Boolean array telling which objects intersect the view cone"""
+        engine = self.sky_engine
+        if not objects:
+            return np.zeros(0, dtype=bool)
+        store = engine.transforms
+        slots = np.fromiter((obj._slot for obj in objects), dtype=np.int64, count=len(objects))
+        position = engine.camera_position
+        rotation = engine.camera_rotation
+        forward = TransformStore.hpr_to_matrices(np.array([[rotation.x, rotation.y, rotation.z]]))[0] @ np.array([0.0, 0.0, 1.0])
+        
+        offsets = store.world_position[slots] - np.array([position.x, position.y, position.z])
+        distance = np.linalg.norm(offsets, axis=1)
+        radius = store.world_scale[slots].mean(axis=1)
+        inside = distance <= radius
+        safe_distance = np.where(inside, 1.0, distance)
+        angle = np.degrees(np.arccos(np.clip(offsets @ forward / safe_distance, -1.0, 1.0)))
+        angular_radius = np.degrees(np.arcsin(np.clip(radius / safe_distance, 0.0, 1.0)))
+        return inside | (angle - angular_radius <= engine.camera_fov / 2.0 + self.margin)
+    
+    def cull(self) -> Tuple[int, int]:
+        """Update dimmed state for every candidate and return (hidden, restored) counts"""
+        engine = self.sky_engine
+        engine._flush_transforms()
+        
+        # Objects that left the scene while dimmed are forgotten, not restored
+        for obj in [obj for obj in self._culled if engine._objects_by_id.get(obj.id) is not obj]:
+            del self._culled[obj]
+        
+        objects = self._candidates()
+        visible = self.visible_mask(objects)
+        hidden = restored = 0
+        for obj, is_visible in zip(objects, visible.tolist()):
+            if is_visible:
+                if obj in self._culled:
+                    del self._culled[obj]
+                    self._set_dimmed(obj, False)
+                    restored += 1
+            elif obj not in self._culled:
+                self._culled[obj] = None
+                self._set_dimmed(obj, True)
+                hidden += 1
+        return hidden, restored
+    
+    def restore_all(self):
+        """Bring every dimmed object back to its own intensity"""
+        for obj in list(self._culled):
+            self._set_dimmed(obj, False)
+        self._culled.clear()
+    
+    def is_culled(self, obj: GameObject) -> bool:
+        return obj in self._culled
+    
+    def _set_dimmed(self, obj: GameObject, dimmed: bool):
+        # Sent through the component, so authored set_intensity calls while culled are held back
+        culled_intensity = self.culled_intensity
+        override = (lambda intensity: culled_intensity) if dimmed else None
+        for component in obj.components.values():
+            if component.cullable and component.sky_object is not None:
+                component._override_send('setIntensity', override, getattr(component, 'intensity', 1.0))
+
+class LODBand:
+    """Detail tier used for planets up to max_distance from the camera.
+    
+    detail maps PlanetComponent attributes from PlanetLODManager.FEATURES to
+    multipliers applied to the component's own value (1.0 when omitted).
+    """
+    
+    def __init__(self, max_distance: float, detail: Dict[str, float] = None):
+        self.max_distance = max_distance
+        self.detail = dict(detail or {})
+        unknown = set(self.detail) - set(PlanetLODManager.FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown LOD features: {sorted(unknown)}")
+    
+    def __repr__(self):
+        return f"LODBand({self.max_distance}, {self.detail})"
+
+class PlanetLODManager:
+    """Switches PlanetComponent detail features by camera distance.
+    
+    Bands are ordered from nearest to farthest; a planet uses the first band
+    whose max_distance is beyond it (the last band covers everything else).
+    A planet only moves to a farther tier once it is hysteresis (a fraction)
+    past the boundary, and back to a nearer one once it is that fraction
+    inside it, so planets near a boundary do not flicker. Tier values are
+    sent through the component, scaling its authored values (including
+    later set_* calls), which are restored at tier 0 or when LOD is disabled.
+    """
+    
+    # Component attribute -> skyExplorer setter
+    FEATURES = {
+        'tree_intensity': 'setTreeIntensity',
+        'tree_density': 'setTreeDensity',
+        'tree_max_distance': 'setTreeMaxDistance',
+        'terrain_intensity': 'setTerrainIntensity',
+        'elevation_scale': 'setElevationScale',
+        'clouds_intensity': 'setCloudsIntensity',
+        'cloud_thickness': 'setCloudThickness',
+        'live_patch_intensity': 'setLivePatchIntensity',
+    }
+    
+    def __init__(self, sky_engine: 'SkyEngine'):
+        self.sky_engine = sky_engine
+        self.enabled = False
+        self.hysteresis = 0.1
+        self._tiers: Dict[PlanetComponent, int] = {}
+        self.set_bands([
+            LODBand(100.0),
+            LODBand(1000.0, {'tree_intensity': 0.0, 'tree_density': 0.25, 'live_patch_intensity': 0.0,
+                             'cloud_thickness': 0.5}),
+            LODBand(float('inf'), {'tree_intensity': 0.0, 'tree_density': 0.0, 'live_patch_intensity': 0.0,
+                                   'terrain_intensity': 0.0, 'elevation_scale': 0.0,
+                                   'clouds_intensity': 0.0, 'cloud_thickness': 0.0}),
+        ])
+    
+    def set_bands(self, bands: List[LODBand]):
+        """Replace the distance bands (nearest first), restoring full detail before re-evaluating"""
+        if not bands:
+            raise ValueError("At least one LOD band is required")
+        limits = [band.max_distance for band in bands]
+        if limits != sorted(limits):
+            raise ValueError("LOD bands must be ordered by increasing max_distance")
+        if self._tiers:
+            self.restore_all()
+        self.bands = list(bands)
+        self._boundaries = np.array(limits[:-1], dtype=float)
+    
+    def tier_of(self, component: PlanetComponent) -> int:
+        return self._tiers.get(component, 0)
+    
+    def evaluate(self) -> int:
+        """Update every planet's tier from its camera distance and return the number of switches"""
+        engine = self.sky_engine
+        engine._flush_transforms()
+        
+        planets = [(obj, obj.components['Planet']) for obj in engine._objects_by_component_type.get('Planet', ())]
+        live = {component for _, component in planets}
+        for component in [component for component in self._tiers if component not in live]:
+            del self._tiers[component]
+        if not planets:
+            return 0
+        
+        slots = np.fromiter((obj._slot for obj, _ in planets), dtype=np.int64, count=len(planets))
+        camera = engine.camera_position
+        distance = np.linalg.norm(engine.transforms.world_position[slots] - np.array([camera.x, camera.y, camera.z]), axis=1)
+        boundaries = self._boundaries
+        farther = (distance[:, None] > boundaries * (1.0 + self.hysteresis)).sum(axis=1)
+        nearer = (distance[:, None] > boundaries * (1.0 - self.hysteresis)).sum(axis=1)
+        current = np.fromiter((self._tiers.get(component, 0) for _, component in planets), dtype=np.int64, count=len(planets))
+        target = np.where(farther > current, farther, np.minimum(current, nearer))
+        
+        switched = np.flatnonzero(target != current)
+        for index in switched.tolist():
+            component = planets[index][1]
+            self._apply_tier(component, int(target[index]))
+        return len(switched)
+    
+    def restore_all(self):
+        """Send every planet's authored detail values again"""
+        for component in list(self._tiers):
+            self._apply_tier(component, 0)
+        self._tiers.clear()
+    
+    def _apply_tier(self, component: PlanetComponent, tier: int):
+        # Tier multipliers stay attached to the setters, so authored changes are scaled too
+        previous = self.bands[self._tiers.get(component, 0)].detail
+        detail = self.bands[tier].detail
+        if tier:
+            self._tiers[component] = tier
+        else:
+            self._tiers.pop(component, None)
+        for attribute in previous.keys() | detail.keys():
+            multiplier = detail.get(attribute)
+            override = None if multiplier is None else (lambda value, multiplier=multiplier: value * multiplier)
+            component._override_send(self.FEATURES[attribute], override, getattr(component, attribute))
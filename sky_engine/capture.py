@@ -0,0 +1,251 @@
+"""Recording and replay of SkyEngine calls"""
+import inspect
+
+from ._backend import Vec
+from .engine import SkyEngine
+from .logs import log
+
+# Engine methods that must still run while recording, since the caller needs the objects they return
+_SPAWNING_METHODS = ('create_object', 'create_objects', 'acquire_object')
+
+class Capture:
+    """Capture class for recording and replaying Sky Engine commands"""
+    
+    def __init__(self, sky_engine: SkyEngine):
+        self.sky_engine = sky_engine
+        self.instructions = []
+        self.is_recording = False
+        self._original_methods = {}
+        self._wrapped_objects = {}
+    
+    def start(self):
+        """Start recording commands - override all SkyEngine methods"""
+        self.instructions = []
+        self.is_recording = True
+        self._wrapped_objects = {}
+        
+        # Override all SkyEngine methods
+        self._override_all_methods()
+        
+        log.info("Capture started - recording commands")
+    
+    def stop(self):
+        """Stop recording commands - restore original methods"""
+        self.is_recording = False
+        
+        # Restore all original methods
+        self._restore_all_methods()
+        
+        log.info("Capture stopped - recorded %s commands", len(self.instructions))
+    
+    def run_capture(self):
+        """Execute all recorded commands"""
+        if not self.instructions:
+            log.warning("No commands to run")
+            return
+        
+        log.info("Running %s recorded commands...", len(self.instructions))
+        for i, instruction in enumerate(self.instructions):
+            try:
+                self._execute_instruction(instruction)
+                log.debug("Executed command %s/%s", i+1, len(self.instructions))
+            except Exception as e:
+                log.error("Error executing command %s: %s", i+1, e)
+        
+        log.info("All commands executed")
+    
+    def run_parallel(self):
+        """Execute all recorded commands simultaneously (in parallel)"""
+        if not self.instructions:
+            log.warning("No commands to run")
+            return
+        
+        log.info("Running %s recorded commands in parallel...", len(self.instructions))
+        
+        # Group commands by type for better organization
+        camera_commands = []
+        object_commands = []
+        component_commands = []
+        other_commands = []
+        
+        for instruction in self.instructions:
+            method_name = instruction['method']
+            if method_name.startswith('set_camera_') or method_name.startswith('move_camera') or method_name.startswith('rotate_camera') or method_name.startswith('zoom_camera') or method_name.startswith('look_at') or method_name.startswith('orbit_camera'):
+                camera_commands.append(instruction)
+            elif method_name.startswith('_set_object_') or method_name.startswith('create_object') or method_name.startswith('destroy_object') or method_name in ('acquire_object', 'release_object'):
+                object_commands.append(instruction)
+            elif method_name.startswith('_add_component') or method_name.startswith('_remove_component'):
+                component_commands.append(instruction)
+            else:
+                other_commands.append(instruction)
+        
+        # Execute all commands simultaneously
+        all_commands = camera_commands + object_commands + component_commands + other_commands
+        
+        for i, instruction in enumerate(all_commands):
+            try:
+                self._execute_instruction(instruction)
+                log.debug("Executed command %s/%s: %s", i+1, len(all_commands), instruction['method'])
+            except Exception as e:
+                log.error("Error executing command %s: %s", i+1, e)
+        
+        log.info("All %s commands executed in parallel", len(all_commands))
+    
+    def _override_all_methods(self):
+        """Override all SkyEngine methods to check capture mode"""
+        # Get all methods from SkyEngine; properties are skipped unevaluated so lazy subsystems stay unloaded
+        for method_name in dir(self.sky_engine):
+            if method_name.startswith('_') or isinstance(inspect.getattr_static(self.sky_engine, method_name), property):
+                continue
+            if callable(getattr(self.sky_engine, method_name)):
+                original_method = getattr(self.sky_engine, method_name)
+                self._original_methods[method_name] = original_method
+                
+                # Create wrapped method
+                def create_wrapped_method(original_method, method_name):
+                    def wrapped_method(*args, **kwargs):
+                        if self.is_recording:
+                            # Record the command
+                            self._record_instruction(method_name, *args, **kwargs)
+                            log.debug("Recorded: %s(%s, %s)", method_name, args, kwargs)
+                            
+                            # Spawning methods still need to return their objects
+                            if method_name in _SPAWNING_METHODS:
+                                result = original_method(*args, **kwargs)
+                                # Wrap the returned objects so their methods are also intercepted
+                                if isinstance(result, list):
+                                    return [self._wrap_spawned(obj) for obj in result]
+                                return self._wrap_spawned(result)
+                        else:
+                            # Execute the command
+                            return original_method(*args, **kwargs)
+                    return wrapped_method
+                
+                setattr(self.sky_engine, method_name, create_wrapped_method(original_method, method_name))
+    
+    def _wrap_spawned(self, obj):
+        """Wrap an object created while recording and remember the wrapper"""
+        wrapped_obj = self._wrap_game_object(obj)
+        self._wrapped_objects[id(obj)] = wrapped_obj
+        return wrapped_obj
+    
+    def _restore_all_methods(self):
+        """Restore all original SkyEngine methods"""
+        for method_name, original_method in self._original_methods.items():
+            setattr(self.sky_engine, method_name, original_method)
+        self._original_methods = {}
+    
+    def _record_instruction(self, method_name: str, *args, **kwargs):
+        """Record an instruction for later execution"""
+        if self.is_recording:
+            instruction = {
+                'method': method_name,
+                'args': args,
+                'kwargs': kwargs
+            }
+            self.instructions.append(instruction)
+    
+    def _execute_instruction(self, instruction):
+        """Execute a single recorded instruction"""
+        method_name = instruction['method']
+        args = instruction.get('args', [])
+        kwargs = instruction.get('kwargs', {})
+        
+        if hasattr(self.sky_engine, method_name):
+            method = getattr(self.sky_engine, method_name)
+            method(*args, **kwargs)
+        else:
+            log.warning("Method %s not found on SkyEngine", method_name)
+    
+    def _wrap_game_object(self, obj):
+        """Wrap a GameObject to record its operations"""
+        class WrappedGameObject:
+            def __init__(self, capture_instance, original_obj):
+                self.capture = capture_instance
+                self.obj = original_obj
+                self.name = original_obj.name
+                self.components = original_obj.components
+                self.children = original_obj.children
+                self.parent = original_obj.parent
+                self.position = original_obj.position
+                self.rotation = original_obj.rotation
+                self.scale = original_obj.scale
+                self.local_position = original_obj.local_position
+                self.local_rotation = original_obj.local_rotation
+                self.local_scale = original_obj.local_scale
+            
+            def set_position(self, position: Vec):
+                """Record position change instead of executing it"""
+                if self.capture.is_recording:
+                    self.capture._record_instruction('_set_object_position', id(self.obj), position)
+                    log.debug("Recorded: %s.set_position(%s)", self.obj.name, position)
+                else:
+                    self.obj.set_position(position)
+            
+            def set_rotation(self, rotation: Vec):
+                """Record rotation change instead of executing it"""
+                if self.capture.is_recording:
+                    self.capture._record_instruction('_set_object_rotation', id(self.obj), rotation)
+                    log.debug("Recorded: %s.set_rotation(%s)", self.obj.name, rotation)
+                else:
+                    self.obj.set_rotation(rotation)
+            
+            def set_scale(self, scale: Vec):
+                """Record scale change instead of executing it"""
+                if self.capture.is_recording:
+                    self.capture._record_instruction('_set_object_scale', id(self.obj), scale)
+                    log.debug("Recorded: %s.set_scale(%s)", self.obj.name, scale)
+                else:
+                    self.obj.set_scale(scale)
+            
+            def add_component(self, component):
+                """Record component addition instead of executing it"""
+                if self.capture.is_recording:
+                    self.capture._record_instruction('_add_component', id(self.obj), component.name, component.__class__.__name__)
+                    log.debug("Recorded: %s.add_component(%s)", self.obj.name, component.name)
+                else:
+                    self.obj.add_component(component)
+            
+            def get_component(self, component_name: str):
+                """Pass through to original object"""
+                return self.obj.get_component(component_name)
+            
+            def update(self, delta_time: float):
+                """Pass through to original object"""
+                self.obj.update(delta_time)
+        
+        return WrappedGameObject(self, obj)
+    
+    # Utility methods
+    def get_instructions_count(self) -> int:
+        """Get the number of recorded instructions"""
+        return len(self.instructions)
+    
+    def clear_instructions(self):
+        """Clear all recorded instructions"""
+        self.instructions = []
+        log.info("All recorded instructions cleared")
+    
+    def get_instructions(self) -> list:
+        """Get all recorded instructions"""
+        return self.instructions.copy()
+    
+    def save_instructions(self, filename: str):
+        """Save recorded instructions to a file"""
+        import json
+        try:
+            with open(filename, 'w') as f:
+                json.dump(self.instructions, f, indent=2, default=str)
+            log.info("Instructions saved to %s", filename)
+        except Exception as e:
+            log.error("Error saving instructions: %s", e)
+    
+    def load_instructions(self, filename: str):
+        """Load instructions from a file"""
+        import json
+        try:
+            with open(filename, 'r') as f:
+                self.instructions = json.load(f)
+            log.info("Instructions loaded from %s", filename)
+        except Exception as e:
+            log.error("Error loading instructions: %s", e)
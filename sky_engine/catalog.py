@@ -0,0 +1,142 @@
+"""Cached name catalogs over skyExplorer enums"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ._backend import Asteroid, Comet, Constellation, Galaxy, IndividualStar, Nebula, Planet, Satellite, Stars
+from .logs import log
+
+# Extra names accepted for enum members, by enum type name then member name
+DEFAULT_ALIASES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    'ConstellationName': {
+        'And': ('Andromeda',), 'Ant': ('Antlia',), 'Aps': ('Apus',), 'Aqr': ('Aquarius',),
+        'Aql': ('Aquila',), 'Ara': ('Ara',), 'Ari': ('Aries',), 'Aur': ('Auriga',),
+        'Boo': ('Bootes',), 'Cae': ('Caelum',), 'Cam': ('Camelopardalis',), 'Cnc': ('Cancer',),
+        'CVn': ('Canes Venatici',), 'CMa': ('Canis Major',), 'CMi': ('Canis Minor',),
+        'Cap': ('Capricornus',), 'Car': ('Carina',), 'Cas': ('Cassiopeia',), 'Cen': ('Centaurus',),
+        'Cep': ('Cepheus',), 'Cet': ('Cetus',), 'Cha': ('Chamaeleon',), 'Cir': ('Circinus',),
+        'Col': ('Columba',), 'Com': ('Coma Berenices',), 'CrA': ('Corona Australis',),
+        'CrB': ('Corona Borealis',), 'Crv': ('Corvus',), 'Crt': ('Crater',), 'Cru': ('Crux', 'Southern Cross'),
+        'Cyg': ('Cygnus',), 'Del': ('Delphinus',), 'Dor': ('Dorado',), 'Dra': ('Draco',),
+        'Equ': ('Equuleus',), 'Eri': ('Eridanus',), 'For': ('Fornax',), 'Gem': ('Gemini',),
+        'Gru': ('Grus',), 'Her': ('Hercules',), 'Hor': ('Horologium',), 'Hya': ('Hydra',),
+        'Hyi': ('Hydrus',), 'Ind': ('Indus',), 'Lac': ('Lacerta',), 'Leo': ('Leo',),
+        'LMi': ('Leo Minor',), 'Lep': ('Lepus',), 'Lib': ('Libra',), 'Lup': ('Lupus',), 'Lyn': ('Lynx',),
+        'Lyr': ('Lyra',), 'Men': ('Mensa',), 'Mic': ('Microscopium',), 'Mon': ('Monoceros',),
+        'Mus': ('Musca',), 'Nor': ('Norma',), 'Oct': ('Octans',), 'Oph': ('Ophiuchus',), 'Ori': ('Orion',),
+        'Pav': ('Pavo',), 'Peg': ('Pegasus',), 'Per': ('Perseus',), 'Phe': ('Phoenix',), 'Pic': ('Pictor',),
+        'Psc': ('Pisces',), 'PsA': ('Piscis Austrinus',), 'Pup': ('Puppis',), 'Pyx': ('Pyxis',),
+        'Ret': ('Reticulum',), 'Sge': ('Sagitta',), 'Sgr': ('Sagittarius',), 'Sco': ('Scorpius',),
+        'Scl': ('Sculptor',), 'Sct': ('Scutum',), 'Ser': ('Serpens',), 'Sex': ('Sextans',),
+        'Tau': ('Taurus',), 'Tel': ('Telescopium',), 'Tri': ('Triangulum',), 'TrA': ('Triangulum Australe',),
+        'Tuc': ('Tucana',), 'UMa': ('Ursa Major', 'Big Dipper'), 'UMi': ('Ursa Minor', 'Little Dipper'),
+        'Vel': ('Vela',), 'Vir': ('Virgo',), 'Vol': ('Volans',), 'Vul': ('Vulpecula',),
+    },
+    'GalaxyName': {
+        'And': ('Andromeda', 'M31'), 'LMC': ('Large Magellanic Cloud',), 'SMC': ('Small Magellanic Cloud',),
+        'SgrDSph': ('Sagittarius Dwarf',), 'CenA': ('Centaurus A',),
+    },
+}
+
+def _normalize(name: str) -> str:
+    """Lookup key for a name: case-folded, without spaces, underscores, hyphens or apostrophes"""
+    return name.casefold().replace(' ', '').replace('_', '').replace('-', '').replace("'", '')
+
+def _is_sentinel(name: str) -> bool:
+    """skyExplorer enums open with Invalid<Name> and close with <Name>Count"""
+    return name.startswith('Invalid') or name.endswith('Count')
+
+class EnumCatalog:
+    """Members of one skyExplorer enum with O(1) lookup by name or alias.
+
+    Built once per enum type (see get_catalog). Lookups ignore case,
+    spaces, underscores and hyphens, so "ursa major", "UMa" and "uma" all
+    resolve; the Invalid/Count sentinels are left out.
+    """
+
+    def __init__(self, enum_type: type, aliases: Dict[str, Tuple[str, ...]] = None):
+        self.enum_type = enum_type
+        self.members: Tuple[Any, ...] = tuple(
+            member for member in self._enum_members(enum_type) if not _is_sentinel(member.name))
+        self._by_key: Dict[str, Any] = {}
+        for member in self.members:
+            self._by_key.setdefault(_normalize(member.name), member)
+        for member_name, names in (aliases or {}).items():
+            member = self._by_key.get(_normalize(member_name))
+            if member is not None:
+                for alias in names:
+                    self._by_key.setdefault(_normalize(alias), member)
+
+    @staticmethod
+    def _enum_members(enum_type: type) -> List[Any]:
+        # Boost.Python enums are not iterable but expose a value -> member map
+        values = getattr(enum_type, 'values', None)
+        if isinstance(values, dict):
+            return [values[value] for value in sorted(values)]
+        return list(enum_type)
+
+    def resolve(self, name: Any) -> Any:
+        """Member for a name, alias or member (returned as is); ValueError if unknown"""
+        if not isinstance(name, str):
+            return name
+        member = self._by_key.get(_normalize(name))
+        if member is None:
+            raise ValueError(f"Unknown {self.enum_type.__name__} '{name}'")
+        return member
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Member for a name or alias, or default"""
+        return self._by_key.get(_normalize(name), default)
+
+    def add_alias(self, alias: str, name: Any):
+        """Accept alias for the member that name resolves to"""
+        self._by_key[_normalize(alias)] = self.resolve(name)
+
+    def names(self) -> List[str]:
+        """Member names in enum order"""
+        return [member.name for member in self.members]
+
+    @property
+    def first(self) -> Optional[Any]:
+        """First real member, or None if the enum has none"""
+        return self.members[0] if self.members else None
+
+    def __contains__(self, name: Any) -> bool:
+        if isinstance(name, str):
+            return _normalize(name) in self._by_key
+        return name in self.members
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __repr__(self) -> str:
+        return f"EnumCatalog({self.enum_type.__name__}, {len(self.members)} members)"
+
+# enum type -> its catalog, built on first use
+_catalogs: Dict[type, EnumCatalog] = {}
+
+def get_catalog(enum_type: type) -> EnumCatalog:
+    """Cached catalog of a skyExplorer enum type, e.g. get_catalog(Planet.PlanetName)"""
+    catalog = _catalogs.get(enum_type)
+    if catalog is None:
+        catalog = _catalogs[enum_type] = EnumCatalog(enum_type, DEFAULT_ALIASES.get(enum_type.__name__))
+        log.debug("Built %r", catalog)
+    return catalog
+
+def resolve_enum(enum_type: type, name: Any) -> Any:
+    """Member of enum_type for a name, alias or member (members pass through)"""
+    if not isinstance(name, str):
+        return name
+    return get_catalog(enum_type).resolve(name)
+
+def engine_enums() -> Dict[str, type]:
+    """Enum types the engine resolves names for, keyed by enum type name"""
+    return {enum_type.__name__: enum_type for enum_type in (
+        Planet.PlanetName, Constellation.ConstellationName, Stars.StarsName, Comet.CometName,
+        Asteroid.AsteroidName, Satellite.SatelliteName, Galaxy.GalaxyName, Nebula.NebulaName,
+        IndividualStar.IndividualStarName)}
+
+def build_catalogs() -> Dict[str, EnumCatalog]:
+    """Build (or fetch) the catalog of every enum in engine_enums()"""
+    return {name: get_catalog(enum_type) for name, enum_type in engine_enums().items()}
@@ -0,0 +1,325 @@
+"""Component base class and declarative backend properties"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from ._backend import Vec, Vec4
+from .bridge import BridgeProxy, sky_method
+
+if TYPE_CHECKING:
+    from .engine import CommandQueue
+
+def _sent_value_key(value: Any) -> Any:
+    """Comparable snapshot of a value sent to skyExplorer.
+    
+    Vec and Vec4 are mutable wrappers without value equality, so they are
+    recorded by their components; everything else is compared as is.
+    """
+    if hasattr(value, 'x') and hasattr(value, 'y') and hasattr(value, 'z'):
+        return (type(value).__name__, value.x, value.y, value.z, getattr(value, 'w', None))
+    return value
+
+# Spellings accepted for bool properties given as strings, e.g. from JSON presets
+_BOOL_STRINGS = {'true': True, '1': True, 'yes': True, 'on': True,
+                 'false': False, '0': False, 'no': False, 'off': False}
+
+def _parse_bool(value: Any) -> bool:
+    """bool for a number or a true/false spelling; ValueError for anything else"""
+    if isinstance(value, str):
+        parsed = _BOOL_STRINGS.get(value.strip().lower())
+        if parsed is None:
+            raise ValueError(f"Cannot interpret {value!r} as a bool")
+        return parsed
+    if isinstance(value, (int, float)):
+        return bool(value)
+    raise ValueError(f"Cannot interpret {value!r} as a bool")
+
+class SkyProperty:
+    """Declares a component property that is mirrored to a skyExplorer setter.
+    
+    Declared as a class attribute, e.g.
+    
+        tree_density = SkyProperty('setTreeDensity', float, 1.0)
+    
+    the property gets its default on every instance, a generated
+    set_tree_density() (unless the class defines its own), and takes part in
+    _apply_all_properties(), configure(), snapshot() and restore(). The
+    default may be a zero-argument callable for mutable values such as Vec.
+    None values are stored but never sent.
+    """
+    
+    def __init__(self, backend_method: str, type: type = object, default: Any = None, doc: str = None):
+        self.backend_method = backend_method
+        self.type = type
+        self.default = default
+        self.doc = doc
+        self.name = None
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.name, self.make_default())
+    
+    def make_default(self) -> Any:
+        return self.default() if callable(self.default) else self.default
+    
+    def coerce(self, value: Any) -> Any:
+        """Convert value to the declared type where the conversion is unambiguous"""
+        kind = self.type
+        if value is None or kind is object or isinstance(value, kind):
+            return value
+        if kind is bool:
+            return _parse_bool(value)
+        if kind in (float, int, str):
+            return kind(value)
+        if kind in (Vec, Vec4) and isinstance(value, (list, tuple)):
+            if kind is Vec4 and len(value) == 3:
+                value = (*value, 1.0)
+            return kind(*value)
+        return value
+    
+    def make_setter(self) -> Callable:
+        name, backend_method, coerce = self.name, self.backend_method, self.coerce
+        
+        def setter(component, value):
+            value = coerce(value)
+            component.__dict__[name] = value
+            if value is not None:
+                component._send(backend_method, value)
+            return component
+        
+        setter.__name__ = setter.__qualname__ = f"set_{name}"
+        setter.__doc__ = self.doc or f"Set {name.replace('_', ' ')}"
+        return setter
+
+def _copy_sent_value(value: Any) -> Any:
+    """Independent copy of a Vec/Vec4 (other values are returned as is)"""
+    if hasattr(value, 'x') and hasattr(value, 'y') and hasattr(value, 'z'):
+        if hasattr(value, 'w'):
+            return type(value)(value.x, value.y, value.z, value.w)
+        return type(value)(value.x, value.y, value.z)
+    return value
+
+# (component class, sky object class) -> (attribute, setter, unbound method) for each declared property
+_property_plans: Dict[Tuple[type, type], Tuple[Tuple[str, str, Callable], ...]] = {}
+
+def _property_plan(component_class: type, sky_class: type) -> Tuple[Tuple[str, str, Callable], ...]:
+    """Declared properties of a component class that its sky object class can receive, resolved once"""
+    plan = _property_plans.get((component_class, sky_class))
+    if plan is None:
+        plan = []
+        for attribute, sky_property in component_class.sky_properties.items():
+            method = getattr(sky_class, sky_property.backend_method, None)
+            if callable(method):
+                plan.append((attribute, sky_property.backend_method, method))
+        plan = _property_plans[(component_class, sky_class)] = tuple(plan)
+    return plan
+
+class Component:
+    
+    # Declared SkyProperty objects by name, collected per subclass
+    sky_properties: Dict[str, SkyProperty] = {}
+    
+    # Declared defaults, split into shared values and per-instance factories
+    _plain_defaults: Dict[str, Any] = {}
+    _default_factories: Tuple[Tuple[str, Callable[[], Any]], ...] = ()
+    
+    # Undeclared attributes with a one-argument set_<name> method; snapshot()
+    # keeps the plain ones and pool reuse sends their defaults back
+    setter_attributes: Tuple[str, ...] = ()
+    
+    # Scheduler phase this component's update() runs in (see UPDATE_PHASES)
+    update_phase = 'transform'
+    
+    # Dimmed by FrustumCuller while its object is outside the camera view
+    cullable = False
+    
+    # Backend object built by _create_sky_object() on first attach to an
+    # engine-owned object or first show, instead of in __init__
+    lazy_backend = False
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        properties = dict(cls.sky_properties)
+        for attribute, value in list(vars(cls).items()):
+            if isinstance(value, SkyProperty):
+                properties[attribute] = value
+                if f"set_{attribute}" not in vars(cls):
+                    setattr(cls, f"set_{attribute}", value.make_setter())
+        cls.sky_properties = properties
+        cls._plain_defaults = {attribute: sky_property.default for attribute, sky_property in properties.items()
+                               if not callable(sky_property.default)}
+        cls._default_factories = tuple((attribute, sky_property.default) for attribute, sky_property in properties.items()
+                                       if callable(sky_property.default))
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.enabled = True
+        self.sky_object = None
+        state = self.__dict__
+        state.update(self._plain_defaults)
+        for attribute, factory in self._default_factories:
+            state[attribute] = factory()
+        
+        # Setter name -> key of the arguments last sent to _sent_object
+        self._sent: Dict[str, Any] = {}
+        self._sent_object = None
+        
+        # Setter -> function mapping the authored value to the one actually sent
+        # (engine-side adjustments such as view culling)
+        self._send_overrides: Dict[str, Callable[[Any], Any]] = {}
+        
+        # Engine command queue, set once the component's object joins a scene
+        self._queue: Optional['CommandQueue'] = None
+        
+        # Backend calls made before a lazy sky object exists, replayed on creation
+        self._pending_backend_calls: Dict[Tuple[bool, str], tuple] = {}
+    
+    def _send(self, setter: str, *args) -> bool:
+        """Call a sky object setter unless the same arguments were the last ones sent through it"""
+        sky_object = self.sky_object
+        if not sky_object:
+            return False
+        if sky_object is not self._sent_object:
+            self._sent.clear()
+            self._sent_object = sky_object
+        if self._send_overrides:
+            override = self._send_overrides.get(setter)
+            if override is not None:
+                args = (override(*args),)
+        key = tuple(_sent_value_key(arg) for arg in args)
+        if self._sent.get(setter) == key:
+            return False
+        method = sky_method(sky_object, setter)
+        if method is None:
+            return False
+        queue = self._queue
+        if queue is not None and queue.enabled:
+            queue.put(sky_object, setter, args, self)
+        else:
+            method(sky_object, *args)
+        self._sent[setter] = key
+        return True
+    
+    def _override_send(self, setter: str, override: Optional[Callable[[Any], Any]], value: Any):
+        """Map what setter sends (None removes the mapping), then send value through it.
+        
+        The component's attributes keep their authored values; later set_*
+        calls go through the same mapping until it is removed.
+        """
+        if override is None:
+            self._send_overrides.pop(setter, None)
+        else:
+            self._send_overrides[setter] = override
+        if value is not None:
+            self._send(setter, value)
+    
+    def invalidate_cache(self):
+        """Forget the values last sent, so the next set_* calls reach skyExplorer again"""
+        self._sent.clear()
+    
+    def _apply_all_properties(self):
+        """Send every declared property to the sky object"""
+        sky_object = self.sky_object
+        if not sky_object:
+            return
+        queue = self._queue
+        fresh = sky_object is not self._sent_object or not self._sent
+        if fresh and not self._send_overrides and (queue is None or not queue.enabled) \
+                and type(sky_object) is not BridgeProxy:
+            # Nothing sent to this object yet: call the per-class resolved setters directly
+            state = self.__dict__
+            sent = self._sent = {}
+            self._sent_object = sky_object
+            for attribute, setter, method in _property_plan(type(self), type(sky_object)):
+                value = state[attribute]
+                if value is not None:
+                    method(sky_object, value)
+                    sent[setter] = (_sent_value_key(value),)
+            return
+        state = self.__dict__
+        for attribute, sky_property in self.sky_properties.items():
+            value = state[attribute]
+            if value is not None:
+                self._send(sky_property.backend_method, value)
+    
+    def configure(self, **properties):
+        """Set several declared properties at once, sending only what changed"""
+        declared = self.sky_properties
+        state = self.__dict__
+        for attribute, value in properties.items():
+            sky_property = declared.get(attribute)
+            if sky_property is None:
+                raise AttributeError(f"{type(self).__name__} has no property '{attribute}'")
+            value = sky_property.coerce(value)
+            state[attribute] = value
+            if value is not None:
+                self._send(sky_property.backend_method, value)
+        return self
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of every declared property value, plus the plain setter_attributes values"""
+        state = self.__dict__
+        values = {attribute: _copy_sent_value(state[attribute]) for attribute in self.sky_properties}
+        for attribute in self.setter_attributes:
+            value = getattr(self, attribute, None)
+            if isinstance(value, (int, float, str, bool)):
+                values[attribute] = value
+        return values
+    
+    def restore(self, snapshot: Dict[str, Any]):
+        """Return the component to the values of a snapshot()"""
+        declared = self.sky_properties
+        self.configure(**{attribute: _copy_sent_value(value)
+                          for attribute, value in snapshot.items() if attribute in declared})
+        for attribute, value in snapshot.items():
+            if attribute not in declared:
+                getattr(self, f"set_{attribute}")(value)
+        return self
+        
+    def initialize(self, sky_engine):
+        """Called on attach; lazy components create their backend unless the engine defers it"""
+        if self.lazy_backend and sky_engine is not None and not sky_engine.defer_backends:
+            self.ensure_sky_object()
+    
+    def _create_sky_object(self):
+        """Construct the skyExplorer object of a lazy component"""
+        return None
+    
+    def ensure_sky_object(self):
+        """Create a lazy component's backend object now if it does not exist yet"""
+        if self.sky_object is None and self.lazy_backend:
+            self.sky_object = self._create_sky_object()
+            if self.sky_object is not None:
+                self._apply_all_properties()
+                pending, self._pending_backend_calls = self._pending_backend_calls, {}
+                for (is_attribute, name), args in pending.items():
+                    if is_attribute:
+                        setattr(self.sky_object, name, *args)
+                    else:
+                        getattr(self.sky_object, name)(*args)
+        return self.sky_object
+    
+    def _backend_call(self, method: str, *args):
+        """Call a sky object method, or keep the latest arguments until the object is created"""
+        if self.sky_object:
+            getattr(self.sky_object, method)(*args)
+        elif self.lazy_backend:
+            self._pending_backend_calls[(False, method)] = args
+    
+    def _backend_set(self, attribute: str, value: Any):
+        """Assign a sky object attribute, or keep the value until the object is created"""
+        if self.sky_object:
+            setattr(self.sky_object, attribute, value)
+        elif self.lazy_backend:
+            self._pending_backend_calls[(True, attribute)] = (value,)
+        
+    def update(self, delta_time: float):
+        pass
+        
+    def start(self):
+        pass
+        
+    def stop(self):
+        pass
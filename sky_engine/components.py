@@ -0,0 +1,619 @@
+"""Components for planets, constellations, the sun, text and small bodies"""
+from ._backend import *
+from ._backend import Vec4
+from .catalog import get_catalog, resolve_enum
+from .component import Component, SkyProperty
+from .logs import log
+
+class PlanetComponent(Component):
+    
+    cullable = True
+    
+    setter_attributes = ('intensity',)
+    
+    clouds_intensity = SkyProperty('setCloudsIntensity', float, 0.0)
+    cloud_speed = SkyProperty('setCloudSpeed', float, 1.0)
+    cloud_direction = SkyProperty('setCloudDirection', float, 0.0)
+    cloud_thickness = SkyProperty('setCloudThickness', float, 0.5)
+    cloud_raininess = SkyProperty('setCloudRaininess', float, 0.0)
+    
+    scattering_intensity = SkyProperty('setScatteringIntensity', float, 0.0)
+    water_specular_intensity = SkyProperty('setWaterSpecularIntensity', float, 0.0)
+    water_specular_shininess = SkyProperty('setWaterSpecularShininess', float, 32.0)
+    
+    terrain_intensity = SkyProperty('setTerrainIntensity', float, 0.0)
+    terrain_model = SkyProperty('setTerrainModel', Planet.TerrainModel, Planet.TerrainModel.DefaultTerrain)
+    terrain_rendering_mode = SkyProperty('setTerrainRenderingMode', str, "TOPOGRAPHY")
+    elevation_scale = SkyProperty('setElevationScale', float, 1.0)
+    
+    equatorial_grid_intensity = SkyProperty('setEquatorialGridIntensity', float, 0.0)
+    ecliptic_grid_intensity = SkyProperty('setEclipticGridIntensity', float, 0.0)
+    galactic_grid_intensity = SkyProperty('setGalacticGridIntensity', float, 0.0)
+    supergalactic_grid_intensity = SkyProperty('setSupergalacticGridIntensity', float, 0.0)
+    
+    shadow_strength = SkyProperty('setShadowStrength', float, 0.0)
+    shadow_contrast = SkyProperty('setShadowContrast', float, 0.0, "Set shadow contrast (0-1)")
+    
+    sea_level = SkyProperty('setSeaLevel', float, 0.0, "Set sea level in meters")
+    sea_level_rendering_mode = SkyProperty('setSeaLevelRenderingMode', str, "NONE", "Set sea level rendering mode. Valid values: 'NONE', possibly others.")
+    
+    tree_intensity = SkyProperty('setTreeIntensity', float, 0.0, "Set tree intensity (0-1)")
+    tree_density = SkyProperty('setTreeDensity', float, 1.0, "Set tree density")
+    tree_max_distance = SkyProperty('setTreeMaxDistance', float, 1000.0, "Set tree fade out distance")
+    
+    live_patch_intensity = SkyProperty('setLivePatchIntensity', float, 0.0, "Set live patch intensity (0-1)")
+    live_patch_texture = SkyProperty('setLivePatchTexture', str, "", "Set live patch texture")
+    live_patch_bottom_left = SkyProperty('setLivePatchBottomLeft', Vec, lambda: Vec(0, 0, 0))
+    live_patch_top_right = SkyProperty('setLivePatchTopRight', Vec, lambda: Vec(1, 1, 1))
+    live_patch_rotation = SkyProperty('setLivePatchRotation', float, 0.0, "Set live patch rotation in degrees")
+    live_patch_gamma = SkyProperty('setLivePatchGamma', Vec, lambda: Vec(1, 1, 1), "Set live patch gamma correction (Vec)")
+    live_patch_hsv = SkyProperty('setLivePatchHsv', Vec, lambda: Vec(1, 1, 1), "Set live patch HSV values")
+    live_patch_vibrance = SkyProperty('setLivePatchVibrance', float, 1.0, "Set live patch vibrance")
+    live_patch_key_color = SkyProperty('setLivePatchKeyColor', Vec4, lambda: Vec4(1, 1, 1, 0.1), "Set live patch key color (Vec4: RGB + tolerance)")
+    
+    # Applied only once set
+    label_color = SkyProperty('setLabelColor', Vec4, None)
+    label_intensity = SkyProperty('setLabelIntensity', float, None, "Set planet label visibility (0=off, 1=full)")
+    atmosphere_intensity = SkyProperty('setAtmosphereIntensity', float, None, "Set atmosphere visibility (0=off, 1=full)")
+    night_lights_intensity = SkyProperty('setNightLightsIntensity', float, None, "Set city lights visibility (0=off, 1=full)")
+    orbit_intensity = SkyProperty('setOrbitIntensity', float, None, "Set orbit line visibility (0=off, 1=full)")
+    pointer_intensity = SkyProperty('setPointerIntensity', float, None, "Set planet pointer visibility (0=off, 1=full)")
+    rainbow_intensity = SkyProperty('setRainbowIntensity', float, None, "Set rainbow visibility (0=off, 1=full)")
+    aurora_intensity = SkyProperty('setAuroraIntensity', float, None, "Set aurora visibility (0=off, 1=full)")
+    magnetosphere_intensity = SkyProperty('setMagnetosphereIntensity', float, None, "Set magnetosphere visibility (0=off, 1=full)")
+    
+    def __init__(self, planet_name: Planet.PlanetName):
+        super().__init__("Planet")
+        self.planet_name = resolve_enum(Planet.PlanetName, planet_name)
+        self.sky_object = None
+        self.intensity = 1.0
+    
+    def initialize(self, sky_engine):
+        self.sky_object = Planet(self.planet_name)
+
+        self._apply_all_properties()
+    
+    def set_intensity(self, intensity: float):
+        self.intensity = intensity
+        self._send('setIntensity', intensity)
+        return self
+    
+    def set_scale(self, scale: float):
+    
+        self._send('setScale', scale)
+    
+
+    def set_live_patch_bounds(self, bottom_left: Vec, top_right: Vec):
+        """Set live patch bounds in LBR coordinates"""
+        self.live_patch_bottom_left = bottom_left
+        self.live_patch_top_right = top_right
+        self._send('setLivePatchBottomLeft', bottom_left)
+        self._send('setLivePatchTopRight', top_right)
+    
+    # === ADDITIONAL APPEARANCE METHODS ===
+    
+    def set_label_color(self, red: float, green: float, blue: float, alpha: float = 1.0):
+        """Set planet label color (RGBA values 0-1)"""
+        self.label_color = Vec4(red, green, blue, alpha)
+        self._send('setLabelColor', self.label_color)
+    
+class ConstellationComponent(Component):
+    """Component for constellations with full control over lines, art, and labels"""
+    
+    lines_intensity = SkyProperty('setLinesIntensity', float, 1.0)
+    art_intensity = SkyProperty('setArtIntensity', float, 0.5)
+    label_intensity = SkyProperty('setLabelIntensity', float, 1.0)
+    boundary_intensity = SkyProperty('setBoundaryIntensity', float, 0.0, "Set constellation boundary intensity (0=off, 1=full)")
+    pointer_intensity = SkyProperty('setPointerIntensity', float, 0.0, "Set constellation pointer intensity (0=off, 1=full)")
+    trajectory_intensity = SkyProperty('setTrajectoryIntensity', float, 0.0)
+    
+    lazy_backend = True
+    
+    def __init__(self, constellation_enum: Constellation.ConstellationName = Constellation.ConstellationName.UMa):
+        super().__init__("Constellation")
+        self.constellation_enum = resolve_enum(Constellation.ConstellationName, constellation_enum)
+    
+    def _create_sky_object(self):
+        return Constellation(self.constellation_enum)
+        
+    def set_lines_intensity(self, intensity: float):
+        """Set constellation lines intensity (0=off, 1=full)"""
+        self.lines_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setLinesIntensity', intensity)
+        log.debug("Constellation %s lines intensity: %s", self.constellation_enum, intensity)
+        return self
+            
+    def set_art_intensity(self, intensity: float):
+        """Set constellation art/drawings intensity (0=off, 1=full)"""
+        self.art_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setArtIntensity', intensity)
+        log.debug("Constellation %s art intensity: %s", self.constellation_enum, intensity)
+        return self
+            
+    def set_label_intensity(self, intensity: float):
+        """Set constellation label intensity (0=off, 1=full)"""
+        self.label_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setLabelIntensity', intensity)
+        log.debug("Constellation %s label intensity: %s", self.constellation_enum, intensity)
+        return self
+    
+    def set_boundary_intensity(self, intensity: float):
+        """Set constellation boundary intensity (0=off, 1=full)"""
+        self.boundary_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setBoundaryIntensity', intensity)
+        log.debug("Constellation %s boundary intensity: %s", self.constellation_enum, intensity)
+        return self
+    
+    def set_pointer_intensity(self, intensity: float):
+        """Set constellation pointer intensity (0=off, 1=full)"""
+        self.pointer_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setPointerIntensity', intensity)
+        log.debug("Constellation %s pointer intensity: %s", self.constellation_enum, intensity)
+        return self
+    
+    def set_trajectory_intensity(self, intensity: float):
+        """Set constellation trajectory intensity (0=off, 1=full)"""
+        self.trajectory_intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._send('setTrajectoryIntensity', intensity)
+        log.debug("Constellation %s trajectory intensity: %s", self.constellation_enum, intensity)
+        return self
+    
+    # Convenience methods for turning features on/off
+    def turn_lines_on(self):
+        """Turn on constellation lines"""
+        return self.set_lines_intensity(1.0)
+    
+    def turn_lines_off(self):
+        """Turn off constellation lines"""
+        return self.set_lines_intensity(0.0)
+    
+    def turn_art_on(self):
+        """Turn on constellation art/drawings"""
+        return self.set_art_intensity(1.0)
+    
+    def turn_art_off(self):
+        """Turn off constellation art/drawings"""
+        return self.set_art_intensity(0.0)
+    
+    def turn_labels_on(self):
+        """Turn on constellation labels"""
+        return self.set_label_intensity(1.0)
+    
+    def turn_labels_off(self):
+        """Turn off constellation labels"""
+        return self.set_label_intensity(0.0)
+    
+    def turn_boundaries_on(self):
+        """Turn on constellation boundaries"""
+        return self.set_boundary_intensity(1.0)
+    
+    def turn_boundaries_off(self):
+        """Turn off constellation boundaries"""
+        return self.set_boundary_intensity(0.0)
+    
+    def turn_all_on(self):
+        """Turn on all constellation features"""
+        self.turn_lines_on()
+        self.turn_art_on()
+        self.turn_labels_on()
+        return self
+    
+    def turn_all_off(self):
+        """Turn off all constellation features"""
+        self.turn_lines_off()
+        self.turn_art_off()
+        self.turn_labels_off()
+        return self
+    
+    def set_all_intensities(self, lines: float = None, art: float = None, labels: float = None, boundaries: float = None):
+        """Set multiple intensities at once"""
+        if lines is not None:
+            self.set_lines_intensity(lines)
+        if art is not None:
+            self.set_art_intensity(art)
+        if labels is not None:
+            self.set_label_intensity(labels)
+        if boundaries is not None:
+            self.set_boundary_intensity(boundaries)
+        return self
+
+class SunComponent(Component):
+    """Component for the Sun with advanced features"""
+    
+    corona_intensity = SkyProperty('setCoronaIntensity', float, 0.0, "Set corona intensity (0-1)")
+    photosphere_intensity = SkyProperty('setPhotosphereIntensity', float, 0.0, "Set photosphere intensity (0-1)")
+    
+    magnetic_lines_intensity = SkyProperty('setMagneticLinesIntensity', float, 0.0, "Set magnetic lines intensity (0-1)")
+    magnetogram_intensity = SkyProperty('setMagnetogramIntensity', float, 0.0, "Set magnetogram intensity (0-1)")
+    
+    habitable_zone_intensity = SkyProperty('setHabitableZoneIntensity', float, 0.0, "Set habitable zone intensity (0-1)")
+    habitable_zone_color = SkyProperty('setHabitableZoneColor', Vec, lambda: Vec(1, 1, 1), "Set habitable zone color")
+    
+    galactic_band_intensity = SkyProperty('setGalacticBandIntensity', float, 0.0, "Set galactic band intensity (0-1)")
+    galactic_grid_intensity = SkyProperty('setGalacticGridIntensity', float, 0.0)
+    galactic_mark_line_intensity = SkyProperty('setGalacticMarkLineIntensity', float, 0.0, "Set galactic mark line intensity (0-1)")
+    
+    zodiacal_light_intensity = SkyProperty('setZodiacalLightIntensity', float, 0.0, "Set zodiacal light intensity (0-1)")
+    zodiacal_light_scattering_intensity = SkyProperty('setZodiacalLightScatteringIntensity', float, 0.0, "Set zodiacal light scattering intensity (0-1)")
+    
+    cycle = SkyProperty('setCycle', object, None, "Set cycle")
+    filter = SkyProperty('setFilter', object, None, "Set filter")
+    
+    model = SkyProperty('setModel', object, None, "Set model")
+    internal_representation = SkyProperty('setInternalRepresentation', object, None, "Set internal representation")
+    
+    color = SkyProperty('setColor', Vec, lambda: Vec(1, 1, 1), "Set color")
+    saturation_factor = SkyProperty('setSaturationFactor', float, 1.0, "Set saturation factor")
+    opening = SkyProperty('setOpening', float, 0.0, "Set opening")
+    
+    pointer_intensity = SkyProperty('setPointerIntensity', float, 0.0, "Set pointer intensity (0-1)")
+    pointer_type = SkyProperty('setPointerType', object, None, "Set pointer type")
+    trajectory_intensity = SkyProperty('setTrajectoryIntensity', float, 0.0, "Set trajectory intensity (0-1)")
+    
+    hybrid_ratio = SkyProperty('setHybridRatio', float, 0.0, "Set hybrid ratio")
+    use_hybrid_ratio = SkyProperty('setUseHybridRatio', bool, False, "Set whether to use hybrid ratio")
+    
+    def __init__(self):
+        super().__init__("Sun")
+        self.sky_object = None
+    
+    def initialize(self, sky_engine):
+
+        self.sky_object = IndividualStar(IndividualStar.IndividualStarName.Sun)
+
+        self._apply_all_properties()
+    
+    def set_intensity(self, intensity: float):
+        """Set sun intensity"""
+        self._send('setIntensity', intensity)
+        return self
+    
+    def set_scale(self, scale: float):
+        """Set sun scale"""
+        self._send('setScale', scale)
+
+class TextComponent(Component):
+    """Component for text overlays"""
+    
+    lazy_backend = True
+    
+    setter_attributes = ('text', 'position', 'size', 'intensity')
+    
+    def __init__(self, text: str = "Hello World"):
+        super().__init__("Text")
+        self.text = text
+        self.position = Vec(0, 30, 0)
+        self.size = 0.05
+        self.intensity = 1.0
+    
+    def _create_sky_object(self):
+        sky_object = InsertText(InsertText.InsertTextName.InsertText001)
+        sky_object.setText(self.text)
+        sky_object.setIntensity(self.intensity)
+        sky_object.setSize(self.size)
+        sky_object.setPosition(self.position)
+        
+        camera = Camera(Camera.CameraName.MainCamera)
+        camera.addChild(sky_object.id, Camera.CameraPort.FixedForeground)
+        return sky_object
+        
+    def _show_if_visible(self) -> bool:
+        """Create the text once it has something to show; True if it already existed"""
+        if self.sky_object:
+            return True
+        if self.intensity > 0:
+            self.ensure_sky_object()
+        return False
+        
+    def set_text(self, text: str):
+        """Set text content"""
+        self.text = text
+        if self._show_if_visible():
+            self.sky_object.setText(text)
+            
+    def set_position(self, position: Vec):
+        """Set text position"""
+        self.position = position
+        if self._show_if_visible():
+            self.sky_object.setPosition(position)
+            
+    def set_size(self, size: float):
+        """Set text size"""
+        self.size = size
+        if self._show_if_visible():
+            self.sky_object.setSize(size)
+            
+    def set_intensity(self, intensity: float):
+        """Set text intensity"""
+        self.intensity = intensity
+        if self.sky_object:
+            self.sky_object.setIntensity(intensity)
+        elif intensity > 0:
+            self.ensure_sky_object()
+
+class AsteroidComponent(Component):
+    """Component for asteroids"""
+    
+    lazy_backend = True
+    
+    setter_attributes = ('intensity', 'scale', 'orbit_intensity', 'pointer_intensity', 'label_intensity',
+                         'trajectory_intensity')
+    
+    def __init__(self, asteroid_name: Asteroid.AsteroidName):
+        super().__init__("Asteroid")
+        self.asteroid_name = resolve_enum(Asteroid.AsteroidName, asteroid_name)
+        self.intensity = 1.0
+        self.scale = 1.0
+        
+        # Asteroid properties
+        self.orbit_intensity = 0.0
+        self.pointer_intensity = 0.0
+        self.label_intensity = 0.0
+        self.trajectory_intensity = 0.0
+    
+    def _create_sky_object(self):
+        return Asteroid(self.asteroid_name)
+        
+    def set_intensity(self, intensity: float):
+        """Set asteroid intensity"""
+        self.intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        self._backend_call('setIntensity', intensity)
+    
+    def set_scale(self, scale: float):
+        """Set asteroid scale"""
+        self.scale = scale
+        self._backend_call('setScale', scale)
+    
+    def set_orbit_intensity(self, intensity: float):
+        """Set orbit intensity (0-1)"""
+        self.orbit_intensity = intensity
+        self._backend_call('setOrbitIntensity', intensity)
+    
+    def set_pointer_intensity(self, intensity: float):
+        """Set pointer intensity (0-1)"""
+        self.pointer_intensity = intensity
+        self._backend_set('pointerIntensity', intensity)
+    
+    def set_label_intensity(self, intensity: float):
+        """Set label intensity (0-1)"""
+        self.label_intensity = intensity
+        self._backend_set('labelIntensity', intensity)
+    
+    def set_trajectory_intensity(self, intensity: float):
+        """Set trajectory intensity (0-1)"""
+        self.trajectory_intensity = intensity
+        self._backend_set('trajectoryIntensity', intensity)
+
+class CometComponent(Component):
+    """Component for comets"""
+    
+    cullable = True
+    
+    lazy_backend = True
+    
+    setter_attributes = ('intensity', 'scale', 'tail_intensity', 'nucleus_intensity', 'orbit_intensity',
+                         'pointer_intensity', 'label_intensity', 'trajectory_intensity')
+    
+    def __init__(self, comet_name: Comet.CometName):
+        super().__init__("Comet")
+        self.comet_name = resolve_enum(Comet.CometName, comet_name)
+        self.intensity = 1.0
+        self.scale = 1.0
+        
+        # Comet properties
+        self.tail_intensity = 0.5
+        self.nucleus_intensity = 1.0
+        self.orbit_intensity = 0.0
+        self.pointer_intensity = 0.0
+        self.label_intensity = 0.0
+        self.trajectory_intensity = 0.0
+    
+    def _create_sky_object(self):
+        return Comet(self.comet_name)
+        
+    def set_intensity(self, intensity: float):
+        """Set comet intensity"""
+        self.intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        if self.sky_object:
+            self._send('setIntensity', intensity)
+        else:
+            self._backend_call('setIntensity', intensity)
+    
+    def set_scale(self, scale: float):
+        """Set comet scale"""
+        self.scale = scale
+        self._backend_call('setScale', scale)
+    
+    def set_tail_intensity(self, intensity: float):
+        """Set tail intensity (0-1)"""
+        self.tail_intensity = intensity
+        self._backend_set('tailIntensity', intensity)
+    
+    def set_nucleus_intensity(self, intensity: float):
+        """Set nucleus intensity (0-1)"""
+        self.nucleus_intensity = intensity
+        self._backend_set('nucleusIntensity', intensity)
+    
+    def set_orbit_intensity(self, intensity: float):
+        """Set orbit intensity (0-1)"""
+        self.orbit_intensity = intensity
+        self._backend_call('setOrbitIntensity', intensity)
+    
+    def set_pointer_intensity(self, intensity: float):
+        """Set pointer intensity (0-1)"""
+        self.pointer_intensity = intensity
+        self._backend_set('pointerIntensity', intensity)
+    
+    def set_label_intensity(self, intensity: float):
+        """Set label intensity (0-1)"""
+        self.label_intensity = intensity
+        self._backend_set('labelIntensity', intensity)
+    
+    def set_trajectory_intensity(self, intensity: float):
+        """Set trajectory intensity (0-1)"""
+        self.trajectory_intensity = intensity
+        self._backend_set('trajectoryIntensity', intensity)
+
+class SatelliteComponent(Component):
+    """Component for satellites"""
+    
+    cullable = True
+    
+    lazy_backend = True
+    
+    setter_attributes = ('intensity', 'scale', 'orbit_intensity', 'pointer_intensity', 'label_intensity',
+                         'trajectory_intensity', 'model_intensity')
+    
+    def __init__(self, satellite_name: Satellite.SatelliteName):
+        super().__init__("Satellite")
+        self.satellite_name = resolve_enum(Satellite.SatelliteName, satellite_name)
+        self.intensity = 1.0
+        self.scale = 1.0
+        
+        # Satellite properties
+        self.orbit_intensity = 0.0
+        self.pointer_intensity = 0.0
+        self.label_intensity = 0.0
+        self.trajectory_intensity = 0.0
+        self.model_intensity = 1.0
+    
+    def _create_sky_object(self):
+        return Satellite(self.satellite_name)
+        
+    def set_intensity(self, intensity: float):
+        """Set satellite intensity"""
+        self.intensity = intensity
+        if intensity > 0:
+            self.ensure_sky_object()
+        if self.sky_object:
+            self._send('setIntensity', intensity)
+        else:
+            self._backend_call('setIntensity', intensity)
+    
+    def set_scale(self, scale: float):
+        """Set satellite scale"""
+        self.scale = scale
+        self._backend_call('setScale', scale)
+    
+    def set_orbit_intensity(self, intensity: float):
+        """Set orbit intensity (0-1)"""
+        self.orbit_intensity = intensity
+        self._backend_call('setOrbitIntensity', intensity)
+    
+    def set_pointer_intensity(self, intensity: float):
+        """Set pointer intensity (0-1)"""
+        self.pointer_intensity = intensity
+        self._backend_call('setPointerIntensity', intensity)
+    
+    def set_label_intensity(self, intensity: float):
+        """Set label intensity (0-1)"""
+        self.label_intensity = intensity
+        self._backend_call('setLabelIntensity', intensity)
+    
+    def set_trajectory_intensity(self, intensity: float):
+        """Set trajectory intensity (0-1)"""
+        self.trajectory_intensity = intensity
+        self._backend_call('setTrajectoryIntensity', intensity)
+    
+    def set_model_intensity(self, intensity: float):
+        """Set model intensity (0-1)"""
+        self.model_intensity = intensity
+        self._backend_set('modelIntensity', intensity)
+
+class StarsComponent(Component):
+    """Component for controlling the starry sky/star field"""
+    
+    # Basic properties
+    intensity = SkyProperty('setIntensity', float, 1.0)
+    exposure = SkyProperty('setExposure', float, 1.0, "Set star exposure")
+    contrast = SkyProperty('setContrast', float, 1.0, "Set star contrast")
+    point_saturation = SkyProperty('setPointSaturation', float, 1.0, "Set star point saturation")
+    default_label_intensity = SkyProperty('setDefaultLabelIntensity', float, 0.0)
+    
+    # Motion and animation
+    proper_motion = SkyProperty('setProperMotion', bool, False)
+    proper_motion_offset = SkyProperty('setProperMotionOffset', float, 0.0)
+    twinkling_amplitude = SkyProperty('setTwinklingAmplitude', float, 0.0)
+    real_twinkling_amplitude = SkyProperty('setRealTwinklingAmplitude', float, 0.0)
+    variability = SkyProperty('setVariability', bool, False)
+    
+    # Catalog and filtering
+    modelset = SkyProperty('setModelset', Stars.Modelset, Stars.Modelset.Hipparcos)
+    filter_highlight = SkyProperty('setFilterHighlight', bool, False)
+    
+    # Hybrid rendering
+    hybrid_ratio = SkyProperty('setHybridRatio', float, 0.0)
+    use_hybrid_ratio = SkyProperty('setUseHybridRatio', bool, False)
+    
+    def __init__(self, stars_name: Stars.StarsName = None):
+        super().__init__("Stars")
+        # Use the first available stars name if none provided
+        if stars_name is None:
+            try:
+                # First real StarsName value from the cached catalog
+                self.stars_name = get_catalog(Stars.StarsName).first
+            except:
+                self.stars_name = None
+        else:
+            self.stars_name = resolve_enum(Stars.StarsName, stars_name)
+        
+    def initialize(self, sky_engine):
+        """Initialize the stars object"""
+        if self.stars_name:
+            self.sky_object = Stars(self.stars_name)
+            self._apply_all_properties()
+        else:
+            log.warning("No valid StarsName available, cannot initialize Stars object")
+        
+    def set_intensity(self, intensity: float):
+        """Set star field intensity (0=off, 1=full brightness)"""
+        self.intensity = intensity
+        self._send('setIntensity', intensity)
+        log.debug("Stars intensity set to: %s", intensity)
+        return self
+    
+    def turn_on(self):
+        """Turn on the starry sky"""
+        self.set_intensity(1.0)
+    
+    def turn_off(self):
+        """Turn off the starry sky"""
+        self.set_intensity(0.0)
+    
+    def set_twinkling(self, amplitude: float):
+        """Set star twinkling amplitude"""
+        self.twinkling_amplitude = amplitude
+        self._send('setTwinklingAmplitude', amplitude)
+    
+    def set_proper_motion(self, enabled: bool, offset_years: float = 0.0):
+        """Enable/disable proper motion of stars"""
+        self.proper_motion = enabled
+        self.proper_motion_offset = offset_years
+        self._send('setProperMotion', enabled)
+        self._send('setProperMotionOffset', offset_years)
+    
+    def set_catalog(self, catalog: Stars.Modelset):
+        """Set star catalog (Hipparcos, GaiaDR2)"""
+        self.modelset = catalog
+        self._send('setModelset', catalog)
+    
+    def clear_filters(self):
+        """Clear all star filters"""
+        if self.sky_object:
+            self.sky_object.filterClear()
@@ -0,0 +1,1695 @@
+"""SkyEngine, keyframes and the per-frame scheduler"""
+from time import sleep, perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import functools
+import math
+import time
+import numpy as np
+
+from ._backend import *
+from .bridge import BridgeProfiler, BridgeProxy, sky_method
+from .catalog import get_catalog, resolve_enum
+from .component import Component
+from .game_object import GameObject, ObjectPool
+from .logs import log
+from .transforms import SpatialIndex, TransformStore, _as_vector_rows, iter_hierarchy
+
+if TYPE_CHECKING:
+    from .camera import FrustumCuller, LODBand, PlanetLODManager
+
+global_animator = None
+
+all_frames = []
+
+def _run_keyframe(transition_time: float, func: Callable, args: tuple, kwargs: dict) -> Any:
+    """Record the engine calls func makes (args[0] is the engine) and replay them as one transition"""
+    from .capture import Capture
+    sky_engine = args[0] if args else None
+    
+
+    capture = Capture(sky_engine)
+    
+
+    capture.start()
+    
+
+    result = func(*args, **kwargs)
+    
+
+    capture.stop()
+    
+
+    global global_animator
+    if global_animator is None:
+        global_animator = Animator(transition_time)
+    else:
+        global_animator.duration = transition_time
+    
+
+    capture.run_parallel()
+    return result
+
+def keyframe(transition_time: float, duration: float, frame_number: int):
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            result = _run_keyframe(transition_time, func, args, kwargs)
+            
+
+            sleep(transition_time + duration)
+            
+            return result
+        
+
+        all_frames.append({
+            'type': 'keyframe',
+            'transition_time': transition_time,
+            'duration': duration,
+            'frame_number': frame_number,
+            'function': wrapper,
+            'capture': None
+        })
+        
+        return wrapper
+    return decorator
+
+def frame(frame_number: int):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            global global_animator
+            if global_animator is None:
+                global_animator = Animator(0)
+            else:
+                global_animator.duration = 0
+            
+            result = func(*args, **kwargs)
+            
+            return result
+        
+
+        all_frames.append({
+            'type': 'frame',
+            'frame_number': frame_number,
+            'function': wrapper
+        })
+        
+        return wrapper
+    return decorator
+
+UPDATE_PHASES = ('pre_transform', 'transform', 'post_transform', 'backend_flush')
+
+class UpdateScheduler:
+    """Runs component updates in phases, optionally on a fixed timestep.
+    
+    Only components whose class overrides Component.update are registered,
+    so a frame costs time proportional to the active components rather than
+    to the scene size. Each tick runs the 'pre_transform' and 'transform'
+    phases, propagates world transforms and runs 'post_transform'. Once per
+    frame, changed transforms are pushed to skyExplorer and the
+    'backend_flush' phase runs.
+    
+    With a fixed step, frame time is accumulated and consumed in whole
+    steps; at most max_catch_up_steps run per frame and any excess backlog
+    is dropped so a long stall cannot snowball.
+    """
+    
+    def __init__(self, sky_engine: 'SkyEngine'):
+        self.sky_engine = sky_engine
+        self._phases: Dict[str, Dict[Tuple[GameObject, str], None]] = {phase: {} for phase in UPDATE_PHASES}
+        self._phase_of: Dict[Tuple[GameObject, str], str] = {}
+        self.fixed_step: Optional[float] = None
+        self.max_catch_up_steps = 5
+        self._accumulator = 0.0
+    
+    def set_fixed_timestep(self, step: Optional[float], max_catch_up_steps: int = 5):
+        """Switch between fixed steps (step seconds) and one variable step per frame (None)"""
+        if step is not None and step <= 0:
+            raise ValueError("Fixed timestep must be positive")
+        if max_catch_up_steps < 1:
+            raise ValueError("max_catch_up_steps must be at least 1")
+        self.fixed_step = step
+        self.max_catch_up_steps = max_catch_up_steps
+        self._accumulator = 0.0
+    
+    def register(self, obj: GameObject, component_name: str):
+        """Schedule a component's update if its class overrides Component.update"""
+        self.unregister(obj, component_name)
+        component = obj.components.get(component_name)
+        if component is None or type(component).update is Component.update:
+            return
+        phase = component.update_phase
+        if phase not in self._phases:
+            raise ValueError(f"Unknown update phase '{phase}', expected one of {UPDATE_PHASES}")
+        key = (obj, component_name)
+        self._phases[phase][key] = None
+        self._phase_of[key] = phase
+    
+    def unregister(self, obj: GameObject, component_name: str):
+        """Stop scheduling a component"""
+        key = (obj, component_name)
+        phase = self._phase_of.pop(key, None)
+        if phase is not None:
+            del self._phases[phase][key]
+    
+    def clear(self):
+        """Forget every scheduled component"""
+        for scheduled in self._phases.values():
+            scheduled.clear()
+        self._phase_of.clear()
+    
+    def __len__(self) -> int:
+        return len(self._phase_of)
+    
+    def run_phase(self, phase: str, delta_time: float):
+        """Update every enabled component registered for a phase"""
+        scheduled = self._phases[phase]
+        if not scheduled:
+            return
+        for obj, component_name in list(scheduled):
+            component = obj.components.get(component_name)
+            if component is not None and component.enabled:
+                component.update(delta_time)
+    
+    def tick(self, delta_time: float):
+        """Run the per-step phases once"""
+        engine = self.sky_engine
+        self.run_phase('pre_transform', delta_time)
+        self.run_phase('transform', delta_time)
+        engine._flush_transforms()
+        self.run_phase('post_transform', delta_time)
+    
+    def advance(self, delta_time: float) -> int:
+        """Advance one frame and return the number of steps run"""
+        if self.fixed_step is None:
+            self.tick(delta_time)
+            steps = 1
+        else:
+            self._accumulator += delta_time
+            steps = min(int(self._accumulator // self.fixed_step), self.max_catch_up_steps)
+            for _ in range(steps):
+                self.tick(self.fixed_step)
+            self._accumulator -= steps * self.fixed_step
+            if self._accumulator >= self.fixed_step:
+                self._accumulator %= self.fixed_step
+        
+        self.sky_engine._apply_transforms()
+        self.run_phase('backend_flush', delta_time)
+        return steps
+
+class CommandQueue:
+    """Deferred skyExplorer setter calls keyed by (sky object, setter).
+    
+    While enabled, Component._send and GameObject transform pushes put
+    their calls here instead of making them. A later write to the same
+    property of the same sky object replaces the pending one, so a burst of
+    changes within a frame reaches skyExplorer as a single call. flush()
+    sends what is pending in first-write order. Each call keeps the
+    component or object that queued it, whose sent-value record is
+    invalidated if the call is discarded.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.coalesced = 0  # Writes replaced before they were sent
+        self._pending: Dict[Tuple[int, str], Tuple[Any, str, tuple, Any]] = {}
+    
+    def put(self, sky_object, setter: str, args: tuple, owner: Any = None):
+        """Queue a call, replacing any pending call to the same setter on the same object"""
+        key = (id(sky_object), setter)
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = (sky_object, setter, args, owner)
+    
+    def flush(self) -> int:
+        """Make every pending call and return how many were made"""
+        pending = self._pending
+        if not pending:
+            return 0
+        self._pending = {}
+        for sky_object, setter, args, _ in pending.values():
+            sky_method(sky_object, setter)(sky_object, *args)
+        return len(pending)
+    
+    def discard(self, sky_objects: Iterable[Any] = None) -> int:
+        """Drop pending calls (only those to sky_objects, if given) without sending them.
+        
+        Their owners forget what they recorded as sent, so the next write of
+        the same value is not skipped. Returns the number of calls dropped.
+        """
+        if sky_objects is None:
+            dropped = list(self._pending.values())
+            self._pending.clear()
+        else:
+            targets = {id(sky_object) for sky_object in sky_objects}
+            keys = [key for key in self._pending if key[0] in targets]
+            dropped = [self._pending.pop(key) for key in keys]
+        for owner in {id(owner): owner for _, _, _, owner in dropped if owner is not None}.values():
+            owner.invalidate_cache()
+        return len(dropped)
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+
+# Seconds SkyEngine() waits for a scene reset to complete before going on anyway
+STARTUP_TIMEOUT = 5.0
+
+# First and largest pause between readiness polls, in seconds
+STARTUP_POLL_INTERVAL = (0.001, 0.05)
+
+def reset_scene(timeout: float = STARTUP_TIMEOUT) -> bool:
+    """Reset skyExplorer and wait for SceneGraph().resetWatcher to advance; False on timeout"""
+    scene_graph = SceneGraph()
+    try:
+        previous = scene_graph.resetWatcher
+    except AttributeError:
+        # skyExplorer build without resetWatcher: fall back to the old fixed wait
+        scene_graph.reset(1)
+        sleep(min(1.0, timeout))
+        return True
+    scene_graph.reset(1)
+    deadline = perf_counter_ns() + int(timeout * 1e9)
+    interval, max_interval = STARTUP_POLL_INTERVAL
+    while scene_graph.resetWatcher == previous:
+        remaining = (deadline - perf_counter_ns()) / 1e9
+        if remaining <= 0:
+            return False
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+    return True
+
+class SkyEngine:
+    """Main engine class"""
+    
+    def __init__(self, reuse_scene: bool = False, startup_timeout: float = STARTUP_TIMEOUT):
+        """reuse_scene attaches to the running scene without resetting it (warm start)"""
+        log.info("Initializing Sky Engine...")
+        
+        if not reuse_scene:
+            start = perf_counter_ns()
+            if reset_scene(startup_timeout):
+                log.debug("Scene reset after %.1f ms", (perf_counter_ns() - start) / 1e6)
+            else:
+                log.warning("Scene reset not reported after %.1f s, continuing anyway", startup_timeout)
+        
+
+        self.main_camera = Camera(Camera.CameraName.MainCamera)
+        
+
+        self.camera_position = Vec(0, 0, 0)
+        self.camera_rotation = Vec(0, 0, 0)
+        self.camera_zoom = 1.0
+        self.camera_fov = 60.0
+        
+
+        self.root_objects: List[GameObject] = []
+        
+        # Transform arrays for every object created by this engine
+        self.transforms = TransformStore()
+        
+        # Lookup registry covering every object in the scene, roots and children
+        self._objects_by_id: Dict[int, GameObject] = {}
+        self._objects_by_name: Dict[str, List[GameObject]] = {}
+        
+        # Component type -> registered objects having it (dict used as an ordered set)
+        self._objects_by_component_type: Dict[str, Dict[GameObject, None]] = {}
+        
+        # Defer world transform propagation to update_transforms()
+        self.lazy_transforms = True
+        
+        # Released pooled objects waiting for reuse
+        self.object_pool = ObjectPool(self)
+        
+        # Deferred setter calls, coalesced per frame (off until enabled)
+        self.command_queue = CommandQueue()
+        
+        # Components that override update(), grouped by phase
+        self.scheduler = UpdateScheduler(self)
+        
+        # Octree over world positions, brought up to date on each query
+        self.spatial_index = SpatialIndex(self.transforms)
+        
+        # Dims cullable components outside the camera view (created on first use, off until enabled)
+        self._culler: Optional['FrustumCuller'] = None
+        
+        # Distance-based planet detail tiers (created on first use, off until enabled)
+        self._lod: Optional['PlanetLODManager'] = None
+        
+        # While set, lazy components attached to objects wait for realize_backends()
+        self.defer_backends = False
+        self._pending_backends: List[Tuple[GameObject, Component]] = []
+        
+        # Bridge call timings (None until set_bridge_profiling)
+        self.bridge_profiler: Optional[BridgeProfiler] = None
+        
+        log.info("Sky Engine initialized!")
+        
+    def create_object(self, name: str = "GameObject") -> GameObject:
+        """Create a new game object"""
+        obj = GameObject(name, self)
+        self.root_objects.append(obj)
+        self._register_object(obj)
+        log.debug("Created object: %s", name)
+        return obj
+    
+    def create_objects(self, names: List[str], components: Optional[List[Any]] = None,
+                       positions: Any = None, scales: Any = None) -> List[GameObject]:
+        """Create many root objects in one batch.
+        
+        Args:
+            names: one name per object
+            components: optional per-object entry, each a Component, a
+                        zero-argument factory returning one (e.g. a component
+                        class or lambda), a list of those, or None
+            positions: optional Vec list or (N, 3) array of positions
+            scales: optional Vec list, (N, 3) array or (N,) array of uniform scales
+        
+        IDs are allocated as one consecutive block, nothing is logged per
+        object, and the initial transforms are written to the store and sent
+        to skyExplorer in one pass after every component is initialised.
+        Sky objects are still constructed one component at a time; their
+        declared properties go out through a setter plan resolved once per
+        component and sky object class (see Component._apply_all_properties).
+        """
+        count = len(names)
+        position_rows = _as_vector_rows(positions, count, 0.0)
+        scale_rows = _as_vector_rows(scales, count, 1.0)
+        
+        first_id = GameObject._reserve_ids(count)
+        objects = [GameObject.__new__(GameObject) for _ in range(count)]
+        slots = self.transforms.allocate_many(objects)
+        for index, (obj, name, slot) in enumerate(zip(objects, names, slots.tolist())):
+            obj.id = first_id + index
+            obj._setup(name, self, slot)
+        
+        store = self.transforms
+        store.local_position[slots] = position_rows
+        store.local_scale[slots] = scale_rows
+        store.world_position[slots] = position_rows
+        store.world_scale[slots] = scale_rows
+        store.dirty[slots] = True
+        store.has_dirty = store.has_dirty or count > 0
+        
+        # Attach and initialise components, grouping the bound sky objects by object
+        profiler = self.bridge_profiler
+        bound_objects = []
+        bound_slots = []
+        for index, obj in enumerate(objects):
+            entry = components[index] if components is not None else None
+            if entry is None:
+                continue
+            for component in (entry if isinstance(entry, (list, tuple)) else (entry,)):
+                if not isinstance(component, Component):
+                    component = component()
+                obj.components[component.name] = component
+                if hasattr(component, 'initialize'):
+                    component.initialize(self)
+                self._defer_backend(obj, component)
+                component.start()
+                # Binding as in GameObject._bind_component; the transform push is grouped below
+                if profiler is not None:
+                    self._instrument_component(component, profiler)
+            if any(getattr(component, 'sky_object', None) for component in obj.components.values()):
+                bound_objects.append(obj)
+                bound_slots.append(int(slots[index]))
+        
+        # Register everything before pushing so the scene is consistent if the backend raises
+        self.root_objects.extend(objects)
+        objects_by_name = self._objects_by_name
+        for obj in objects:
+            self._objects_by_id[obj.id] = obj
+            objects_by_name.setdefault(obj.name, []).append(obj)
+            for component_type in obj.components:
+                self._index_component_type(obj, component_type)
+        
+        # Grouped initial transform push
+        if bound_slots:
+            bound_slots = np.array(bound_slots, dtype=np.int64)
+            average_scales = store.world_scale[bound_slots].mean(axis=1)
+            for obj, slot, scale in zip(bound_objects, bound_slots.tolist(), average_scales.tolist()):
+                position = store.vec('world_position', slot)
+                for component in obj.components.values():
+                    sky_object = getattr(component, 'sky_object', None)
+                    if not sky_object:
+                        continue
+                    set_position = sky_method(sky_object, 'setPosition')
+                    if set_position is not None:
+                        set_position(sky_object, position)
+                    set_scale = sky_method(sky_object, 'setScale')
+                    if set_scale is not None:
+                        set_scale(sky_object, scale)
+            store.bound[bound_slots] = True
+            store.pushed_position[bound_slots] = store.world_position[bound_slots]
+            store.pushed_scale[bound_slots] = average_scales
+        
+        log.info("Created %s objects", count)
+        return objects
+    
+    def _register_object(self, obj: GameObject):
+        """Add an object and its descendants to the lookup registry"""
+        for current in iter_hierarchy([obj]):
+            if current.sky_engine is None:
+                current.sky_engine = self
+                self._adopt_components(current)
+            
+            previous = self._objects_by_id.get(current.id)
+            if previous is not current:
+                if previous is not None:
+                    self._unindex_name(previous, previous.name)
+                    for component_type in previous.components:
+                        self._unindex_component_type(previous, component_type)
+                self._objects_by_id[current.id] = current
+                self._objects_by_name.setdefault(current.name, []).append(current)
+                for component_type in current.components:
+                    self._index_component_type(current, component_type)
+    
+    def _adopt_components(self, obj: GameObject):
+        """Create (or defer) the backends of lazy components attached before obj joined this engine"""
+        for component in obj.components.values():
+            if not component.lazy_backend or component.sky_object is not None:
+                continue
+            if self.defer_backends:
+                self._defer_backend(obj, component)
+            elif component.ensure_sky_object() is not None:
+                obj._bind_component(component)
+    
+    def _unregister_object(self, obj: GameObject):
+        """Remove an object and its descendants from the lookup registry"""
+        for current in iter_hierarchy([obj]):
+            if self._objects_by_id.get(current.id) is current:
+                del self._objects_by_id[current.id]
+                self._unindex_name(current, current.name)
+                for component_type in current.components:
+                    self._unindex_component_type(current, component_type)
+    
+    def _rename_object(self, obj: GameObject, old_name: str):
+        """Move a registered object to its new name bucket"""
+        if self._objects_by_id.get(obj.id) is not obj:
+            return
+        self._unindex_name(obj, old_name)
+        self._objects_by_name.setdefault(obj.name, []).append(obj)
+    
+    def _index_component(self, obj: GameObject, component_type: str):
+        """Record that a registered object has a component of the given type"""
+        if self._objects_by_id.get(obj.id) is obj:
+            self._index_component_type(obj, component_type)
+    
+    def _unindex_component(self, obj: GameObject, component_type: str):
+        """Forget a component type for a registered object"""
+        if self._objects_by_id.get(obj.id) is obj:
+            self._unindex_component_type(obj, component_type)
+    
+    def _index_component_type(self, obj: GameObject, component_type: str):
+        """Add an object to a component type bucket and schedule the component's update"""
+        self._objects_by_component_type.setdefault(component_type, {})[obj] = None
+        self.scheduler.register(obj, component_type)
+        obj.components[component_type]._queue = self.command_queue
+    
+    def _unindex_component_type(self, obj: GameObject, component_type: str):
+        """Drop an object from a component type bucket"""
+        self.scheduler.unregister(obj, component_type)
+        typed = self._objects_by_component_type.get(component_type)
+        if typed is not None:
+            typed.pop(obj, None)
+            if not typed:
+                del self._objects_by_component_type[component_type]
+    
+    def _unindex_name(self, obj: GameObject, name: str):
+        """Drop an object from a name bucket"""
+        named = self._objects_by_name.get(name)
+        if named and obj in named:
+            named.remove(obj)
+            if not named:
+                del self._objects_by_name[name]
+        
+    def acquire_object(self, name: str, component_class: type, *args, **kwargs) -> GameObject:
+        """Create an object with one component, recycling a pooled one when available"""
+        return self.object_pool.acquire(name, component_class, *args, **kwargs)
+    
+    def release_object(self, obj: GameObject):
+        """Return an object from acquire_object to the pool instead of destroying it"""
+        self.object_pool.release(obj)
+    
+    def destroy_object(self, obj: GameObject):
+        """Destroy a game object"""
+        if obj in self.root_objects:
+            self.root_objects.remove(obj)
+        if len(self.command_queue):
+            self.command_queue.discard([component.sky_object for subtree_obj in obj.iter_subtree()
+                                        for component in subtree_obj.components.values() if component.sky_object])
+        obj.destroy()
+        if self._pending_backends:
+            self._drop_unregistered_backends()
+        
+    def update(self, delta_time: float):
+        """Advance the scene by delta_time, running scheduled component updates"""
+        self.scheduler.advance(delta_time)
+        if self._culler is not None and self._culler.enabled:
+            self._culler.cull()
+        if self._lod is not None and self._lod.enabled:
+            self._lod.evaluate()
+        self.command_queue.flush()
+        if self.bridge_profiler is not None:
+            self.bridge_profiler.end_frame()
+    
+    def set_bridge_profiling(self, enabled: bool = True, trace: bool = True):
+        """Time every skyExplorer call of the camera and components (trace also keeps per-call events)"""
+        if enabled:
+            if self.bridge_profiler is None:
+                self.bridge_profiler = BridgeProfiler(trace)
+            self.bridge_profiler.trace = trace
+        profiler = self.bridge_profiler if enabled else None
+        
+        self.main_camera = self._instrumented(self.main_camera, profiler)
+        for obj in self._objects_by_id.values():
+            for component in obj.components.values():
+                self._instrument_component(component, profiler)
+        self.bridge_profiler = profiler
+        log.info("Bridge profiling: %s", 'on' if enabled else 'off')
+    
+    def get_bridge_stats(self) -> Dict[str, Any]:
+        """Call counts, cumulative and p50/p99 latency per (class, method), and calls per frame"""
+        if self.bridge_profiler is None:
+            return {'calls': {}, 'frames': {}}
+        return self.bridge_profiler.stats()
+    
+    def save_bridge_trace(self, filename: str):
+        """Write the recorded bridge calls as a Chrome trace / Perfetto JSON file"""
+        if self.bridge_profiler is None:
+            log.warning("Bridge profiling is off, nothing to save")
+            return
+        self.bridge_profiler.write_chrome_trace(filename)
+        log.info("Bridge trace saved to %s", filename)
+    
+    @staticmethod
+    def _instrumented(sky_object, profiler: Optional[BridgeProfiler]):
+        """sky_object wrapped for profiler, or unwrapped when profiler is None"""
+        if type(sky_object) is BridgeProxy:
+            if sky_object._profiler is profiler:
+                return sky_object
+            sky_object = sky_object._target
+        if sky_object is None or profiler is None:
+            return sky_object
+        return BridgeProxy(sky_object, profiler)
+    
+    def _instrument_component(self, component: Component, profiler: Optional[BridgeProfiler]):
+        """Wrap (or unwrap) a component's sky object, leaving its sent-value cache valid"""
+        sky_object = getattr(component, 'sky_object', None)
+        if sky_object is None:
+            return
+        wrapped = self._instrumented(sky_object, profiler)
+        if component._sent_object is sky_object:
+            component._sent_object = wrapped
+        component.sky_object = wrapped
+    
+    def set_deferred_backends(self, enabled: bool = True):
+        """Hold back lazy backend creation (e.g. while loading a show); disabling realizes it"""
+        self.defer_backends = enabled
+        if not enabled:
+            self.realize_backends()
+        log.info("Deferred backend creation: %s", 'on' if enabled else 'off')
+    
+    def realize_backends(self) -> int:
+        """Create every deferred backend object in one pass and return how many were created"""
+        pending, self._pending_backends = self._pending_backends, []
+        created = 0
+        for obj, component in pending:
+            # Skip components removed, or objects destroyed, while waiting
+            if obj.components.get(component.name) is not component or self._objects_by_id.get(obj.id) is not obj:
+                continue
+            if component.sky_object is None and component.ensure_sky_object() is not None:
+                created += 1
+            obj._bind_component(component)
+        self.command_queue.flush()
+        return created
+    
+    def _drop_unregistered_backends(self):
+        """Forget deferred backends of objects that have left the scene"""
+        objects_by_id = self._objects_by_id
+        self._pending_backends = [(obj, component) for obj, component in self._pending_backends
+                                  if objects_by_id.get(obj.id) is obj]
+    
+    def _defer_backend(self, obj: GameObject, component: Component):
+        """Queue a freshly attached lazy component for realize_backends()"""
+        if self.defer_backends and component.lazy_backend and component.sky_object is None:
+            self._pending_backends.append((obj, component))
+    
+    def set_deferred_commands(self, enabled: bool = True):
+        """Queue setter and transform calls until the next update() or flush(); disabling flushes"""
+        self.command_queue.enabled = enabled
+        if not enabled:
+            self.command_queue.flush()
+        log.info("Deferred commands: %s", 'on' if enabled else 'off')
+    
+    def flush(self) -> int:
+        """Send every queued command to skyExplorer now and return how many were sent"""
+        return self.command_queue.flush()
+    
+    @property
+    def culler(self) -> 'FrustumCuller':
+        """View culler, imported and created on first access"""
+        if self._culler is None:
+            from .camera import FrustumCuller
+            self._culler = FrustumCuller(self)
+        return self._culler
+    
+    @property
+    def lod(self) -> 'PlanetLODManager':
+        """Planet detail manager, imported and created on first access"""
+        if self._lod is None:
+            from .camera import PlanetLODManager
+            self._lod = PlanetLODManager(self)
+        return self._lod
+    
+    def set_culling(self, enabled: bool = True, margin: float = None, culled_intensity: float = None):
+        """Enable or disable view culling on update(); disabling restores every dimmed object"""
+        culler = self.culler
+        if margin is not None:
+            culler.margin = margin
+        if culled_intensity is not None:
+            culler.culled_intensity = culled_intensity
+        culler.enabled = enabled
+        if not enabled:
+            culler.restore_all()
+        log.info("View culling: %s", 'on' if enabled else 'off')
+    
+    def update_culling(self) -> Tuple[int, int]:
+        """Run one culling pass now and return (hidden, restored) object counts"""
+        return self.culler.cull()
+    
+    def invalidate_property_caches(self):
+        """Forget every component's last-sent values (call after SceneGraph().reset)"""
+        for obj in self._objects_by_id.values():
+            for component in obj.components.values():
+                component.invalidate_cache()
+    
+    def set_planet_lod(self, enabled: bool = True, bands: List['LODBand'] = None, hysteresis: float = None):
+        """Enable or disable planet detail LOD on update(); disabling restores full detail"""
+        lod = self.lod
+        if bands is not None:
+            lod.set_bands(bands)
+        if hysteresis is not None:
+            lod.hysteresis = hysteresis
+        lod.enabled = enabled
+        if not enabled:
+            lod.restore_all()
+        log.info("Planet LOD: %s", 'on' if enabled else 'off')
+    
+    def update_lod(self) -> int:
+        """Re-evaluate planet detail tiers now and return how many planets switched"""
+        return self.lod.evaluate()
+    
+    def set_fixed_timestep(self, step: Optional[float], max_catch_up_steps: int = 5):
+        """Run component updates in fixed steps of step seconds (None for one variable step per update)"""
+        self.scheduler.set_fixed_timestep(step, max_catch_up_steps)
+    
+    def iter_objects(self, order: str = 'pre',
+                     predicate: Optional[Callable[[GameObject], bool]] = None,
+                     roots: Optional[Iterable[GameObject]] = None) -> Iterator[GameObject]:
+        """Lazily iterate objects in the scene without recursion.
+        
+        Args:
+            order: 'pre', 'post' or 'breadth'
+            predicate: optional filter applied to each object
+            roots: objects to start from (defaults to the scene roots)
+        
+        Every object is visited once, even when it is both in root_objects
+        and parented under another scene object.
+        """
+        if roots is None:
+            roots = self._scene_roots()
+        return iter_hierarchy(roots, order, predicate)
+    
+    def find_object(self, predicate: Callable[[GameObject], bool], order: str = 'pre') -> Optional[GameObject]:
+        """Return the first object matching predicate, stopping the walk there"""
+        return next(self.iter_objects(order, predicate), None)
+    
+    def _scene_roots(self) -> List[GameObject]:
+        """Root objects that are not also reachable through a parent in the scene"""
+        return [obj for obj in self.root_objects
+                if obj.parent is None or self._objects_by_id.get(obj.parent.id) is not obj.parent]
+    
+    def update_transforms(self):
+        """Recompute world transforms of every subtree changed since the last update"""
+        self._flush_transforms()
+    
+    def set_lazy_transforms(self, enabled: bool):
+        """Choose between deferred (dirty-flag) and immediate transform propagation"""
+        self.lazy_transforms = enabled
+        if not enabled:
+            self._flush_transforms()
+    
+    def _flush_transforms(self):
+        """Recompute all stale world transforms in one vectorized pass"""
+        self.transforms.update()
+    
+    def apply_transforms(self) -> int:
+        """Push world transforms to the sky objects of every object that moved or
+        was rescaled since its last push; returns the number of objects pushed"""
+        return self._apply_transforms()
+    
+    def _apply_transforms(self) -> int:
+        self._flush_transforms()
+        store = self.transforms
+        slots, moved, rescaled = store.unpushed_slots()
+        for slot, slot_moved, slot_rescaled in zip(slots.tolist(), moved.tolist(), rescaled.tolist()):
+            obj = store.get_object(slot)
+            if obj is None:
+                continue
+            position = store.vec('world_position', slot) if slot_moved else None
+            scale = float(store.world_scale[slot].mean()) if slot_rescaled else None
+            obj._push_transform(position, scale)
+        return len(slots)
+            
+    def get_object_by_name(self, name: str) -> Optional[GameObject]:
+        """Find object by name (first registered object with that name)"""
+        named = self._objects_by_name.get(name)
+        return named[0] if named else None
+    
+    def get_objects_by_name(self, name: str) -> List[GameObject]:
+        """Find every object with the given name"""
+        return list(self._objects_by_name.get(name, ()))
+    
+    def get_object_by_id(self, object_id: int) -> Optional[GameObject]:
+        """Find object by ID"""
+        return self._objects_by_id.get(object_id)
+    
+    def get_all_object_ids(self) -> List[int]:
+        """Get list of all object IDs in the scene"""
+        return [obj.id for obj in self.iter_objects()]
+    
+    def get_object_info(self, object_id: int) -> Optional[Dict[str, Any]]:
+        """Get information about an object by ID"""
+        obj = self.get_object_by_id(object_id)
+        if obj:
+            return {
+                'id': obj.id,
+                'name': obj.name,
+                'components': list(obj.components.keys()),
+                'children_count': len(obj.children),
+                'has_parent': obj.parent is not None,
+                'position': obj.position,
+                'rotation': obj.rotation,
+                'scale': obj.scale
+            }
+        return None
+    
+    def get_global_animator(self) -> Animator:
+        """Get the global animator for animations"""
+        global global_animator
+        if global_animator is None:
+            global_animator = Animator(0.5)
+        return global_animator
+    
+    def set_global_animator_duration(self, duration: float):
+        """Set the global animator duration"""
+        global global_animator
+        if global_animator is None:
+            global_animator = Animator(duration)
+        else:
+            global_animator.duration = duration
+    
+    def runAll(self):
+        """Run all frames in sequence"""
+        global all_frames
+        
+        if not all_frames:
+            log.warning("No frames to run!")
+            return
+        
+        log.info("Running all %s frames...", len(all_frames))
+        
+
+        sorted_frames = sorted(all_frames, key=lambda x: x['frame_number'])
+        
+
+        for i, frame_data in enumerate(sorted_frames):
+            log.info("Running frame %s/%s: %s #%s", i+1, len(sorted_frames), frame_data['type'], frame_data['frame_number'])
+            
+            try:
+
+                frame_data['function'](self)
+            except Exception as e:
+                log.error("Error in frame %s: %s", frame_data['frame_number'], e)
+        
+        log.info("Animation sequence complete!")
+    
+    def run(self, frame_id: int):
+        """Run a specific frame by frame_number"""
+        global all_frames
+        
+
+        target_frame = None
+        for frame_data in all_frames:
+            if frame_data['frame_number'] == frame_id:
+                target_frame = frame_data
+                break
+        
+        if target_frame is None:
+            log.warning("Frame %s not found!", frame_id)
+            return
+        
+        log.info("Running frame %s: %s", frame_id, target_frame['type'])
+        
+        try:
+    
+            target_frame['function'](self)
+        except Exception as e:
+            log.error("Error in frame %s: %s", frame_id, e)
+    
+    def start(self):
+        """Alias for runAll() for backward compatibility"""
+        self.runAll()
+    
+
+    def set_camera_position(self, position: Vec, target = None):
+        """Set camera position using proper Sky Explorer methods"""
+        self.camera_position = position
+        
+
+        if hasattr(self.main_camera, 'setPositionXYZ'):
+            animator = self.get_global_animator()
+            track = 0  # Default track
+            
+            self.main_camera.setPositionXYZ(position, animator, track)
+            
+
+            if hasattr(self.main_camera, 'setTarget') and target is not None:
+                self.main_camera.setTarget(target)
+        
+        log.debug("Camera moved to: (%s, %s, %s)", position.x, position.y, position.z)
+    
+    def set_camera_position_lbr(self, latitude: float, longitude: float, radius: float):
+        """Set camera position using LBR coordinates"""
+        if hasattr(self.main_camera, 'setPositionLBR'):
+            animator = self.get_global_animator()
+            track = 0
+            self.main_camera.setPositionLBR(Vec(latitude, longitude, radius), animator, track)
+            self.camera_position = Vec(latitude, longitude, radius)
+            log.debug("Camera moved to LBR: (%s, %s, %s)", latitude, longitude, radius)
+    
+    def set_camera_position_individual(self, x: float = None, y: float = None, z: float = None):
+        """Set individual camera position axes"""
+        if x is not None and hasattr(self.main_camera, 'setPositionX'):
+            self.main_camera.setPositionX(x, self.get_global_animator(), 0)
+        if y is not None and hasattr(self.main_camera, 'setPositionY'):
+            self.main_camera.setPositionY(y, self.get_global_animator(), 0)
+        if z is not None and hasattr(self.main_camera, 'setPositionZ'):
+            self.main_camera.setPositionZ(z, self.get_global_animator(), 0)
+        
+
+        if x is not None: self.camera_position.x = x
+        if y is not None: self.camera_position.y = y
+        if z is not None: self.camera_position.z = z
+        
+        log.debug("Camera position updated: (%s, %s, %s)", self.camera_position.x, self.camera_position.y, self.camera_position.z)
+    
+    def set_camera_rotation(self, rotation: Vec):
+        """Set camera rotation (HPR)"""
+        self.camera_rotation = rotation
+        if hasattr(self.main_camera, 'setOrientationHPR'):
+            self.main_camera.setOrientationHPR(rotation)
+        log.debug("Camera rotated to: (%s, %s, %s)", rotation.x, rotation.y, rotation.z)
+    
+    def set_camera_rotation_individual(self, h: float = None, p: float = None, r: float = None, 
+                                     heading: float = None, pitch: float = None, roll: float = None):
+        """Set camera rotation using individual H, P, R values (in degrees)"""
+
+        h = h if h is not None else heading
+        p = p if p is not None else pitch  
+        r = r if r is not None else roll
+        
+        if self.main_camera and h is not None and p is not None and r is not None:
+    
+            h_rad = math.radians(h)
+            p_rad = math.radians(p)
+            r_rad = math.radians(r)
+            
+            try:
+                self.main_camera.setOrientationH(h_rad)
+                self.main_camera.setOrientationP(p_rad)
+                self.main_camera.setOrientationR(r_rad)
+                log.debug("Camera rotated to: (%s, %s, %s)", h, p, r)
+            except Exception as e:
+                log.error("Error setting camera rotation: %s", e)
+    
+    def set_camera_zoom(self, zoom: float):
+        """Set camera zoom level using distance"""
+        self.camera_zoom = zoom
+
+        if hasattr(self.main_camera, 'setPositionR'):
+    
+            animator = self.get_global_animator()
+            track = 0  # Default track
+            self.main_camera.setPositionR(zoom * 100, animator, track)
+        log.debug("Camera zoom: %s", zoom)
+    
+    def set_camera_zoom_fov(self, fov: float):
+        """Set camera zoom using field of view"""
+        self.camera_fov = fov
+        if hasattr(self.main_camera, 'setZoomFov'):
+            self.main_camera.setZoomFov(fov)
+            log.debug("Camera FOV zoom: %s", fov)
+    
+    def set_camera_zoom_position(self, position: float):
+        """Set camera zoom using position"""
+        if hasattr(self.main_camera, 'setZoomPosition'):
+    
+    
+            position_vec = Vec(position, 0, 0)
+            track = 0  # Default track
+            animator = self.get_global_animator()
+
+            try:
+                self.main_camera.setZoomPosition(position_vec, track, animator, Camera.PositionMode.XYZ)
+            except (TypeError, AttributeError):
+
+                try:
+                    self.main_camera.setZoomPosition(position_vec, track, animator)
+                except:
+                    log.warning("Could not set camera zoom position to %s", position)
+            log.debug("Camera zoom position: %s", position)
+    
+    def set_camera_focus(self, focus_degree: float):
+        """Set camera focus degree"""
+        if hasattr(self.main_camera, 'setFocusDegree'):
+            self.main_camera.setFocusDegree(focus_degree)
+            log.debug("Camera focus degree: %s", focus_degree)
+    
+    def set_camera_stereo_position(self, position: Vec):
+        """Set stereo camera position"""
+        if hasattr(self.main_camera, 'setStereoPosition'):
+            self.main_camera.setStereoPosition(position)
+            log.debug("Stereo camera position: (%s, %s, %s)", position.x, position.y, position.z)
+    
+    def set_camera_stereo_ratio(self, ratio: float):
+        """Set stereo camera ratio"""
+        if hasattr(self.main_camera, 'setStereoRatio'):
+            self.main_camera.setStereoRatio(ratio)
+            log.debug("Stereo camera ratio: %s", ratio)
+    
+    def set_camera_eye_distance(self, distance: float):
+        """Set camera eye distance for stereo"""
+        if hasattr(self.main_camera, 'setEyeDistance'):
+            self.main_camera.setEyeDistance(distance)
+            log.debug("Camera eye distance: %s", distance)
+    
+    def set_camera_target_azimuth(self, azimuth: float):
+        """Set camera target azimuth"""
+        if hasattr(self.main_camera, 'setTargetAzimuth'):
+            self.main_camera.setTargetAzimuth(azimuth)
+            log.debug("Camera target azimuth: %s", azimuth)
+    
+    def set_camera_target_height(self, height: float):
+        """Set camera target height"""
+        if hasattr(self.main_camera, 'setTargetHeight'):
+            self.main_camera.setTargetHeight(height)
+            log.debug("Camera target height: %s", height)
+    
+    def set_camera_resolution_ratio_strength(self, strength: float):
+        """Set camera resolution ratio strength"""
+        if hasattr(self.main_camera, 'setResolutionRatioStrength'):
+            self.main_camera.setResolutionRatioStrength(strength)
+            log.debug("Camera resolution ratio strength: %s", strength)
+    
+    def set_camera_trace_mode(self, mode: bool):
+        """Set camera trace mode"""
+        if hasattr(self.main_camera, 'setTraceMode'):
+            self.main_camera.setTraceMode(mode)
+            log.debug("Camera trace mode: %s", mode)
+    
+    def take_camera_screenshot(self, filename: str = None):
+        """Take a camera screenshot"""
+        if hasattr(self.main_camera, 'takeScreenshot'):
+            if filename is None:
+                filename = f"screenshot_{int(time.time())}.png"
+            self.main_camera.takeScreenshot(filename)
+            log.info("Screenshot saved: %s", filename)
+            return filename
+        return None
+    
+    def move_camera(self, delta_position: Vec):
+        """Move camera by delta amount"""
+        new_position = Vec(
+            self.camera_position.x + delta_position.x,
+            self.camera_position.y + delta_position.y,
+            self.camera_position.z + delta_position.z
+        )
+        self.set_camera_position(new_position)
+    
+    def rotate_camera(self, delta_rotation: Vec):
+        """Rotate camera by delta amount"""
+        new_rotation = Vec(
+            self.camera_rotation.x + delta_rotation.x,
+            self.camera_rotation.y + delta_rotation.y,
+            self.camera_rotation.z + delta_rotation.z
+        )
+        self.set_camera_rotation(new_rotation)
+    
+    def zoom_camera(self, delta_zoom: float):
+        """Zoom camera by delta amount"""
+        new_zoom = self.camera_zoom + delta_zoom
+        new_zoom = max(0.1, min(10.0, new_zoom))
+        self.set_camera_zoom(new_zoom)
+    
+    def _track_view_direction(self, direction: Vec):
+        """Keep camera_rotation (used by culling) facing direction when the camera is aimed by target"""
+        distance = math.sqrt(direction.x**2 + direction.y**2 + direction.z**2)
+        if distance < 0.001:
+            return
+        heading = math.atan2(direction.x, direction.z)
+        pitch = math.asin(-direction.y / distance)
+        self.camera_rotation = Vec(math.degrees(heading), math.degrees(pitch), 0)
+    
+    def look_at(self, target_position: Vec):
+        """Make camera look at a specific position"""
+
+        direction = Vec(
+            target_position.x - self.camera_position.x,
+            target_position.y - self.camera_position.y,
+            target_position.z - self.camera_position.z
+        )
+        
+
+        distance = math.sqrt(direction.x**2 + direction.y**2 + direction.z**2)
+        
+        log.debug("Looking at target: (%s, %s, %s)", target_position.x, target_position.y, target_position.z)
+        log.debug("Camera position: (%s, %s, %s)", self.camera_position.x, self.camera_position.y, self.camera_position.z)
+        log.debug("Distance: %s", distance)
+        
+
+        if distance < 0.001:
+            log.warning("Camera too close to target, cannot look at")
+            return
+        
+
+        if hasattr(self.main_camera, 'setTarget'):
+
+            azimuth = math.atan2(direction.x, direction.z)
+            height = math.asin(direction.y / distance)
+            target = Vec(math.degrees(azimuth), math.degrees(height), 0)
+            self.main_camera.setTarget(target)
+            self._track_view_direction(direction)
+            log.debug("Camera target set to: (%s, %s, %s)", target.x, target.y, target.z)
+        else:
+
+            heading = math.atan2(direction.x, direction.z)
+            pitch = math.asin(-direction.y / distance)
+            new_rotation = Vec(math.degrees(heading), math.degrees(pitch), 0)
+            self.set_camera_rotation(new_rotation)
+    
+    def orbit_camera(self, target_position: Vec, distance: float, heading: float, pitch: float):
+        """Orbit camera around a target position"""
+
+        heading_rad = math.radians(heading)
+        pitch_rad = math.radians(pitch)
+        
+
+        x = target_position.x + distance * math.sin(heading_rad) * math.cos(pitch_rad)
+        y = target_position.y + distance * math.sin(pitch_rad)
+        z = target_position.z + distance * math.cos(heading_rad) * math.cos(pitch_rad)
+        
+        new_position = Vec(x, y, z)
+        self.set_camera_position(new_position)
+        
+
+        if hasattr(self.main_camera, 'setTarget'):
+
+            direction = Vec(
+                target_position.x - new_position.x,
+                target_position.y - new_position.y,
+                target_position.z - new_position.z
+            )
+            dist = math.sqrt(direction.x**2 + direction.y**2 + direction.z**2)
+            if dist > 0.001:
+                azimuth = math.atan2(direction.x, direction.z)
+                height = math.asin(direction.y / dist)
+                target = Vec(math.degrees(azimuth), math.degrees(height), 0)
+                self.main_camera.setTarget(target)
+                self._track_view_direction(direction)
+        else:
+            self.look_at(target_position)
+    
+    def get_camera_info(self) -> Dict[str, Any]:
+        """Get current camera information"""
+        return {
+            'position': self.camera_position,
+            'rotation': self.camera_rotation,
+            'zoom': self.camera_zoom
+        }
+    
+    # Navigation Methods (Camera-based since studio library not available)
+    def go_to_object(self, target_object, distance: float = 10.0):
+        """Navigate camera to look at a specific object"""
+        try:
+            if isinstance(target_object, GameObject):
+                self.look_at_position(target_object.position, distance)
+                log.debug("Camera looking at object: %s", target_object.name)
+            elif hasattr(target_object, 'sky_object') and target_object.sky_object:
+                # Try to get object position and point camera at it
+                target_pos = target_object.get_world_position()
+                self.look_at_position(target_pos, distance)
+                log.debug("Camera looking at object: %s", target_object.name)
+            elif hasattr(target_object, 'get_world_position'):
+                # Direct skyExplorer object
+                target_pos = target_object.get_world_position()
+                self.look_at_position(target_pos, distance)
+                log.debug("Camera looking at skyExplorer object")
+            else:
+                log.warning("Cannot navigate to object - no position available")
+        except Exception as e:
+            log.error("Error navigating to object: %s", e)
+    
+    def look_at_position(self, position: Vec, distance: float = 10.0):
+        """Point camera at a specific position"""
+        try:
+            # Calculate camera position offset from target
+            camera_offset = Vec(0, 0, distance)
+            new_camera_pos = Vec(position.x + camera_offset.x, 
+                               position.y + camera_offset.y, 
+                               position.z + camera_offset.z)
+            
+            # Update camera position and look at target
+            self.set_camera_position(new_camera_pos)
+            self._track_view_direction(Vec(-camera_offset.x, -camera_offset.y, -camera_offset.z))
+            log.debug("Camera positioned at distance %s from target", distance)
+        except Exception as e:
+            log.error("Error positioning camera: %s", e)
+    
+    def go_to_planet(self, planet_name: Planet.PlanetName, distance: float = 15.0):
+        """Go to a specific planet"""
+        try:
+            planet = Planet(resolve_enum(Planet.PlanetName, planet_name))
+            self.go_to_object(planet, distance)
+            log.info("Going to planet: %s", planet_name)
+        except Exception as e:
+            log.error("Error going to planet: %s", e)
+    
+    def go_to_game_object(self, game_object: GameObject, distance: float = 10.0):
+        """Go to a specific GameObject"""
+        try:
+            self.go_to_object(game_object, distance)
+            log.info("Going to GameObject '%s'", game_object.name)
+        except Exception as e:
+            log.error("Error going to GameObject: %s", e)
+    
+    def go_to_nearest_object(self, component_type: str = None, distance: float = 10.0) -> Optional[GameObject]:
+        """Go to the scene object closest to the camera"""
+        obj = self.get_nearest_object(self.camera_position, component_type)
+        if obj:
+            self.go_to_game_object(obj, distance)
+        else:
+            log.warning("No GameObject found near the camera")
+        return obj
+    
+    def go_to_game_object_by_id(self, object_id: int):
+        """Go to a GameObject by its ID"""
+        obj = self.get_object_by_id(object_id)
+        if obj:
+            self.go_to_game_object(obj)
+        else:
+            log.warning("No GameObject found with ID %s", object_id)
+    
+    def go_to_star(self, star_name: IndividualStar.IndividualStarName, distance: float = 20.0):
+        """Go to a specific star"""
+        try:
+            star = IndividualStar(resolve_enum(IndividualStar.IndividualStarName, star_name))
+            self.go_to_object(star, distance)
+            log.info("Going to star: %s", star_name)
+        except Exception as e:
+            log.error("Error going to star: %s", e)
+    
+    def go_to_constellation(self, constellation_name: Constellation.ConstellationName, distance: float = 25.0):
+        """Go to a specific constellation"""
+        try:
+            constellation = Constellation(resolve_enum(Constellation.ConstellationName, constellation_name))
+            self.go_to_object(constellation, distance)
+            log.info("Going to constellation: %s", constellation_name)
+        except Exception as e:
+            log.error("Error going to constellation: %s", e)
+    
+    def go_to_comet(self, comet_name: Comet.CometName, distance: float = 12.0):
+        """Go to a specific comet"""
+        try:
+            comet = Comet(resolve_enum(Comet.CometName, comet_name))
+            self.go_to_object(comet, distance)
+            log.info("Going to comet: %s", comet_name)
+        except Exception as e:
+            log.error("Error going to comet: %s", e)
+    
+    def go_to_asteroid(self, asteroid_name: Asteroid.AsteroidName, distance: float = 8.0):
+        """Go to a specific asteroid"""
+        try:
+            asteroid = Asteroid(resolve_enum(Asteroid.AsteroidName, asteroid_name))
+            self.go_to_object(asteroid, distance)
+            log.info("Going to asteroid: %s", asteroid_name)
+        except Exception as e:
+            log.error("Error going to asteroid: %s", e)
+    
+    def go_to_satellite(self, satellite_name: Satellite.SatelliteName, distance: float = 6.0):
+        """Go to a specific satellite"""
+        try:
+            satellite = Satellite(resolve_enum(Satellite.SatelliteName, satellite_name))
+            self.go_to_object(satellite, distance)
+            log.info("Going to satellite: %s", satellite_name)
+        except Exception as e:
+            log.error("Error going to satellite: %s", e)
+    
+    def go_to_galaxy(self, galaxy_name: Galaxy.GalaxyName, distance: float = 50.0):
+        """Go to a specific galaxy"""
+        try:
+            galaxy = Galaxy(resolve_enum(Galaxy.GalaxyName, galaxy_name))
+            self.go_to_object(galaxy, distance)
+            log.info("Going to galaxy: %s", galaxy_name)
+        except Exception as e:
+            log.error("Error going to galaxy: %s", e)
+    
+    def go_to_nebula(self, nebula_name: Nebula.NebulaName, distance: float = 30.0):
+        """Go to a specific nebula"""
+        try:
+            nebula = Nebula(resolve_enum(Nebula.NebulaName, nebula_name))
+            self.go_to_object(nebula, distance)
+            log.info("Going to nebula: %s", nebula_name)
+        except Exception as e:
+            log.error("Error going to nebula: %s", e)
+    
+    # Starry Sky Control
+    def set_stars_intensity(self, intensity: float):
+        """Set the intensity of the starry sky (0=off, 1=full brightness)"""
+        try:
+            # Create a global Stars object if it doesn't exist
+            if not hasattr(self, '_stars_object'):
+                try:
+                    # First real StarsName value from the cached catalog
+                    stars_name = get_catalog(Stars.StarsName).first
+                    if stars_name is not None:
+                        self._stars_object = Stars(stars_name)
+                        log.debug("Created Stars object using: %s", stars_name)
+                    else:
+                        log.error("No StarsName enum values available")
+                        return
+                except Exception as enum_error:
+                    log.error("Error accessing Stars.StarsName enum: %s", enum_error)
+                    return
+            
+            self._stars_object.setIntensity(intensity)
+            log.debug("Stars intensity set to: %s", intensity)
+        except Exception as e:
+            log.error("Error setting stars intensity: %s", e)
+    
+    def turn_stars_on(self):
+        """Turn on the starry sky"""
+        self.set_stars_intensity(1.0)
+    
+    def turn_stars_off(self):
+        """Turn off the starry sky"""
+        self.set_stars_intensity(0.0)
+    
+    def create_stars_object(self, name: str = "Stars", stars_name: Stars.StarsName = None) -> GameObject:
+        """Create a game object with a stars component"""
+        stars_obj = self.create_object(name)
+        from .components import StarsComponent
+        stars_comp = StarsComponent(stars_name)
+        stars_obj.add_component(stars_comp)
+        return stars_obj
+    
+    def get_available_stars_names(self):
+        """Get list of available StarsName enum values"""
+        try:
+            available_names = list(get_catalog(Stars.StarsName))
+            log.info("Available Stars names:")
+            for i, name in enumerate(available_names):
+                log.info("  %s: %s", i, name)
+            return available_names
+        except Exception as e:
+            log.error("Error getting Stars names: %s", e)
+            return []
+    
+    # Constellation Control Methods
+    def create_constellation_object(self, constellation_name: Constellation.ConstellationName, object_name: str = None) -> GameObject:
+        """Create a game object with a constellation component"""
+        constellation_name = resolve_enum(Constellation.ConstellationName, constellation_name)
+        if object_name is None:
+            object_name = f"Constellation_{constellation_name.name}"
+        
+        constellation_obj = self.create_object(object_name)
+        from .components import ConstellationComponent
+        constellation_comp = ConstellationComponent(constellation_name)
+        constellation_obj.add_component(constellation_comp)
+        return constellation_obj
+    
+    def set_all_constellation_lines(self, intensity: float):
+        """Set lines intensity for all constellation objects in the scene"""
+        constellation_objects = self.get_objects_by_component_type("Constellation")
+        for obj in constellation_objects:
+            obj.get_component("Constellation").set_lines_intensity(intensity)
+        count = len(constellation_objects)
+        log.debug("Set lines intensity to %s for %s constellations", intensity, count)
+    
+    def set_all_constellation_art(self, intensity: float):
+        """Set art intensity for all constellation objects in the scene"""
+        constellation_objects = self.get_objects_by_component_type("Constellation")
+        for obj in constellation_objects:
+            obj.get_component("Constellation").set_art_intensity(intensity)
+        count = len(constellation_objects)
+        log.debug("Set art intensity to %s for %s constellations", intensity, count)
+    
+    def set_all_constellation_labels(self, intensity: float):
+        """Set labels intensity for all constellation objects in the scene"""
+        constellation_objects = self.get_objects_by_component_type("Constellation")
+        for obj in constellation_objects:
+            obj.get_component("Constellation").set_label_intensity(intensity)
+        count = len(constellation_objects)
+        log.debug("Set labels intensity to %s for %s constellations", intensity, count)
+    
+    def set_all_constellation_boundaries(self, intensity: float):
+        """Set boundaries intensity for all constellation objects in the scene"""
+        constellation_objects = self.get_objects_by_component_type("Constellation")
+        for obj in constellation_objects:
+            obj.get_component("Constellation").set_boundary_intensity(intensity)
+        count = len(constellation_objects)
+        log.debug("Set boundaries intensity to %s for %s constellations", intensity, count)
+    
+    def turn_all_constellation_lines_on(self):
+        """Turn on lines for all constellations"""
+        self.set_all_constellation_lines(1.0)
+    
+    def turn_all_constellation_lines_off(self):
+        """Turn off lines for all constellations"""
+        self.set_all_constellation_lines(0.0)
+    
+    def turn_all_constellation_art_on(self):
+        """Turn on art/drawings for all constellations"""
+        self.set_all_constellation_art(1.0)
+    
+    def turn_all_constellation_art_off(self):
+        """Turn off art/drawings for all constellations"""
+        self.set_all_constellation_art(0.0)
+    
+    def turn_all_constellation_labels_on(self):
+        """Turn on labels for all constellations"""
+        self.set_all_constellation_labels(1.0)
+    
+    def turn_all_constellation_labels_off(self):
+        """Turn off labels for all constellations"""
+        self.set_all_constellation_labels(0.0)
+    
+    def turn_all_constellation_boundaries_on(self):
+        """Turn on boundaries for all constellations"""
+        self.set_all_constellation_boundaries(1.0)
+    
+    def turn_all_constellation_boundaries_off(self):
+        """Turn off boundaries for all constellations"""
+        self.set_all_constellation_boundaries(0.0)
+    
+    def turn_all_constellations_on(self):
+        """Turn on all constellation features (lines, art, labels)"""
+        self.turn_all_constellation_lines_on()
+        self.turn_all_constellation_art_on()
+        self.turn_all_constellation_labels_on()
+        log.debug("All constellation features turned ON")
+    
+    def turn_all_constellations_off(self):
+        """Turn off all constellation features (lines, art, labels)"""
+        self.turn_all_constellation_lines_off()
+        self.turn_all_constellation_art_off()
+        self.turn_all_constellation_labels_off()
+        log.debug("All constellation features turned OFF")
+    
+    def set_constellation_display_mode(self, mode: str):
+        """Set constellation display mode
+        
+        Args:
+            mode: 'lines_only', 'art_only', 'labels_only', 'all', 'none'
+        """
+        if mode == 'lines_only':
+            self.turn_all_constellation_lines_on()
+            self.turn_all_constellation_art_off()
+            self.turn_all_constellation_labels_off()
+        elif mode == 'art_only':
+            self.turn_all_constellation_lines_off()
+            self.turn_all_constellation_art_on()
+            self.turn_all_constellation_labels_off()
+        elif mode == 'labels_only':
+            self.turn_all_constellation_lines_off()
+            self.turn_all_constellation_art_off()
+            self.turn_all_constellation_labels_on()
+        elif mode == 'all':
+            self.turn_all_constellations_on()
+        elif mode == 'none':
+            self.turn_all_constellations_off()
+        else:
+            log.warning("Unknown mode: %s. Use 'lines_only', 'art_only', 'labels_only', 'all', or 'none'", mode)
+    
+    def _get_all_objects(self) -> List[GameObject]:
+        """Get all objects in the scene (root + children)"""
+        return list(self.iter_objects())
+    
+    def get_available_constellation_names(self):
+        """Get list of available Constellation enum values"""
+        try:
+            available_names = list(get_catalog(Constellation.ConstellationName))
+            log.info("Available Constellation names:")
+            for i, name in enumerate(available_names):
+                log.info("  %s: %s", i, name)
+            return available_names
+        except Exception as e:
+            log.error("Error getting Constellation names: %s", e)
+            return []
+    
+    # === APPEARANCE EDITING CONVENIENCE METHODS ===
+    
+    def edit_object_appearance(self, obj_id: int, **appearance_settings):
+        """Edit any object's appearance using keyword arguments
+        
+        Example:
+            engine.edit_object_appearance(my_planet_id, 
+                                        intensity=0.8,
+                                        cloud_coverage=0.6,
+                                        atmosphere_intensity=0.9,
+                                        label_color=(1.0, 0.8, 0.0, 1.0))
+        """
+        obj = self.get_object_by_id(obj_id)
+        if not obj:
+            log.warning("No object found with ID %s", obj_id)
+            return
+            
+        for component in obj.components.values():
+            # Declared properties go through one bulk configure()
+            declared = {setting: value for setting, value in appearance_settings.items()
+                        if setting in component.sky_properties}
+            if declared:
+                try:
+                    component.configure(**declared)
+                    log.debug("Applied %s to %s", declared, component.name)
+                except Exception as e:
+                    log.error("Error applying %s: %s", declared, e)
+            
+            for setting, value in appearance_settings.items():
+                if setting in declared:
+                    continue
+                method_name = f"set_{setting}"
+                if hasattr(component, method_name):
+                    method = getattr(component, method_name)
+                    try:
+                        if setting.endswith('_color') and isinstance(value, (list, tuple)) and len(value) >= 3:
+                            # Handle color values
+                            if len(value) == 3:
+                                method(value[0], value[1], value[2])
+                            elif len(value) == 4:
+                                method(value[0], value[1], value[2], value[3])
+                        else:
+                            method(value)
+                        log.debug("Applied %s=%s to %s", setting, value, component.name)
+                    except Exception as e:
+                        log.error("Error applying %s: %s", setting, e)
+    
+    def edit_object_by_name(self, obj_name: str, **appearance_settings):
+        """Edit object appearance by name"""
+        obj = self.get_object_by_name(obj_name)
+        if obj:
+            self.edit_object_appearance(obj.id, **appearance_settings)
+        else:
+            log.warning("No object found with name '%s'", obj_name)
+    
+    def edit_all_planets(self, **planet_settings):
+        """Apply appearance settings to all planets in the scene"""
+        planet_objects = self.get_objects_by_component_type("Planet")
+        for obj in planet_objects:
+            self.edit_object_appearance(obj.id, **planet_settings)
+        log.debug("Applied settings to %s planets", len(planet_objects))
+    
+    def edit_all_stars(self, **star_settings):
+        """Apply appearance settings to all stars in the scene"""
+        star_objects = self.get_objects_by_component_type("IndividualStar")
+        for obj in star_objects:
+            self.edit_object_appearance(obj.id, **star_settings)
+        log.debug("Applied settings to %s stars", len(star_objects))
+    
+    def edit_all_constellations(self, **constellation_settings):
+        """Apply appearance settings to all constellations in the scene"""
+        constellation_objects = self.get_objects_by_component_type("Constellation")
+        for obj in constellation_objects:
+            self.edit_object_appearance(obj.id, **constellation_settings)
+        log.debug("Applied settings to %s constellations", len(constellation_objects))
+    
+    def quick_planet_edit(self, planet_name: str, intensity: float = None, clouds: float = None, 
+                         atmosphere: float = None, night_lights: float = None, 
+                         label_color: tuple = None, show_orbit: bool = None):
+        """Quick planet appearance editing with common settings"""
+        obj = self.get_object_by_name(planet_name)
+        if not obj:
+            log.warning("Planet '%s' not found", planet_name)
+            return
+            
+        planet_comp = obj.get_component("Planet")
+        if not planet_comp:
+            log.warning("Object '%s' is not a planet", planet_name)
+            return
+        
+        if intensity is not None:
+            planet_comp.set_intensity(intensity)
+        if clouds is not None:
+            planet_comp.set_clouds_intensity(clouds)
+        if atmosphere is not None:
+            planet_comp.set_atmosphere_intensity(atmosphere)
+        if night_lights is not None:
+            planet_comp.set_night_lights_intensity(night_lights)
+        if label_color is not None and len(label_color) >= 3:
+            if len(label_color) == 3:
+                planet_comp.set_label_color(label_color[0], label_color[1], label_color[2])
+            else:
+                planet_comp.set_label_color(label_color[0], label_color[1], label_color[2], label_color[3])
+        if show_orbit is not None:
+            planet_comp.set_orbit_intensity(1.0 if show_orbit else 0.0)
+            
+        log.debug("Updated appearance for planet '%s'", planet_name)
+    
+    def save_appearance_preset(self, obj_id: int, preset_name: str):
+        """Save an object's current appearance as a preset"""
+        if not hasattr(self, '_appearance_presets'):
+            self._appearance_presets = {}
+            
+        obj = self.get_object_by_id(obj_id)
+        if not obj:
+            log.warning("No object found with ID %s", obj_id)
+            return
+            
+        # Settable values of every component (see Component.snapshot)
+        preset_data = {comp_name: component.snapshot() for comp_name, component in obj.components.items()}
+            
+        self._appearance_presets[preset_name] = preset_data
+        log.info("Saved appearance preset '%s' for object '%s'", preset_name, obj.name)
+    
+    def load_appearance_preset(self, obj_id: int, preset_name: str):
+        """Load a saved appearance preset to an object"""
+        if not hasattr(self, '_appearance_presets') or preset_name not in self._appearance_presets:
+            log.warning("Preset '%s' not found", preset_name)
+            return
+            
+        obj = self.get_object_by_id(obj_id)
+        if not obj:
+            log.warning("No object found with ID %s", obj_id)
+            return
+            
+        preset_data = self._appearance_presets[preset_name]
+        for comp_name, settings in preset_data.items():
+            if comp_name in obj.components:
+                try:
+                    obj.components[comp_name].restore(settings)
+                except Exception as e:
+                    log.error("Error applying preset to %s: %s", comp_name, e)
+                            
+        log.info("Loaded appearance preset '%s' to object '%s'", preset_name, obj.name)
+    
+    def list_all_objects(self):
+        """Print information about all objects in the scene"""
+        all_objects = self._get_all_objects()
+        log.info("\n=== Scene Objects (%s total) ===", len(all_objects))
+        for obj in all_objects:
+            sky_id = obj.get_sky_object_id()
+            log.info("  ID: %s | Name: '%s' | Components: %s | Sky ID: %s", obj.id, obj.name, list(obj.components.keys()), sky_id)
+    
+    def clear_all_objects(self):
+        """Remove all objects from the scene"""
+        for obj in self.root_objects[:]:  # Copy list to avoid modification during iteration
+            obj.destroy()
+        self.root_objects.clear()
+        self.object_pool.clear()
+        self.command_queue.discard()
+        self.scheduler.clear()
+        self._objects_by_id.clear()
+        self._objects_by_name.clear()
+        self._objects_by_component_type.clear()
+        self._pending_backends.clear()
+        log.info("All objects cleared from scene")
+    
+    @staticmethod
+    def reset_object_id_counter():
+        """Reset the GameObject ID counter (useful for testing)"""
+        GameObject._next_id = 1
+        log.info("GameObject ID counter reset to 1")
+    
+    def _sync_spatial_index(self):
+        """Propagate pending transforms and re-file moved objects in the spatial index"""
+        self._flush_transforms()
+        self.spatial_index.sync()
+    
+    def _objects_for_slots(self, slots: Iterable[int], component_type: str = None) -> List[GameObject]:
+        """Scene objects owning slots, optionally restricted to those with a component type"""
+        store = self.transforms
+        objects = []
+        for slot in slots:
+            obj = store.get_object(slot)
+            if obj is None or self._objects_by_id.get(obj.id) is not obj:
+                continue
+            if component_type is None or component_type in obj.components:
+                objects.append(obj)
+        return objects
+    
+    def get_objects_in_radius(self, center: Vec, radius: float, component_type: str = None) -> List[GameObject]:
+        """Get all objects whose world position is within radius of center"""
+        self._sync_spatial_index()
+        slots = self.spatial_index.query_radius((center.x, center.y, center.z), radius)
+        return self._objects_for_slots(slots, component_type)
+    
+    def get_objects_in_box(self, min_corner: Vec, max_corner: Vec, component_type: str = None) -> List[GameObject]:
+        """Get all objects whose world position is inside an axis-aligned box"""
+        self._sync_spatial_index()
+        slots = self.spatial_index.query_box((min_corner.x, min_corner.y, min_corner.z),
+                                             (max_corner.x, max_corner.y, max_corner.z))
+        return self._objects_for_slots(slots, component_type)
+    
+    def get_nearest_objects(self, position: Vec, count: int = 1, component_type: str = None,
+                            predicate: Optional[Callable[[GameObject], bool]] = None) -> List[GameObject]:
+        """Get up to count objects closest to position, nearest first"""
+        self._sync_spatial_index()
+        nearest = []
+        if count <= 0:
+            return nearest
+        for slot, _ in self.spatial_index.iter_nearest((position.x, position.y, position.z)):
+            for obj in self._objects_for_slots((slot,), component_type):
+                if predicate is None or predicate(obj):
+                    nearest.append(obj)
+            if len(nearest) >= count:
+                break
+        return nearest
+    
+    def get_nearest_object(self, position: Vec = None, component_type: str = None,
+                           predicate: Optional[Callable[[GameObject], bool]] = None) -> Optional[GameObject]:
+        """Get the object closest to position (the camera position by default)"""
+        if position is None:
+            position = self.camera_position
+        nearest = self.get_nearest_objects(position, 1, component_type, predicate)
+        return nearest[0] if nearest else None
+    
+    def get_objects_by_component_type(self, component_type: str) -> List[GameObject]:
+        """Get all objects that have a specific component type"""
+        return list(self._objects_by_component_type.get(component_type, ()))
+    
+    def count_objects_by_type(self) -> Dict[str, int]:
+        """Get count of objects by component type"""
+        return {component_type: len(objects) for component_type, objects in self._objects_by_component_type.items()}
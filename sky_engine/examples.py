@@ -0,0 +1,281 @@
+"""Demo of the engine's navigation and stars features (python -m sky_engine)"""
+from time import sleep
+
+from ._backend import *
+from .components import PlanetComponent, TextComponent
+from .engine import SkyEngine
+
+# Example usage
+def test_sky_engine():
+    """Test the Sky Engine with new navigation and stars features"""
+    print("=== Testing Sky Engine ===")
+    
+    # Create engine
+    engine = SkyEngine()
+    
+    # Test Stars Control
+    print("\n=== Testing Stars Control ===")
+    
+    # Show available stars names for debugging
+    print("Checking available Stars names...")
+    available_stars = engine.get_available_stars_names()
+    
+    # Create stars object (will use first available name automatically)
+    stars_obj = engine.create_stars_object("Starry Sky")
+    stars_comp = stars_obj.get_component("Stars")
+    
+    print("Turning stars on...")
+    engine.turn_stars_on()
+    sleep(2)
+    
+    print("Dimming stars to 50%...")
+    engine.set_stars_intensity(0.5)
+    sleep(2)
+    
+    print("Turning stars off...")
+    engine.turn_stars_off()
+    sleep(2)
+    
+    print("Turning stars back on...")
+    engine.turn_stars_on()
+    
+    # Test Navigation
+    print("\n=== Testing Navigation ===")
+    
+    print("Going to Jupiter...")
+    engine.go_to_planet(Planet.PlanetName.Jupiter)
+    sleep(3)
+    
+    print("Going to the Sun...")
+    engine.go_to_star(IndividualStar.IndividualStarName.Sun)
+    sleep(3)
+    
+    print("Going to Ursa Major constellation...")
+    engine.go_to_constellation(Constellation.ConstellationName.UMa)
+    sleep(3)
+    
+    # Create objects to show what we're looking at
+    print("\n=== Creating Visual Objects ===")
+    
+    # Create a planet
+    planet_obj = engine.create_object("Jupiter")
+    planet_comp = PlanetComponent(Planet.PlanetName.Jupiter)
+    planet_obj.add_component(planet_comp)
+    planet_comp.set_clouds_intensity(0.8)
+    # planet_comp.set_atmosphere_intensity(0.5)  # Will implement if needed
+    
+    # Test Constellation Control
+    print("\n=== Testing Constellation Control ===")
+    
+    # Show available constellation names for debugging
+    print("Checking available Constellation names...")
+    available_constellations = engine.get_available_constellation_names()
+    
+    # Create multiple constellations using first few available names
+    try:
+        if len(available_constellations) >= 3:
+            constellation1 = engine.create_constellation_object(available_constellations[0], "Constellation_1")
+            constellation2 = engine.create_constellation_object(available_constellations[1], "Constellation_2") 
+            constellation3 = engine.create_constellation_object(available_constellations[2], "Constellation_3")
+            print(f"Created 3 constellations: {available_constellations[0]}, {available_constellations[1]}, {available_constellations[2]}")
+        else:
+            print(f"Warning: Only {len(available_constellations)} constellation names available")
+    except Exception as e:
+        print(f"Error creating constellations: {e}")
+        # Try with specific names as fallback
+        try:
+            orion = engine.create_constellation_object(Constellation.ConstellationName.Ori, "Orion")
+            ursa_major = engine.create_constellation_object(Constellation.ConstellationName.UMa, "Ursa Major")
+            cassiopeia = engine.create_constellation_object(Constellation.ConstellationName.Cas, "Cassiopeia")
+            print("Created 3 constellations using fallback names: Orion, Ursa Major, Cassiopeia")
+        except Exception as fallback_error:
+            print(f"Fallback constellation creation also failed: {fallback_error}")
+    
+    sleep(2)
+    
+    print("Testing individual constellation control...")
+    # Try to get the first constellation for individual testing
+    try:
+        if len(available_constellations) >= 1:
+            first_constellation_comp = constellation1.get_component("Constellation")
+            first_constellation_comp.turn_all_on()
+            sleep(1)
+            
+            print(f"Turning off {available_constellations[0]} art, keeping lines and labels...")
+            first_constellation_comp.turn_art_off()
+        else:
+            print("No constellations available for individual testing")
+    except:
+        print("Individual constellation control test skipped")
+    sleep(2)
+    
+    print("Testing global constellation control...")
+    print("Turn off all constellation lines...")
+    engine.turn_all_constellation_lines_off()
+    sleep(2)
+    
+    print("Turn off all constellation labels...")
+    engine.turn_all_constellation_labels_off()
+    sleep(2)
+    
+    print("Show only constellation art...")
+    engine.set_constellation_display_mode('art_only')
+    sleep(2)
+    
+    print("Show only constellation lines...")
+    engine.set_constellation_display_mode('lines_only')
+    sleep(2)
+    
+    print("Turn everything back on...")
+    engine.turn_all_constellations_on()
+    
+    # Create text
+    text_obj = engine.create_object("Navigation Demo")
+    text_comp = TextComponent("Sky Engine Navigation Demo")
+    text_obj.add_component(text_comp)
+    text_comp.set_position(Vec(0, 20, 0))
+    
+    print("\n=== Demo Running ===")
+    print("Features demonstrated:")
+    print("- Starry sky control (on/off/dimming)")
+    print("- Navigation to planets, stars, constellations")
+    print("- Component-based object creation")
+    print("- Dynamic intensity controls")
+    
+    # Demonstrate more navigation
+    print("\nDemonstrating more navigation features...")
+    sleep(2)
+    
+    print("Going to Mars...")
+    engine.go_to_planet(Planet.PlanetName.Mars)
+    sleep(2)
+    
+    print("Going to Saturn...")
+    engine.go_to_planet(Planet.PlanetName.Saturn)
+    sleep(2)
+    
+    print("Returning to Earth view...")
+    engine.go_to_planet(Planet.PlanetName.Earth)
+    
+    print("\n=== Test completed! ===")
+    print("Sky Engine now supports:")
+    print("✓ Stars on/off control")
+    print("✓ Navigation to planets, stars, constellations")
+    print("✓ Full constellation control (lines, art, labels, boundaries)")
+    print("✓ Individual and global constellation management") 
+    print("✓ Constellation display modes")
+    print("✓ Component-based architecture")
+    print("✓ Animation and keyframe system")
+    print("✓ Camera controls")
+    
+    print("\nConstellation Features:")
+    print("  • Individual control: constellation_comp.turn_lines_on/off()")
+    print("  • Global control: engine.turn_all_constellation_lines_on/off()")
+    print("  • Display modes: engine.set_constellation_display_mode('lines_only')")
+    print("  • Supported modes: 'lines_only', 'art_only', 'labels_only', 'all', 'none'")
+    
+    print("\nDebugging Features:")
+    print("  • Check available stars: engine.get_available_stars_names()")
+    print("  • Check available constellations: engine.get_available_constellation_names()")
+    print("  • Stars auto-detect: StarsComponent() uses first available name")
+    print("  • Robust error handling for missing enum values")
+    
+    print("\nID Management Features:")
+    print("  • Every GameObject has unique ID: obj.id")
+    print("  • Find by ID: engine.get_object_by_id(id)")
+    print("  • Get all IDs: engine.get_all_object_ids()")
+    print("  • Object info: obj.get_info() or engine.get_object_info(id)")
+    print("  • Navigate to GameObjects: engine.go_to_game_object(obj)")
+    
+    # Demonstrate ID features
+    print(f"\n=== ID Management Demo ===")
+    all_ids = engine.get_all_object_ids()
+    print(f"Created {len(all_ids)} objects with IDs: {all_ids}")
+    
+    # Show info for first object
+    if all_ids:
+        first_id = all_ids[0]
+        obj_info = engine.get_object_info(first_id)
+        print(f"First object info: {obj_info}")
+        
+        # Try to navigate to first object if it has a sky object  
+        first_obj = engine.get_object_by_id(first_id)
+        if first_obj and first_obj.get_sky_object_id():
+            print(f"Navigating to first object: {first_obj.name}")
+            engine.go_to_game_object(first_obj)
+    
+    # Show object type counts
+    type_counts = engine.count_objects_by_type()
+    print(f"Objects by type: {type_counts}")
+    
+    # List all objects in scene
+    engine.list_all_objects()
+    
+    # Find objects by component type
+    planet_objects = engine.get_objects_by_component_type("Planet")
+    print(f"Found {len(planet_objects)} planet objects")
+    
+    constellation_objects = engine.get_objects_by_component_type("Constellation")
+    print(f"Found {len(constellation_objects)} constellation objects")
+    
+    # Test Appearance Editing
+    print("\\n=== Testing Appearance Editing ===")
+    
+    # Edit planet appearance using individual methods
+    if planet_objects:
+        planet_obj = planet_objects[0]
+        planet_comp = planet_obj.get_component("Planet")
+        
+        print(f"Editing appearance of planet: {planet_obj.name}")
+        planet_comp.set_clouds_intensity(0.8)
+        planet_comp.set_atmosphere_intensity(0.9) 
+        planet_comp.set_night_lights_intensity(0.5)
+        planet_comp.set_label_color(1.0, 0.8, 0.0, 1.0)  # Golden label
+        planet_comp.set_orbit_intensity(1.0)
+        sleep(2)
+        
+        # Test convenience method
+        print("Testing quick planet edit...")
+        engine.quick_planet_edit(planet_obj.name, 
+                               intensity=0.9,
+                               clouds=0.6, 
+                               atmosphere=0.7,
+                               night_lights=0.3,
+                               label_color=(0.0, 1.0, 1.0, 1.0),  # Cyan label
+                               show_orbit=True)
+        sleep(2)
+        
+        # Test appearance presets
+        print("Testing appearance presets...")
+        engine.save_appearance_preset(planet_obj.id, "my_planet_style")
+        sleep(1)
+        
+        # Change appearance then restore
+        planet_comp.set_clouds_intensity(0.1)
+        planet_comp.set_atmosphere_intensity(0.1)
+        print("Changed appearance, now restoring preset...")
+        sleep(1)
+        engine.load_appearance_preset(planet_obj.id, "my_planet_style")
+        sleep(2)
+    
+    # Test bulk editing
+    print("Testing bulk appearance editing...")
+    engine.edit_all_planets(intensity=0.8, clouds_intensity=0.5)
+    engine.edit_all_constellations(lines_intensity=1.0, art_intensity=0.3)
+    
+    print("\\n=== Features Summary ===")
+    print("✓ Comprehensive appearance editing system added!")
+    print("✓ Individual component control")
+    print("✓ Bulk editing methods")
+    print("✓ Quick edit shortcuts")
+    print("✓ Appearance presets")
+    print("✓ Color control for labels and effects")
+    print("✓ Works with all object types (planets, stars, constellations)")
+    
+    print("\\nAppearance Editing Examples:")
+    print("  • Individual: planet_comp.set_clouds_intensity(0.8)")
+    print("  • Quick edit: engine.quick_planet_edit('Earth', clouds=0.6)")
+    print("  • Bulk edit: engine.edit_all_planets(intensity=0.8)")
+    print("  • Flexible: engine.edit_object_by_name('Mars', atmosphere_intensity=0.9)")
+    print("  • Presets: engine.save_appearance_preset(obj_id, 'my_style')")
+    print("  • Colors: planet_comp.set_label_color(1.0, 0.8, 0.0, 1.0)") 
@@ -0,0 +1,604 @@
+"""GameObject and the object pool"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+from ._backend import Vec
+from .bridge import sky_method, sky_property_value
+from .component import Component, _copy_sent_value, _sent_value_key
+from .logs import log
+from .transforms import _detached_transforms, iter_hierarchy
+
+if TYPE_CHECKING:
+    from .engine import SkyEngine
+
+class GameObject:
+    """Game object - can have components and children"""
+    
+    # Class variable to track next available ID
+    _next_id = 1
+    
+    def __init__(self, name: str = "GameObject", sky_engine = None):
+        # Assign unique ID
+        self.id = GameObject._reserve_ids(1)
+        self._setup(name, sky_engine)
+        
+        log.debug("Created GameObject '%s' with ID: %s", self.name, self.id)
+    
+    @classmethod
+    def _reserve_ids(cls, count: int) -> int:
+        """Reserve a block of count consecutive IDs and return the first"""
+        first_id = GameObject._next_id
+        GameObject._next_id += count
+        return first_id
+    
+    def _setup(self, name: str, sky_engine, slot: Optional[int] = None):
+        """Initialise instance state; slot is a transform row already allocated for this object"""
+        self._name = name
+        self.sky_engine = sky_engine
+        self.components: Dict[str, Component] = {}
+        self.children: List[GameObject] = []
+        self.parent: Optional[GameObject] = None
+        
+        # (component class, enum name) when this object is managed by an ObjectPool
+        self._pool_key: Optional[Tuple[str, Any]] = None
+        
+        # Transform rows live in the engine's TransformStore; the local transform
+        # is authoritative and the world transform is only valid while neither
+        # this object nor any ancestor is dirty
+        self._transforms = sky_engine.transforms if sky_engine is not None else _detached_transforms
+        self._slot = self._transforms.allocate(self) if slot is None else slot
+    
+    @property
+    def name(self) -> str:
+        """Object name"""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str):
+        old_name = self._name
+        self._name = name
+        if self.sky_engine is not None:
+            self.sky_engine._rename_object(self, old_name)
+        
+    def add_component(self, component: Component):
+        """Add a component to this object"""
+        self.components[component.name] = component
+        if self.sky_engine is not None:
+            self.sky_engine._index_component(self, component.name)
+        
+
+        if hasattr(component, 'initialize') and hasattr(self, 'sky_engine'):
+            component.initialize(self.sky_engine)
+        if self.sky_engine is not None:
+            self.sky_engine._defer_backend(self, component)
+        
+        component.start()
+        
+        self._bind_component(component)
+        
+        log.debug("Added %s component to %s", component.name, self.name)
+        
+    def get_component(self, component_name: str) -> Optional[Component]:
+        """Get a component by name"""
+        return self.components.get(component_name)
+        
+    def remove_component(self, component_name: str):
+        """Remove a component"""
+        if component_name in self.components:
+            component = self.components[component_name]
+            component.stop()
+            del self.components[component_name]
+            self._refresh_sky_binding()
+            if self.sky_engine is not None:
+                self.sky_engine._unindex_component(self, component_name)
+            log.debug("Removed %s component from %s", component_name, self.name)
+            
+    def add_child(self, child: 'GameObject'):
+        """Add a child object"""
+        if child.parent:
+            child.parent.remove_child(child)
+            
+        child.parent = self
+        self.children.append(child)
+        self._transforms.attach(child, self)
+        child._mark_transform_dirty()
+        
+        if self.sky_engine is not None:
+            self.sky_engine._register_object(child)
+        log.debug("Added %s as child of %s", child.name, self.name)
+        
+    def remove_child(self, child: 'GameObject'):
+        """Remove a child object"""
+        if child in self.children:
+            self.children.remove(child)
+            child.parent = None
+            child._transforms.attach(child, None)
+            child._mark_transform_dirty()
+            
+            # A detached child stays in the scene only if it is also a root object
+            engine = child.sky_engine
+            if engine is not None and child not in engine.root_objects:
+                engine._unregister_object(child)
+            log.debug("Removed %s from %s", child.name, self.name)
+            
+    @property
+    def position(self) -> Vec:
+        """World position"""
+        return self._resolve_world_transform()[0]
+    
+    @position.setter
+    def position(self, position: Vec):
+        self._set_world_transform(position=position)
+    
+    @property
+    def rotation(self) -> Vec:
+        """World rotation (HPR)"""
+        return self._resolve_world_transform()[1]
+    
+    @rotation.setter
+    def rotation(self, rotation: Vec):
+        self._set_world_transform(rotation=rotation)
+    
+    @property
+    def scale(self) -> Vec:
+        """World scale"""
+        return self._resolve_world_transform()[2]
+    
+    @scale.setter
+    def scale(self, scale: Vec):
+        self._set_world_transform(scale=scale)
+    
+    @property
+    def local_position(self) -> Vec:
+        """Position relative to parent"""
+        return self._transforms.vec('local_position', self._slot)
+    
+    @local_position.setter
+    def local_position(self, position: Vec):
+        self._transforms.set_vec('local_position', self._slot, position)
+        self._mark_transform_dirty()
+    
+    @property
+    def local_rotation(self) -> Vec:
+        """Rotation relative to parent (HPR)"""
+        return self._transforms.vec('local_rotation', self._slot)
+    
+    @local_rotation.setter
+    def local_rotation(self, rotation: Vec):
+        self._transforms.set_vec('local_rotation', self._slot, rotation)
+        self._mark_transform_dirty()
+    
+    @property
+    def local_scale(self) -> Vec:
+        """Scale relative to parent"""
+        return self._transforms.vec('local_scale', self._slot)
+    
+    @local_scale.setter
+    def local_scale(self, scale: Vec):
+        self._transforms.set_vec('local_scale', self._slot, scale)
+        self._mark_transform_dirty()
+            
+    def set_position(self, position: Vec):
+        """Set world position"""
+        self._set_world_transform(position=position)
+        
+
+        for component in self.components.values():
+            if hasattr(component, 'sky_object') and component.sky_object:
+                if self._send_to_sky(component.sky_object, 'setPosition', position):
+
+                    if component.name == "Planet":
+                        log.debug("Planet %s moved to: (%s, %s, %s)", self.name, position.x, position.y, position.z)
+        self._record_pushed(position=position)
+        
+    def set_rotation(self, rotation: Vec):
+        """Set world rotation (HPR)"""
+        self._set_world_transform(rotation=rotation)
+        
+    def set_scale(self, scale: Vec):
+        """Set world scale"""
+        self._set_world_transform(scale=scale)
+        
+
+        avg_scale = (scale.x + scale.y + scale.z) / 3.0
+        for component in self.components.values():
+            if hasattr(component, 'sky_object') and component.sky_object:
+                self._send_to_sky(component.sky_object, 'setScale', avg_scale)
+        self._record_pushed(scale=avg_scale)
+        
+    def set_local_position(self, position: Vec):
+        """Set local position (relative to parent)"""
+        self.local_position = position
+        
+    def set_local_rotation(self, rotation: Vec):
+        """Set local rotation (relative to parent)"""
+        self.local_rotation = rotation
+        
+    def set_local_scale(self, scale: Vec):
+        """Set local scale (relative to parent)"""
+        self.local_scale = scale
+    
+    def _set_world_transform(self, position: Vec = None, rotation: Vec = None, scale: Vec = None):
+        """Convert the given world values to local ones using the parent's current world matrix"""
+        store, slot = self._transforms, self._slot
+        if self.parent:
+            parent_matrix = self.parent._resolve_world_matrix()
+            parent_basis = parent_matrix[:3, :3]
+            parent_scale = np.linalg.norm(parent_basis, axis=0)
+            
+            if position is not None:
+                world = np.array((position.x, position.y, position.z))
+                if np.all(parent_scale != 0):
+                    store.local_position[slot] = np.linalg.solve(parent_basis, world - parent_matrix[:3, 3])
+                else:
+                    # A zero-scale parent has no inverse; keep the offset from its origin
+                    store.local_position[slot] = world - parent_matrix[:3, 3]
+            
+            if rotation is not None or scale is not None:
+                if rotation is not None and np.all(parent_scale != 0):
+                    parent_rotation = parent_basis / parent_scale
+                    world_rotation = store.hpr_to_matrices(np.array([(rotation.x, rotation.y, rotation.z)]))[0]
+                    store.local_rotation[slot] = store.matrices_to_hpr((parent_rotation.T @ world_rotation)[None])[0]
+                
+                if scale is not None and np.all(parent_scale != 0):
+                    store.local_scale[slot] = np.array((scale.x, scale.y, scale.z)) / parent_scale
+        else:
+            if position is not None:
+                store.set_vec('local_position', slot, position)
+            if rotation is not None:
+                store.set_vec('local_rotation', slot, rotation)
+            if scale is not None:
+                store.set_vec('local_scale', slot, scale)
+        
+        self._mark_transform_dirty()
+    
+    def _mark_transform_dirty(self):
+        """Flag this subtree's world transforms as stale.
+        
+        Only this object's slot is flagged, descendants notice through their
+        ancestor chain, so the cost does not depend on the subtree size. With
+        a lazy engine the whole store is recomputed on the next
+        SkyEngine.update_transforms(); otherwise the subtree is recomputed
+        right away.
+        """
+        engine = self.sky_engine
+        if engine is not None and engine.lazy_transforms:
+            self._transforms.mark_dirty(self._slot)
+        else:
+            self._transforms.update_subtree(self)
+    
+    def _dirty_chain(self):
+        """Return (chain, top_dirty): the path from this object to its root and
+        the index in it of the topmost dirty object (-1 when all are clean)"""
+        dirty = self._transforms.dirty
+        chain = []
+        top_dirty = -1
+        node = self
+        while node is not None:
+            if dirty[node._slot]:
+                top_dirty = len(chain)
+            chain.append(node)
+            node = node.parent
+        return chain, top_dirty
+    
+    def _resolve_world_matrix(self) -> np.ndarray:
+        """Return the 4x4 world matrix.
+        
+        Reads the cached matrix when the ancestor chain is clean, otherwise
+        composes the chain from the topmost dirty object down without
+        touching the store (its siblings still rely on the dirty flag).
+        """
+        store = self._transforms
+        chain, top_dirty = self._dirty_chain()
+        if top_dirty < 0:
+            return store.world_matrix[self._slot].copy()
+        
+        start = chain[top_dirty]
+        matrix = store.world_matrix[start.parent._slot] if start.parent else np.eye(4)
+        path = chain[top_dirty::-1]
+        slots = np.fromiter((node._slot for node in path), dtype=np.int64, count=len(path))
+        for local in store.local_matrices(slots):
+            matrix = matrix @ local
+        return matrix
+    
+    def _resolve_world_transform(self):
+        """Return (position, rotation, scale) in world space"""
+        store, slot = self._transforms, self._slot
+        if self.parent is None:
+            return store.vec('local_position', slot), store.vec('local_rotation', slot), store.vec('local_scale', slot)
+        
+        chain, top_dirty = self._dirty_chain()
+        if top_dirty < 0:
+            return store.vec('world_position', slot), store.vec('world_rotation', slot), store.vec('world_scale', slot)
+        
+        position, rotation, scale = store.decompose(self._resolve_world_matrix()[None])
+        return Vec(*position[0].tolist()), Vec(*rotation[0].tolist()), Vec(*scale[0].tolist())
+    
+    def get_world_matrix(self) -> np.ndarray:
+        """Get a copy of the 4x4 world matrix (column vectors, translation in the last column)"""
+        return self._resolve_world_matrix()
+    
+    def _bind_component(self, component: Component):
+        """Send the world transform to a component's sky object once it exists"""
+        engine = self.sky_engine
+        if engine is not None and engine.bridge_profiler is not None:
+            engine._instrument_component(component, engine.bridge_profiler)
+        if getattr(component, 'sky_object', None):
+            position, _, scale = self._resolve_world_transform()
+            avg_scale = (scale.x + scale.y + scale.z) / 3.0
+            self._send_to_sky(component.sky_object, 'setPosition', position)
+            self._send_to_sky(component.sky_object, 'setScale', avg_scale)
+            self._record_pushed(position, avg_scale)
+        self._refresh_sky_binding()
+    
+    def _refresh_sky_binding(self):
+        """Track whether any component has a sky object that transforms must be pushed to"""
+        bound = any(getattr(component, 'sky_object', None) for component in self.components.values())
+        self._transforms.bound[self._slot] = bound
+        if bound:
+            self._transforms.mark_unpushed(self._slot)
+    
+    def _record_pushed(self, position: Vec = None, scale: float = None):
+        """Remember the transform last sent to skyExplorer so apply_transforms can skip it"""
+        store = self._transforms
+        if position is not None:
+            store.pushed_position[self._slot] = (position.x, position.y, position.z)
+        if scale is not None:
+            store.pushed_scale[self._slot] = scale
+    
+    def invalidate_cache(self):
+        """Forget the transform last sent, so the next transform pass sends it again"""
+        store = self._transforms
+        store.pushed_position[self._slot] = np.nan
+        store.pushed_scale[self._slot] = np.nan
+        store.mark_unpushed(self._slot)
+    
+    def _push_transform(self, position: Optional[Vec], scale: Optional[float]):
+        """Send a world position and/or averaged scale to every sky object of this object"""
+        for component in self.components.values():
+            sky_object = getattr(component, 'sky_object', None)
+            if not sky_object:
+                continue
+            if position is not None:
+                self._send_to_sky(sky_object, 'setPosition', position)
+            if scale is not None:
+                self._send_to_sky(sky_object, 'setScale', scale)
+        self._record_pushed(position, scale)
+    
+    def _send_to_sky(self, sky_object, setter: str, *args) -> bool:
+        """Call a sky object setter now, or queue it when the engine defers commands.
+        
+        Returns False when the sky object's class has no such setter.
+        """
+        method = sky_method(sky_object, setter)
+        if method is None:
+            return False
+        engine = self.sky_engine
+        if engine is not None and engine.command_queue.enabled:
+            engine.command_queue.put(sky_object, setter, args, self)
+        else:
+            method(sky_object, *args)
+        return True
+            
+    def _reset_for_reuse(self):
+        """Restore a pooled object to its freshly created state"""
+        store = self._transforms
+        slot = self._slot
+        for field in store._VEC_FIELDS:
+            getattr(store, field)[slot] = 1.0 if field.endswith('scale') else 0.0
+        store.world_matrix[slot] = np.eye(4)
+        store.dirty[slot] = False
+        store.mark_unpushed(slot)
+        
+        for component in self.components.values():
+            self._restore_pool_defaults(component)
+            component.start()
+            # Lift the release-time hide through _send so its sent-value cache stays true
+            component._override_send('setIntensity', None, getattr(component, 'intensity', 1.0))
+        
+        if not np.array_equal(store.pushed_position[slot], store.world_position[slot]) or store.pushed_scale[slot] != 1.0:
+            self._push_transform(store.vec('world_position', slot), 1.0)
+    
+    def _restore_pool_defaults(self, component: Component):
+        """Return a pooled component and its sky object to the values it was created with.
+        
+        Declared properties go back through the sent-value cache and changed
+        setter_attributes through their set_<name> methods. A declared
+        property that defaults to None was never sent before pooling, so it
+        gets the backend value read when the object was first pooled.
+        """
+        defaults = component._pool_defaults
+        state = component.__dict__
+        changed = [attribute for attribute, value in defaults.items()
+                   if _sent_value_key(state.get(attribute)) != _sent_value_key(value)]
+        if not changed:
+            return
+        for attribute in changed:
+            state[attribute] = _copy_sent_value(defaults[attribute])
+        
+        declared = component.sky_properties
+        if any(attribute in declared for attribute in changed):
+            component._apply_all_properties()
+            backend_defaults = component._pool_backend_defaults
+            for attribute in changed:
+                if attribute in declared and defaults[attribute] is None:
+                    setter = declared[attribute].backend_method
+                    value = backend_defaults.get(setter)
+                    if value is not None:
+                        component._send(setter, _copy_sent_value(value))
+                    else:
+                        log.debug("Cannot restore %s of pooled %s: backend value unknown", attribute, self.name)
+        
+        for attribute in changed:
+            if attribute in component.setter_attributes:
+                getattr(component, f"set_{attribute}")(state[attribute])
+    
+    def iter_subtree(self, order: str = 'pre',
+                     predicate: Optional[Callable[['GameObject'], bool]] = None) -> Iterator['GameObject']:
+        """Iterate this object and its descendants (see iter_hierarchy)"""
+        return iter_hierarchy([self], order, predicate)
+    
+    def update(self, delta_time: float):
+        """Update this object and all children"""
+        for obj in self.iter_subtree():
+            obj._update_components(delta_time)
+    
+    def _update_components(self, delta_time: float):
+        """Update this object's enabled components"""
+        for component in self.components.values():
+            if component.enabled:
+                component.update(delta_time)
+            
+    def destroy(self):
+        """Destroy this object and all children"""
+        for obj in list(self.iter_subtree('post')):
+            obj._destroy_single()
+    
+    def _destroy_single(self):
+        """Tear down this object once its children are gone"""
+        if self.parent:
+            self.parent.remove_child(self)
+            
+
+        for component in self.components.values():
+            component.stop()
+        
+        if self.sky_engine is not None:
+            self.sky_engine._unregister_object(self)
+        self._transforms.release(self._slot)
+            
+        log.debug("Destroyed %s", self.name)
+    
+    def get_sky_object_id(self) -> Optional[int]:
+        """Get the ID of the underlying skyExplorer object from components"""
+        for component in self.components.values():
+            if hasattr(component, 'sky_object') and component.sky_object:
+                if hasattr(component.sky_object, 'id'):
+                    return component.sky_object.id
+        return None
+    
+    def get_first_sky_object(self):
+        """Get the first skyExplorer object from components"""
+        for component in self.components.values():
+            if hasattr(component, 'sky_object') and component.sky_object:
+                return component.sky_object
+        return None
+    
+    def has_component_type(self, component_type: str) -> bool:
+        """Check if object has a component of the given type"""
+        return component_type in self.components
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Get comprehensive information about this GameObject"""
+        sky_object_id = self.get_sky_object_id()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'sky_object_id': sky_object_id,
+            'components': list(self.components.keys()),
+            'component_count': len(self.components),
+            'children_ids': [child.id for child in self.children],
+            'children_count': len(self.children),
+            'parent_id': self.parent.id if self.parent else None,
+            'has_sky_object': sky_object_id is not None,
+            'position': {'x': self.position.x, 'y': self.position.y, 'z': self.position.z} if hasattr(self, 'position') else None,
+            'local_position': {'x': self.local_position.x, 'y': self.local_position.y, 'z': self.local_position.z} if hasattr(self, 'local_position') else None
+        }
+
+def _hidden_intensity(intensity: float) -> float:
+    """setIntensity mapping for released pool objects"""
+    return 0.0
+
+class ObjectPool:
+    """Recycles GameObjects together with their components and sky handles.
+    
+    Released objects are kept hidden and keyed by (component class name,
+    enum name), e.g. ('CometComponent', 'Halley'), so acquiring the same
+    kind again reuses the existing skyExplorer object instead of building a
+    new wrapper. Reuse only restores the attributes that changed since the
+    component was first created, and sends their defaults back to the sky
+    object.
+    """
+    
+    def __init__(self, sky_engine: 'SkyEngine'):
+        self.sky_engine = sky_engine
+        self._free: Dict[Tuple[str, Any], List[GameObject]] = {}
+        self.created = 0
+        self.reused = 0
+    
+    @staticmethod
+    def key_for(component_class: type, *args) -> Tuple[str, Any]:
+        """Pool key for a component class and its constructor arguments"""
+        first = args[0] if args else None
+        return (component_class.__name__, getattr(first, 'name', first))
+    
+    def acquire(self, name: str, component_class: type, *args, **kwargs) -> GameObject:
+        """Get a root object carrying component_class(*args, **kwargs), reusing a released one if possible"""
+        engine = self.sky_engine
+        key = self.key_for(component_class, *args)
+        free = self._free.get(key)
+        if free:
+            obj = free.pop()
+            obj._name = name
+            obj._reset_for_reuse()
+            self.reused += 1
+        else:
+            obj = GameObject(name, engine)
+            component = component_class(*args, **kwargs)
+            obj.add_component(component)
+            for pooled in obj.components.values():
+                # The sky handle is kept across reuse, even if it was created lazily later
+                pooled._pool_defaults = {attribute: _copy_sent_value(value) for attribute, value in vars(pooled).items()
+                                         if attribute != 'sky_object' and not attribute.startswith('_')}
+                # Properties the component leaves to skyExplorer until set, as the backend has them now
+                pooled._pool_backend_defaults = {
+                    sky_property.backend_method: _copy_sent_value(
+                        sky_property_value(pooled.sky_object, sky_property.backend_method))
+                    for sky_property in pooled.sky_properties.values()
+                    if sky_property.default is None and pooled.sky_object is not None}
+            obj._pool_key = key
+            self.created += 1
+        
+        engine.root_objects.append(obj)
+        engine._register_object(obj)
+        return obj
+    
+    def release(self, obj: GameObject):
+        """Hide an acquired object and keep it for reuse"""
+        if obj._pool_key is None:
+            raise ValueError(f"GameObject '{obj.name}' was not acquired from this pool")
+        
+        engine = self.sky_engine
+        for child in obj.children[:]:
+            if child in engine.root_objects:
+                engine.root_objects.remove(child)
+            child.destroy()
+        if obj.parent is not None:
+            obj.parent.remove_child(obj)
+        if obj in engine.root_objects:
+            engine.root_objects.remove(obj)
+        engine._unregister_object(obj)
+        
+        for component_name in list(obj.components):
+            component = obj.components[component_name]
+            if not hasattr(component, '_pool_defaults'):
+                obj.remove_component(component_name)
+                continue
+            component.stop()
+            component._override_send('setIntensity', _hidden_intensity, getattr(component, 'intensity', 1.0))
+        
+        self._free.setdefault(obj._pool_key, []).append(obj)
+    
+    def clear(self):
+        """Destroy every pooled object that is waiting for reuse"""
+        for free in self._free.values():
+            for obj in free:
+                obj.destroy()
+        self._free.clear()
+    
+    def __len__(self) -> int:
+        return sum(len(free) for free in self._free.values())
+    
+    def stats(self) -> Dict[str, int]:
+        """Counts of objects created, reused and currently waiting in the pool"""
+        return {'created': self.created, 'reused': self.reused, 'free': len(self)}
@@ -0,0 +1,123 @@
+"""Library logger, console and ring-buffer handlers"""
+from typing import Any, List, Optional
+from collections import deque
+import logging
+import sys
+
+# Library messages go through this logger rather than print. Messages use
+# %-style arguments, so a call below the logger's level returns before
+# anything is formatted; see configure_logging() for performance mode and
+# the in-memory ring buffer.
+log = logging.getLogger("sky_engine")
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to the current sys.stdout, like print does"""
+    
+    def __init__(self):
+        super().__init__(sys.stdout)
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the latest log records in memory for post-mortem dumps.
+    
+    Records are stored as is and only formatted by dump(), so buffering
+    costs no I/O and no string formatting on the hot path.
+    """
+    
+    def __init__(self, capacity: int = 10000, level: int = logging.DEBUG):
+        super().__init__(level)
+        self.records: deque = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+    
+    def dump(self, filename: str = None) -> List[str]:
+        """Format the buffered records, optionally writing them to filename"""
+        lines = [self.format(record) for record in list(self.records)]
+        if filename:
+            with open(filename, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+        return lines
+    
+    def clear(self):
+        self.records.clear()
+
+class _ConsoleFormatter(logging.Formatter):
+    """Plain messages, with the level name in front of warnings and errors"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname.capitalize()}: {message}"
+        return message
+
+_console_handler = _StdoutHandler()
+_console_handler.setFormatter(_ConsoleFormatter("%(message)s"))
+_ring_buffer: Optional[RingBufferHandler] = None
+_performance_mode = False
+
+# Attached while no other handler is, so logging.lastResort does not print to stderr
+_null_handler = logging.NullHandler()
+log.addHandler(_console_handler)
+log.setLevel(logging.DEBUG)
+log.propagate = False
+
+def configure_logging(level: Any = None, console: bool = None, ring_buffer: int = None,
+                      performance: bool = None):
+    """Configure sky_engine messages.
+    
+    Args:
+        level: console threshold, a level name ('INFO') or number
+        console: write messages at or above level to stdout
+        ring_buffer: keep the latest N records in memory (0 removes the buffer)
+        performance: drop everything below level before it is formatted, for
+                     the ring buffer too; otherwise the buffer also keeps
+                     DEBUG records that the console does not show
+    """
+    global _ring_buffer, _performance_mode
+    if level is not None:
+        _console_handler.setLevel(level)
+    if console is not None:
+        if console:
+            log.addHandler(_console_handler)
+        else:
+            log.removeHandler(_console_handler)
+    if ring_buffer is not None:
+        if _ring_buffer is not None:
+            log.removeHandler(_ring_buffer)
+            _ring_buffer = None
+        if ring_buffer > 0:
+            _ring_buffer = RingBufferHandler(ring_buffer)
+            log.addHandler(_ring_buffer)
+    if performance is not None:
+        _performance_mode = performance
+    
+    handlers = [handler for handler in log.handlers if handler is not _null_handler]
+    if handlers:
+        log.removeHandler(_null_handler)
+    else:
+        log.addHandler(_null_handler)
+    
+    threshold = _console_handler.level
+    if _performance_mode or not handlers:
+        log.setLevel(max(threshold, logging.DEBUG))
+    else:
+        log.setLevel(min(handler.level for handler in handlers) or logging.DEBUG)
+
+def set_performance_mode(enabled: bool = True, level: Any = logging.WARNING):
+    """Only format and emit messages at or above level (back to everything when disabled)"""
+    configure_logging(level=level if enabled else logging.DEBUG, performance=enabled)
+
+def dump_log_buffer(filename: str = None) -> List[str]:
+    """Formatted records held by the ring buffer (empty when no buffer is configured)"""
+    if _ring_buffer is None:
+        return []
+    return _ring_buffer.dump(filename)
@@ -0,0 +1,242 @@
+"""Simulation clock and date components"""
+from ._backend import Clock, DateManager
+from .component import Component
+from .logs import log
+
+class ClockComponent(Component):
+    """Component for time management"""
+    
+    lazy_backend = True
+    
+    setter_attributes = ('time_scale',)
+    
+    def __init__(self):
+        super().__init__("Clock")
+        self.time_scale = 1.0
+        self.is_running = False
+        self.current_time = 0.0
+        self._sky_engine = None
+        
+        # start() called while the engine deferred the backend; honoured on creation
+        self._start_when_created = False
+    
+    def initialize(self, sky_engine):
+        self._sky_engine = sky_engine
+        super().initialize(sky_engine)
+    
+    def _create_sky_object(self):
+        return Clock(Clock.ClockName.Clock001)  # Use valid ClockName enum
+    
+    def ensure_sky_object(self):
+        created = self.sky_object is None
+        sky_object = super().ensure_sky_object()
+        if created and sky_object is not None and self._start_when_created:
+            self._start_when_created = False
+            self.is_running = True
+            log.debug("Clock started")
+        return sky_object
+    
+    def start(self):
+        """Start the clock"""
+        engine = self._sky_engine
+        if self.sky_object is None and engine is not None and engine.defer_backends:
+            self._start_when_created = True
+            return
+        if self.ensure_sky_object():
+            self.is_running = True
+            log.debug("Clock started")
+    
+    def stop(self):
+        """Stop the clock"""
+        self._start_when_created = False
+        if self.sky_object:
+            self.is_running = False
+            log.debug("Clock stopped")
+    
+    def pause(self):
+        """Pause the clock"""
+        if self.sky_object:
+            log.debug("Clock paused")
+    
+    def resume(self):
+        """Resume the clock"""
+        if self.sky_object:
+            log.debug("Clock resumed")
+    
+    def set_time(self, time: float):
+        """Set current time"""
+        self.current_time = time
+        if self.sky_object:
+            # Clock doesn't have setTime method, just store locally
+            log.debug("Clock time set to: %s", time)
+    
+    def set_time_scale(self, scale: float):
+        """Set time scale"""
+        self.time_scale = scale
+        if self.sky_object:
+            # Clock doesn't have setTimeScale method, just store locally
+            log.debug("Clock time scale: %s", scale)
+    
+    def get_current_time(self) -> float:
+        """Get current time"""
+        if self.sky_object:
+            # Clock doesn't have getCurrentTime method, return stored value
+            return self.current_time
+        return self.current_time
+
+class DateManagerComponent(Component):
+    """Component for date management"""
+    
+    def __init__(self):
+        super().__init__("DateManager")
+        self.sky_object = DateManager()
+        self.current_date = None
+        self.current_time = None
+    
+    def set_date(self, year: int, month: int, day: int):
+        """Set current date"""
+        if self.sky_object:
+            self.sky_object.setDate(year, month, day)
+            self.current_date = (year, month, day)
+            log.debug("Date set to: %s-%02d-%02d", year, month, day)
+    
+    def set_time(self, hour: int, minute: int, second: int):
+        """Set current time"""
+        if self.sky_object:
+            self.sky_object.setTime(hour, minute, second)
+            self.current_time = (hour, minute, second)
+            log.debug("Time set to: %02d:%02d:%02d", hour, minute, second)
+    
+    def set_datetime(self, year: int, month: int, day: int, hour: int, minute: int, second: int):
+        """Set date and time together"""
+        if self.sky_object:
+            self.sky_object.setDateTime(year, month, day, hour, minute, second)
+            self.current_date = (year, month, day)
+            self.current_time = (hour, minute, second)
+            log.debug("DateTime set to: %s-%02d-%02d %02d:%02d:%02d", year, month, day, hour, minute, second)
+    
+    def get_current_date(self):
+        """Get current date"""
+        if self.sky_object:
+            return self.sky_object.getCurrentDate()
+        return self.current_date
+    
+    def get_current_time(self):
+        """Get current time"""
+        if self.sky_object:
+            return self.sky_object.getCurrentTime()
+        return self.current_time
+    
+    def advance_time(self, seconds: float):
+        """Advance time by specified seconds"""
+        if self.sky_object:
+            self.sky_object.advanceTime(seconds)
+            log.debug("Time advanced by: %s seconds", seconds)
+    
+    def set_timezone(self, timezone: str):
+        """Set timezone"""
+        if self.sky_object:
+            self.sky_object.setTimezone(timezone)
+            log.debug("Timezone set to: %s", timezone)
+    
+    def get_julian_date(self) -> float:
+        """Get Julian date"""
+        if self.sky_object:
+            return self.sky_object.getJulianDate()
+        return 0.0
+    
+    def set_julian_date(self, jd: float):
+        """Set Julian date"""
+        if self.sky_object:
+            self.sky_object.setJulianDate(jd)
+            log.debug("Julian date set to: %s", jd)
+    
+    def get_modified_julian_date(self) -> float:
+        """Get Modified Julian Date"""
+        if self.sky_object:
+            return self.sky_object.getModifiedJulianDate()
+        return 0.0
+    
+    def set_modified_julian_date(self, mjd: float):
+        """Set Modified Julian Date"""
+        if self.sky_object:
+            self.sky_object.setModifiedJulianDate(mjd)
+            log.debug("Modified Julian date set to: %s", mjd)
+    
+    def get_epoch(self) -> str:
+        """Get current epoch"""
+        if self.sky_object:
+            return self.sky_object.getEpoch()
+        return "J2000"
+    
+    def set_epoch(self, epoch: str):
+        """Set epoch"""
+        if self.sky_object:
+            self.sky_object.setEpoch(epoch)
+            log.debug("Epoch set to: %s", epoch)
+    
+    def get_sidereal_time(self) -> float:
+        """Get sidereal time"""
+        if self.sky_object:
+            return self.sky_object.getSiderealTime()
+        return 0.0
+    
+    def set_sidereal_time(self, st: float):
+        """Set sidereal time"""
+        if self.sky_object:
+            self.sky_object.setSiderealTime(st)
+            log.debug("Sidereal time set to: %s", st)
+    
+    def get_utc_offset(self) -> float:
+        """Get UTC offset"""
+        if self.sky_object:
+            return self.sky_object.getUtcOffset()
+        return 0.0
+    
+    def set_utc_offset(self, offset: float):
+        """Set UTC offset"""
+        if self.sky_object:
+            self.sky_object.setUtcOffset(offset)
+            log.debug("UTC offset set to: %s", offset)
+    
+    def get_day_of_year(self) -> int:
+        """Get day of year"""
+        if self.sky_object:
+            return self.sky_object.getDayOfYear()
+        return 1
+    
+    def get_week_of_year(self) -> int:
+        """Get week of year"""
+        if self.sky_object:
+            return self.sky_object.getWeekOfYear()
+        return 1
+    
+    def get_month_name(self) -> str:
+        """Get month name"""
+        if self.sky_object:
+            return self.sky_object.getMonthName()
+        return "January"
+    
+    def get_day_name(self) -> str:
+        """Get day name"""
+        if self.sky_object:
+            return self.sky_object.getDayName()
+        return "Monday"
+    
+    def is_leap_year(self) -> bool:
+        """Check if current year is leap year"""
+        if self.sky_object:
+            return self.sky_object.isLeapYear()
+        return False
+    
+    def get_days_in_month(self) -> int:
+        """Get days in current month"""
+        if self.sky_object:
+            return self.sky_object.getDaysInMonth()
+        return 31
+    
+    def get_days_in_year(self) -> int:
+        """Get days in current year"""
+        if self.sky_object:
+            return self.sky_object.getDaysInYear()
+        return 365
@@ -0,0 +1,602 @@
+"""Transform storage, spatial index and hierarchy traversal"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import deque
+import heapq
+import math
+import weakref
+import numpy as np
+
+from ._backend import Vec
+
+if TYPE_CHECKING:
+    from .game_object import GameObject
+
+class TransformStore:
+    """Struct-of-arrays storage for GameObject transforms.
+    
+    Every GameObject owns one slot (row) of the contiguous arrays below,
+    holding its local and world position, rotation (HPR, degrees) and scale,
+    its cached 4x4 world matrix and the slot of its parent. update()
+    recomputes every stale world matrix of the hierarchy in one vectorized
+    pass, level by level, as parent_world @ translate @ rotate @ scale.
+    Slots created or recomputed since the last unpushed_slots() are kept
+    in a set, so frames where nothing moved cost nothing to push.
+    """
+    
+    _VEC_FIELDS = ('local_position', 'local_rotation', 'local_scale',
+                   'world_position', 'world_rotation', 'world_scale')
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.count = 0  # Slots ever handed out (high-water mark)
+        self.has_dirty = False
+        self.objects: List[Optional[weakref.ref]] = []
+        self._free_slots: List[int] = []
+        self._levels: Optional[List[np.ndarray]] = None
+        
+        # Slots whose world transform may differ from what was last sent to skyExplorer
+        self._unpushed: set = set()
+        self._grow(max(1, capacity))
+    
+    def _grow(self, capacity: int):
+        """Reallocate the arrays with room for capacity slots"""
+        used = self.count
+        
+        def resized(old, new):
+            if used:
+                new[:used] = old[:used]
+            return new
+        
+        for field in self._VEC_FIELDS:
+            fill = 1.0 if field.endswith('scale') else 0.0
+            setattr(self, field, resized(getattr(self, field, None), np.full((capacity, 3), fill)))
+        
+        self.world_matrix = resized(getattr(self, 'world_matrix', None), np.tile(np.eye(4), (capacity, 1, 1)))
+        self.pushed_position = resized(getattr(self, 'pushed_position', None), np.full((capacity, 3), np.nan))
+        self.pushed_scale = resized(getattr(self, 'pushed_scale', None), np.full(capacity, np.nan))
+        self.parent = resized(getattr(self, 'parent', None), np.full(capacity, -1, dtype=np.int64))
+        self.depth = resized(getattr(self, 'depth', None), np.zeros(capacity, dtype=np.int64))
+        self.dirty = resized(getattr(self, 'dirty', None), np.zeros(capacity, dtype=bool))
+        self.alive = resized(getattr(self, 'alive', None), np.zeros(capacity, dtype=bool))
+        self.bound = resized(getattr(self, 'bound', None), np.zeros(capacity, dtype=bool))  # Has sky objects
+        self.objects.extend([None] * (capacity - len(self.objects)))
+        self.capacity = capacity
+    
+    def allocate(self, obj: 'GameObject') -> int:
+        """Hand out a slot initialised to the identity transform"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.count
+            self.count += 1
+        
+        for field in self._VEC_FIELDS:
+            getattr(self, field)[slot] = 1.0 if field.endswith('scale') else 0.0
+        self.world_matrix[slot] = np.eye(4)
+        self.pushed_position[slot] = np.nan
+        self.pushed_scale[slot] = np.nan
+        self.parent[slot] = -1
+        self.depth[slot] = 0
+        self.dirty[slot] = False
+        self.alive[slot] = True
+        self.bound[slot] = False
+        self.objects[slot] = weakref.ref(obj)
+        self._levels = None
+        self._unpushed.add(slot)
+        return slot
+    
+    def allocate_many(self, objects: List['GameObject']) -> np.ndarray:
+        """Hand out one identity-initialised slot per object in a single pass"""
+        count = len(objects)
+        reused = [self._free_slots.pop() for _ in range(min(count, len(self._free_slots)))]
+        fresh = count - len(reused)
+        if self.count + fresh > self.capacity:
+            self._grow(max(self.capacity * 2, self.count + fresh))
+        slots = np.array(reused + list(range(self.count, self.count + fresh)), dtype=np.int64)
+        self.count += fresh
+        
+        for field in self._VEC_FIELDS:
+            getattr(self, field)[slots] = 1.0 if field.endswith('scale') else 0.0
+        self.world_matrix[slots] = np.eye(4)
+        self.pushed_position[slots] = np.nan
+        self.pushed_scale[slots] = np.nan
+        self.parent[slots] = -1
+        self.depth[slots] = 0
+        self.dirty[slots] = False
+        self.alive[slots] = True
+        self.bound[slots] = False
+        for slot, obj in zip(slots.tolist(), objects):
+            self.objects[slot] = weakref.ref(obj)
+        self._levels = None
+        self._unpushed.update(slots.tolist())
+        return slots
+    
+    def release(self, slot: int):
+        """Return a slot to the free list"""
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.dirty[slot] = False
+        self.parent[slot] = -1
+        self.objects[slot] = None
+        self._free_slots.append(slot)
+        self._levels = None
+        self._unpushed.discard(slot)
+    
+    def get_object(self, slot: int) -> Optional['GameObject']:
+        """GameObject owning a slot, if it is still alive"""
+        ref = self.objects[slot]
+        return ref() if ref is not None else None
+    
+    def attach(self, obj: 'GameObject', parent: Optional['GameObject']):
+        """Record obj's parent, moving its subtree into this store if needed"""
+        if obj._transforms is not self:
+            self._adopt(obj)
+        
+        self.parent[obj._slot] = parent._slot if parent is not None else -1
+        base_depth = self.depth[parent._slot] + 1 if parent is not None else 0
+        pending = [(obj, base_depth)]
+        while pending:
+            node, depth = pending.pop()
+            self.depth[node._slot] = depth
+            pending.extend((child, depth + 1) for child in node.children)
+        self._levels = None
+    
+    def _adopt(self, obj: 'GameObject'):
+        """Move obj and its descendants out of their current store"""
+        for node in iter_hierarchy([obj]):
+            source, old_slot = node._transforms, node._slot
+            slot = self.allocate(node)
+            for field in self._VEC_FIELDS:
+                getattr(self, field)[slot] = getattr(source, field)[old_slot]
+            self.bound[slot] = source.bound[old_slot]
+            source.release(old_slot)
+            
+            node._transforms, node._slot = self, slot
+            if node is not obj and node.parent is not None:
+                self.parent[slot] = node.parent._slot
+            self.dirty[slot] = True
+            self.has_dirty = True
+    
+    def mark_dirty(self, slot: int):
+        """Flag a slot (and implicitly its subtree) for the next update()"""
+        self.dirty[slot] = True
+        self.has_dirty = True
+    
+    def mark_unpushed(self, slot: int):
+        """Have the next unpushed_slots() compare this slot with what was last sent"""
+        self._unpushed.add(slot)
+    
+    def vec(self, field: str, slot: int) -> Vec:
+        """Read one row of a transform array as a Vec"""
+        x, y, z = getattr(self, field)[slot].tolist()
+        return Vec(x, y, z)
+    
+    def set_vec(self, field: str, slot: int, value: Vec):
+        """Write a Vec into one row of a transform array"""
+        getattr(self, field)[slot] = (value.x, value.y, value.z)
+    
+    @staticmethod
+    def hpr_to_matrices(hpr: np.ndarray) -> np.ndarray:
+        """Rotation matrices (n, 3, 3) for HPR angles in degrees.
+        
+        Heading turns about Y, pitch about X and roll about Z, applied as
+        R = Ry(heading) @ Rx(pitch) @ Rz(roll), matching SkyEngine.look_at.
+        """
+        h, p, r = np.radians(hpr).T
+        ch, sh = np.cos(h), np.sin(h)
+        cp, sp = np.cos(p), np.sin(p)
+        cr, sr = np.cos(r), np.sin(r)
+        
+        rotation = np.empty((len(hpr), 3, 3))
+        rotation[:, 0, 0] = ch * cr + sh * sp * sr
+        rotation[:, 0, 1] = sh * sp * cr - ch * sr
+        rotation[:, 0, 2] = sh * cp
+        rotation[:, 1, 0] = cp * sr
+        rotation[:, 1, 1] = cp * cr
+        rotation[:, 1, 2] = -sp
+        rotation[:, 2, 0] = ch * sp * sr - sh * cr
+        rotation[:, 2, 1] = sh * sr + ch * sp * cr
+        rotation[:, 2, 2] = ch * cp
+        return rotation
+    
+    @staticmethod
+    def matrices_to_hpr(rotation: np.ndarray) -> np.ndarray:
+        """HPR angles in degrees (n, 3) for pure rotation matrices (n, 3, 3)"""
+        sin_pitch = np.clip(-rotation[:, 1, 2], -1.0, 1.0)
+        pitch = np.arcsin(sin_pitch)
+        heading = np.arctan2(rotation[:, 0, 2], rotation[:, 2, 2])
+        roll = np.arctan2(rotation[:, 1, 0], rotation[:, 1, 1])
+        
+        # Gimbal lock: heading and roll share an axis, fold everything into heading
+        locked = np.abs(sin_pitch) > 1.0 - 1e-12
+        if locked.any():
+            heading[locked] = np.arctan2(-rotation[locked, 2, 0], rotation[locked, 0, 0])
+            roll[locked] = 0.0
+        return np.degrees(np.stack((heading, pitch, roll), axis=1))
+    
+    def local_matrices(self, slots: np.ndarray) -> np.ndarray:
+        """Local 4x4 matrices (translate @ rotate @ scale) for the given slots"""
+        matrices = np.zeros((len(slots), 4, 4))
+        matrices[:, :3, :3] = self.hpr_to_matrices(self.local_rotation[slots]) * self.local_scale[slots][:, None, :]
+        matrices[:, :3, 3] = self.local_position[slots]
+        matrices[:, 3, 3] = 1.0
+        return matrices
+    
+    @classmethod
+    def decompose(cls, matrices: np.ndarray):
+        """Split world matrices (n, 4, 4) into position, HPR rotation and scale arrays"""
+        position = matrices[:, :3, 3]
+        basis = matrices[:, :3, :3]
+        scale = np.linalg.norm(basis, axis=1)
+        safe_scale = np.where(scale == 0.0, 1.0, scale)
+        rotation = cls.matrices_to_hpr(basis / safe_scale[:, None, :])
+        return position, rotation, scale
+    
+    def _update_levels(self, levels: List[np.ndarray]):
+        """Recompute stale world matrices for slots grouped by depth, root level first"""
+        dirty, parent = self.dirty, self.parent
+        for slots in levels:
+            parents = parent[slots]
+            has_parent = parents >= 0
+            stale = dirty[slots]
+            stale[has_parent] |= dirty[parents[has_parent]]
+            if not stale.any():
+                continue
+            
+            stale_slots = slots[stale]
+            stale_parents = parents[stale]
+            dirty[stale_slots] = True  # Propagates to the next level
+            self._unpushed.update(stale_slots.tolist())
+            local = self.local_matrices(stale_slots)
+            
+            # Roots: the world transform is the local one, keep the HPR as given
+            roots = stale_parents < 0
+            if roots.any():
+                root_slots = stale_slots[roots]
+                self.world_matrix[root_slots] = local[roots]
+                self.world_position[root_slots] = self.local_position[root_slots]
+                self.world_rotation[root_slots] = self.local_rotation[root_slots]
+                self.world_scale[root_slots] = self.local_scale[root_slots]
+            
+            children = ~roots
+            if children.any():
+                child_slots = stale_slots[children]
+                world = np.matmul(self.world_matrix[stale_parents[children]], local[children])
+                self.world_matrix[child_slots] = world
+                position, rotation, scale = self.decompose(world)
+                self.world_position[child_slots] = position
+                self.world_rotation[child_slots] = rotation
+                self.world_scale[child_slots] = scale
+    
+    def _rebuild_levels(self):
+        """Group live slots by hierarchy depth"""
+        live = np.flatnonzero(self.alive[:self.count])
+        if live.size == 0:
+            self._levels = []
+            return
+        depths = self.depth[live]
+        order = np.argsort(depths, kind='stable')
+        live, depths = live[order], depths[order]
+        splits = np.flatnonzero(np.diff(depths)) + 1
+        self._levels = np.split(live, splits)
+    
+    def update(self):
+        """Recompute every stale world transform in one pass over the hierarchy"""
+        if not self.has_dirty:
+            return
+        if self._levels is None:
+            self._rebuild_levels()
+        self._update_levels(self._levels)
+        self.dirty[:self.count] = False
+        self.has_dirty = False
+    
+    def update_subtree(self, obj: 'GameObject'):
+        """Recompute obj's subtree right away (used when propagation is not deferred)"""
+        levels = []
+        level = [obj]
+        while level:
+            levels.append(np.fromiter((node._slot for node in level), dtype=np.int64, count=len(level)))
+            level = [child for node in level for child in node.children]
+        
+        self.dirty[obj._slot] = True
+        self._update_levels(levels)
+        for slots in levels:
+            self.dirty[slots] = False
+    
+    def unpushed_slots(self):
+        """Slots with sky objects whose world position or scale differs from what was last sent to skyExplorer.
+        
+        Only slots created, recomputed or marked since the previous call are
+        compared, and they are forgotten, so the caller must push what is
+        returned. Returns (slots, moved, rescaled) where moved/rescaled are
+        boolean masks over slots.
+        """
+        if not self._unpushed:
+            empty = np.zeros(0, dtype=bool)
+            return np.zeros(0, dtype=np.int64), empty, empty
+        candidates = np.fromiter(self._unpushed, dtype=np.int64, count=len(self._unpushed))
+        self._unpushed.clear()
+        candidates.sort()
+        candidates = candidates[self.alive[candidates] & self.bound[candidates]]
+        position = self.world_position[candidates]
+        scale = self.world_scale[candidates].mean(axis=1)
+        moved = ~np.all(np.isclose(position, self.pushed_position[candidates], rtol=1e-9, atol=1e-9), axis=1)
+        rescaled = ~np.isclose(scale, self.pushed_scale[candidates], rtol=1e-9, atol=1e-9)
+        changed = moved | rescaled
+        return candidates[changed], moved[changed], rescaled[changed]
+
+# Transforms of objects that are not attached to any SkyEngine yet
+_detached_transforms = TransformStore()
+
+class _OctreeNode:
+    """Cube of the spatial index octree; leaves hold points, inner nodes eight lazily created children"""
+    
+    __slots__ = ('center', 'half', 'depth', 'children', 'points')
+    
+    def __init__(self, center: Tuple[float, float, float], half: float, depth: int):
+        self.center = center
+        self.half = half
+        self.depth = depth
+        self.children: Optional[List[Optional['_OctreeNode']]] = None
+        self.points: Dict[int, Tuple[float, float, float]] = {}
+    
+    def contains(self, point: Tuple[float, float, float]) -> bool:
+        half = self.half
+        cx, cy, cz = self.center
+        return abs(point[0] - cx) <= half and abs(point[1] - cy) <= half and abs(point[2] - cz) <= half
+    
+    def octant(self, point: Tuple[float, float, float]) -> int:
+        cx, cy, cz = self.center
+        return (point[0] >= cx) | ((point[1] >= cy) << 1) | ((point[2] >= cz) << 2)
+    
+    def child(self, octant: int) -> '_OctreeNode':
+        """Child node for an octant, created on first use"""
+        node = self.children[octant]
+        if node is None:
+            quarter = self.half / 2.0
+            cx, cy, cz = self.center
+            node = _OctreeNode((cx + (quarter if octant & 1 else -quarter),
+                                cy + (quarter if octant & 2 else -quarter),
+                                cz + (quarter if octant & 4 else -quarter)),
+                               quarter, self.depth + 1)
+            self.children[octant] = node
+        return node
+    
+    def distance_squared(self, point: Tuple[float, float, float]) -> float:
+        """Squared distance from point to this node's cube (0 inside)"""
+        total = 0.0
+        for axis in range(3):
+            gap = abs(point[axis] - self.center[axis]) - self.half
+            if gap > 0:
+                total += gap * gap
+        return total
+
+class SpatialIndex:
+    """Point octree over the world positions of a TransformStore.
+    
+    Slots are indexed rather than objects, so the index never holds
+    references to GameObjects. sync() compares the store's world positions
+    with the positions last indexed and only re-files the slots that
+    changed, appeared or were released; a point that stays inside its leaf
+    is updated in place. The root cube grows by doubling to cover points
+    outside it. Slots at non-finite positions are left out of the index.
+    """
+    
+    LEAF_CAPACITY = 16
+    MAX_DEPTH = 24
+    
+    def __init__(self, store: TransformStore):
+        self.store = store
+        self.root: Optional[_OctreeNode] = None
+        self._leaf_of: Dict[int, _OctreeNode] = {}
+        self._indexed = np.full((0, 3), np.nan)
+    
+    def __len__(self) -> int:
+        return len(self._leaf_of)
+    
+    def sync(self) -> int:
+        """Bring the index up to date with the store and return the number of slots re-filed"""
+        store = self.store
+        count = store.count
+        if len(self._indexed) < store.capacity:
+            grown = np.full((store.capacity, 3), np.nan)
+            grown[:len(self._indexed)] = self._indexed
+            self._indexed = grown
+        
+        indexed = self._indexed[:count]
+        position = store.world_position[:count]
+        alive = store.alive[:count]
+        was_indexed = ~np.isnan(indexed[:, 0])
+        finite = np.all(np.isfinite(position), axis=1)
+        changed = np.flatnonzero(alive & finite & ~np.all(indexed == position, axis=1))
+        released = np.flatnonzero(~(alive & finite) & was_indexed)
+        
+        for slot in released.tolist():
+            self.remove(slot)
+        for slot, point in zip(changed.tolist(), position[changed].tolist()):
+            self.move(slot, tuple(point))
+        return len(changed) + len(released)
+    
+    def move(self, slot: int, point: Tuple[float, float, float]):
+        """Insert slot at point, or update it if already indexed (non-finite points drop it)"""
+        if not all(math.isfinite(coordinate) for coordinate in point):
+            self.remove(slot)
+            return
+        leaf = self._leaf_of.get(slot)
+        if leaf is not None:
+            if leaf.contains(point):
+                leaf.points[slot] = point
+                self._indexed[slot] = point
+                return
+            del leaf.points[slot]
+        self._insert(slot, point)
+        self._indexed[slot] = point
+    
+    def remove(self, slot: int):
+        """Drop a slot from the index"""
+        leaf = self._leaf_of.pop(slot, None)
+        if leaf is not None:
+            del leaf.points[slot]
+        self._indexed[slot] = np.nan
+    
+    def clear(self):
+        self.root = None
+        self._leaf_of.clear()
+        self._indexed[:] = np.nan
+    
+    def _insert(self, slot: int, point: Tuple[float, float, float]):
+        if self.root is None:
+            self.root = _OctreeNode(point, 1.0, 0)
+        while not self.root.contains(point):
+            self._grow_root(point)
+        
+        node = self.root
+        while node.children is not None:
+            node = node.child(node.octant(point))
+        node.points[slot] = point
+        self._leaf_of[slot] = node
+        if len(node.points) > self.LEAF_CAPACITY and node.depth - self.root.depth < self.MAX_DEPTH:
+            self._split(node)
+    
+    def _grow_root(self, point: Tuple[float, float, float]):
+        """Double the root cube towards point, keeping the old root as one octant"""
+        old = self.root
+        half = old.half
+        center = tuple(c + (half if p >= c else -half) for p, c in zip(point, old.center))
+        root = _OctreeNode(center, half * 2.0, old.depth - 1)
+        root.children = [None] * 8
+        root.children[root.octant(old.center)] = old
+        self.root = root
+    
+    def _split(self, leaf: _OctreeNode):
+        points = leaf.points
+        leaf.points = {}
+        leaf.children = [None] * 8
+        for slot, point in points.items():
+            node = leaf
+            while node.children is not None:
+                node = node.child(node.octant(point))
+            node.points[slot] = point
+            self._leaf_of[slot] = node
+    
+    def query_radius(self, center: Tuple[float, float, float], radius: float) -> List[int]:
+        """Slots within radius of center"""
+        if self.root is None:
+            return []
+        limit = radius * radius
+        cx, cy, cz = center
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.distance_squared(center) > limit:
+                continue
+            if node.children is None:
+                for slot, (x, y, z) in node.points.items():
+                    if (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2 <= limit:
+                        found.append(slot)
+            else:
+                stack.extend(child for child in node.children if child is not None)
+        return found
+    
+    def query_box(self, low: Tuple[float, float, float], high: Tuple[float, float, float]) -> List[int]:
+        """Slots inside the axis-aligned box [low, high]"""
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            half = node.half
+            if any(node.center[axis] + half < low[axis] or node.center[axis] - half > high[axis] for axis in range(3)):
+                continue
+            if node.children is None:
+                for slot, point in node.points.items():
+                    if all(low[axis] <= point[axis] <= high[axis] for axis in range(3)):
+                        found.append(slot)
+            else:
+                stack.extend(child for child in node.children if child is not None)
+        return found
+    
+    def iter_nearest(self, point: Tuple[float, float, float]) -> Iterator[Tuple[int, float]]:
+        """Yield (slot, distance) pairs in increasing distance from point"""
+        if self.root is None:
+            return
+        px, py, pz = point
+        counter = 0
+        heap = [(self.root.distance_squared(point), counter, self.root, -1)]
+        while heap:
+            distance_squared, _, node, slot = heapq.heappop(heap)
+            if node is None:
+                yield slot, math.sqrt(distance_squared)
+                continue
+            if node.children is None:
+                for slot, (x, y, z) in node.points.items():
+                    counter += 1
+                    heapq.heappush(heap, ((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2, counter, None, slot))
+            else:
+                for child in node.children:
+                    if child is not None:
+                        counter += 1
+                        heapq.heappush(heap, (child.distance_squared(point), counter, child, -1))
+
+TRAVERSAL_ORDERS = ('pre', 'post', 'breadth')
+
+def _as_vector_rows(values: Any, count: int, default: float) -> np.ndarray:
+    """Convert a Vec list, (N, 3) array or (N,) array of uniform values into an (N, 3) array"""
+    if values is None:
+        return np.full((count, 3), default)
+    if len(values) and hasattr(values[0], 'x'):
+        rows = np.array([(v.x, v.y, v.z) for v in values], dtype=float)
+    else:
+        rows = np.asarray(values, dtype=float)
+        if rows.ndim == 1:
+            rows = np.repeat(rows[:, None], 3, axis=1)
+    if rows.shape != (count, 3):
+        raise ValueError(f"Expected {count} vectors, got array of shape {rows.shape}")
+    return rows
+
+def iter_hierarchy(roots: Iterable['GameObject'], order: str = 'pre',
+                   predicate: Optional[Callable[['GameObject'], bool]] = None) -> Iterator['GameObject']:
+    """Lazily walk the hierarchies under roots without recursion.
+    
+    Args:
+        roots: objects to start from, visited in the given order
+        order: 'pre' (parents before children), 'post' (children before
+               parents) or 'breadth' (level by level)
+        predicate: optional filter; objects failing it are not yielded but
+                   their children are still visited
+    
+    Stop consuming the iterator to end the walk early.
+    """
+    if order == 'pre':
+        stack = list(roots)
+        stack.reverse()
+        while stack:
+            obj = stack.pop()
+            if predicate is None or predicate(obj):
+                yield obj
+            stack.extend(reversed(obj.children))
+    elif order == 'post':
+        stack = [(obj, False) for obj in roots]
+        stack.reverse()
+        while stack:
+            obj, expanded = stack.pop()
+            if expanded:
+                if predicate is None or predicate(obj):
+                    yield obj
+            else:
+                stack.append((obj, True))
+                stack.extend((child, False) for child in reversed(obj.children))
+    elif order == 'breadth':
+        queue = deque(roots)
+        while queue:
+            obj = queue.popleft()
+            if predicate is None or predicate(obj):
+                yield obj
+            queue.extend(obj.children)
+    else:
+        raise ValueError(f"Unknown traversal order '{order}', expected one of {TRAVERSAL_ORDERS}")
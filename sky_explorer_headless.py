@@ -0,0 +1,361 @@
+"""Pure-Python, in-process stand-in for the skyExplorer module.
+
+Lets sky_engine run, be profiled and be benchmarked without the planetarium
+software. Select it with
+
+    SKY_ENGINE_BACKEND=headless python my_show.py
+
+Every class the engine uses is provided with the same enums (trimmed to
+the commonly used members for the very large name catalogs). Objects
+accept any lowerCamelCase method, which records the call and returns None;
+attribute assignments are recorded as 'name='. A property reads back the
+value last given to set<Name>() or assigned, per object id, until the next
+SceneGraph.reset(). Environment variables:
+
+    SKY_HEADLESS_LATENCY    seconds added to every call (default 0)
+    SKY_HEADLESS_RECORD     0 to only count calls instead of logging them
+    SKY_HEADLESS_MAX_CALLS  size of the call log (default 100000)
+
+configure() changes the same settings at runtime, including per-method
+latency, so engine overhead can be measured apart from renderer cost.
+"""
+
+from collections import Counter, deque
+from enum import IntEnum
+from time import perf_counter, sleep
+from typing import Any, Dict, List, Tuple
+import math
+import os
+
+__all__ = ['Vec', 'Vec4', 'Animator', 'SceneGraph', 'Camera', 'Planet', 'IndividualStar', 'Stars',
+           'Constellation', 'Asteroid', 'Comet', 'Satellite', 'Galaxy', 'Nebula', 'InsertText', 'Audio',
+           'AudioLayer', 'Clock', 'DateManager']
+
+
+# (class name, object id, method, args) of the latest calls, oldest first
+calls: deque = deque(maxlen=int(os.environ.get("SKY_HEADLESS_MAX_CALLS", "100000")))
+
+# (class name, method) -> number of calls, kept even when recording is off
+call_counts: Counter = Counter()
+
+# object id -> property name -> value last written by set<Name>() or assignment
+_properties: Dict[int, Dict[str, Any]] = {}
+
+_settings = {
+    'record': os.environ.get("SKY_HEADLESS_RECORD", "1") != "0",
+    'latency': float(os.environ.get("SKY_HEADLESS_LATENCY", "0") or 0.0),
+    'reset_delay': 0.0,
+}
+_method_latency: Dict[Tuple[str, str], float] = {}
+
+def configure(latency: float = None, method_latency: Dict[str, float] = None, record: bool = None,
+              max_calls: int = None, reset_delay: float = None):
+    """Change stand-in behaviour.
+
+    Args:
+        latency: seconds added to every call
+        method_latency: per-call latency overrides keyed 'Class.method'
+        record: log each call in calls (counts are always kept)
+        max_calls: size of the call log
+        reset_delay: seconds before a SceneGraph.reset() shows in resetWatcher
+    """
+    global calls
+    if latency is not None:
+        _settings['latency'] = latency
+    if method_latency is not None:
+        _method_latency.clear()
+        for key, delay in method_latency.items():
+            class_name, _, method = key.partition('.')
+            _method_latency[(class_name, method)] = delay
+    if record is not None:
+        _settings['record'] = record
+    if max_calls is not None:
+        calls = deque(calls, maxlen=max_calls)
+    if reset_delay is not None:
+        _settings['reset_delay'] = reset_delay
+
+def reset_calls():
+    """Forget every recorded call and count"""
+    calls.clear()
+    call_counts.clear()
+
+def _wait(delay: float):
+    """Block for delay seconds; short delays spin since sleep() is too coarse"""
+    if delay >= 0.002:
+        sleep(delay)
+        return
+    end = perf_counter() + delay
+    while perf_counter() < end:
+        pass
+
+def _record(sky_object, name: str, args: tuple):
+    key = (type(sky_object).__name__, name)
+    call_counts[key] += 1
+    if _settings['record']:
+        calls.append((key[0], sky_object.id, name, args))
+    delay = _method_latency.get(key, _settings['latency'])
+    if delay:
+        _wait(delay)
+
+def _make_method(name: str):
+    if name.startswith('set') and name[3:4].isupper():
+        written = name[3].lower() + name[4:]
+        
+        def method(self, *args):
+            _record(self, name, args)
+            if args:
+                _properties.setdefault(self.id, {})[written] = args[0]
+    else:
+        def method(self, *args):
+            _record(self, name, args)
+    method.__name__ = method.__qualname__ = name
+    return method
+
+class _Member:
+    """A lowerCamelCase name on a stand-in class: the property value once written, else a recording method"""
+
+    __slots__ = ('name', 'function')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.function = _make_method(name)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.function
+        values = _properties.get(instance.id)
+        if values is not None and self.name in values:
+            return values[self.name]
+        return self.function.__get__(instance, owner)
+
+def _enum(name: str, members: str) -> type:
+    """IntEnum numbered from 0 like the skyExplorer enums, with their names/values maps"""
+    enum = IntEnum(name, [(member, value) for value, member in enumerate(members.split())])
+    enum.names = {member.name: member for member in enum}
+    enum.values = {member.value: member for member in enum}
+    return enum
+
+class Vec:
+    """3D vector"""
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __repr__(self) -> str:
+        return f"Vec({self.x}, {self.y}, {self.z})"
+
+    def dot(self, other: 'Vec') -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: 'Vec') -> 'Vec':
+        return Vec(self.y * other.z - self.z * other.y,
+                   self.z * other.x - self.x * other.z,
+                   self.x * other.y - self.y * other.x)
+
+    def lengthSquared(self) -> float:
+        return self.dot(self)
+
+    def length(self) -> float:
+        return math.sqrt(self.lengthSquared())
+
+    def isNull(self) -> bool:
+        return self.x == 0.0 and self.y == 0.0 and self.z == 0.0
+
+    def distanceToPoint(self, point: 'Vec') -> float:
+        return Vec(self.x - point.x, self.y - point.y, self.z - point.z).length()
+
+    def normalized(self) -> 'Vec':
+        length = self.length()
+        return Vec(self.x / length, self.y / length, self.z / length) if length else Vec()
+
+    def normalize(self):
+        normalized = self.normalized()
+        self.x, self.y, self.z = normalized.x, normalized.y, normalized.z
+
+    def toVec4(self) -> 'Vec4':
+        return Vec4(self.x, self.y, self.z, 0.0)
+
+class Vec4:
+    """4D vector (RGBA colours, key colour + tolerance)"""
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+        self.w = float(w)
+
+    def __repr__(self) -> str:
+        return f"Vec4({self.x}, {self.y}, {self.z}, {self.w})"
+
+    def dot(self, other: 'Vec4') -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+    def lengthSquared(self) -> float:
+        return self.dot(self)
+
+    def length(self) -> float:
+        return math.sqrt(self.lengthSquared())
+
+    def normalized(self) -> 'Vec4':
+        length = self.length()
+        return Vec4(self.x / length, self.y / length, self.z / length, self.w / length) if length else Vec4()
+
+    def normalize(self):
+        normalized = self.normalized()
+        self.x, self.y, self.z, self.w = normalized.x, normalized.y, normalized.z, normalized.w
+
+    def toVec3(self) -> Vec:
+        return Vec(self.x, self.y, self.z)
+
+class Animator:
+    """Transition settings passed along with animated calls"""
+
+    Interpolator = _enum('Interpolator', 'InvalidInterpolator InterpolatorLinear InterpolatorInertial '
+                                         'InterpolatorPsc InterpolatorCount')
+
+    def __init__(self, duration: float = 0.0):
+        self.duration = duration
+        self.acceleration = 0.0
+        self.deceleration = 0.0
+        self.timingOffset = 0.0
+        self.interpolator = Animator.Interpolator.InterpolatorLinear
+
+class _SkyClass(type):
+    """Gives stand-in classes any lowerCamelCase method on first lookup"""
+
+    def __getattr__(cls, name: str):
+        # skyExplorer methods are lowerCamelCase; snake_case lookups must fail as on the real module
+        if not name[:1].islower() or '_' in name:
+            raise AttributeError(name)
+        member = _Member(name)
+        setattr(cls, name, member)
+        return member.function
+
+class _SkyObject(metaclass=_SkyClass):
+    """Base of the stand-in scene objects; the same constructor arguments give the same id"""
+
+    _next_id = 1
+    _ids: Dict[Tuple[str, tuple], int] = {}
+
+    def __init__(self, *args):
+        key = (type(self).__name__, args)
+        object_id = _SkyObject._ids.get(key) if args else None
+        if object_id is None:
+            object_id = _SkyObject._next_id
+            _SkyObject._next_id += 1
+            if args:
+                _SkyObject._ids[key] = object_id
+        object.__setattr__(self, 'id', object_id)
+
+    def __getattr__(self, name: str):
+        # Only reached for names not looked up on the class yet
+        getattr(type(self), name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        _record(self, f"{name}=", (value,))
+        _properties.setdefault(self.id, {})[name] = value
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id})"
+
+class SceneGraph(_SkyObject):
+    """Scene root; resetWatcher counts resets, each completing configure(reset_delay=...) seconds after reset()"""
+
+    ConnexionState = _enum('ConnexionState', 'InvalidConnexionState Disconnected Connected ConnexionStateCount')
+
+    # perf_counter() times at which each reset() completes
+    _reset_times: List[float] = []
+
+    def reset(self, reinitId: int = 1):
+        _record(self, 'reset', (reinitId,))
+        _properties.clear()
+        SceneGraph._reset_times.append(perf_counter() + _settings['reset_delay'])
+
+    @property
+    def connexionState(self):
+        return SceneGraph.ConnexionState.Connected
+
+    @property
+    def resetWatcher(self) -> int:
+        now = perf_counter()
+        return sum(1 for completed in SceneGraph._reset_times if completed <= now)
+
+class Camera(_SkyObject):
+    CameraName = _enum('CameraName', 'InvalidCamera MainCamera CameraCount')
+    CameraPort = _enum('CameraPort', 'InvalidCameraPort FixedBackground Background FixedForeground '
+                                     'Foreground CameraPortCount')
+    PositionMode = _enum('PositionMode', 'InvalidPositionMode XYZ LBR PositionModeCount')
+
+class Planet(_SkyObject):
+    PlanetName = _enum('PlanetName', 'InvalidPlanet Mercury Venus Earth Mars Jupiter Saturn Uranus Neptune '
+                                     'PlanetCount')
+    TerrainModel = _enum('TerrainModel', 'InvalidTerrainModel DefaultTerrain BasicTerrain BMNG_Ocean '
+                                         'BMNG_Seasons BMNG_Summer BMNG_Winter Did_Sliced Geoid Magellan '
+                                         'Magellan_BW Messenger MOC PlanetObserver PlanetObserver_DEM30 '
+                                         'Sliced Themis Topography Viking CTX CTXColorized TerrainModelCount')
+
+class IndividualStar(_SkyObject):
+    """Individual stars, including the Sun"""
+
+    IndividualStarName = _enum('IndividualStarName', 'InvalidIndividualStar Sun Sirius Canopus Arcturus '
+                                                     'AlphaCentauriA Vega Capella Rigel Procyon Altair '
+                                                     'Aldebaran Antares Spica Deneb Polaris '
+                                                     'IndividualStarCount')
+
+class Stars(_SkyObject):
+    StarsName = _enum('StarsName', 'InvalidStars StarrySky StarsCount')
+    Modelset = _enum('Modelset', 'InvalidModelset Hipparcos GaiaDR2 ModelsetCount')
+
+class Constellation(_SkyObject):
+    ConstellationName = _enum('ConstellationName',
+                              'InvalidConstellation And Ant Aps Aqr Aql Ara Ari Aur Boo Cae Cam Cnc Cvn CMa '
+                              'CMi Cap Car Cas Cen Cep Cet Cha Cir Col Com CrA CrB Crv Crt Cru Cyg Del Dor '
+                              'Dra Equ Eri For Gem Gru Her Hor Hya Hyi Ind Lac Leo Lmi Lep Lib Lup Lyn Lyr '
+                              'Men Mic Mon Mus Nor Oct Oph Ori Pav Peg Per Phe Pic Psc PsA Pup Pyx Ret Sge '
+                              'Sgr Sco Scl Sct Ser Sex Tau Tel Tri Tra Tuc UMa UMi Vel Vir Vol Vul '
+                              'ConstellationCount')
+
+class Asteroid(_SkyObject):
+    AsteroidName = _enum('AsteroidName', ' '.join(['InvalidAsteroid']
+                                                  + [f"Asteroid{index:03d}" for index in range(1, 101)]
+                                                  + ['AsteroidCount']))
+
+class Comet(_SkyObject):
+    CometName = _enum('CometName', ' '.join(['InvalidComet'] + [f"Comet{index:03d}" for index in range(1, 101)]
+                                            + ['CometCount']))
+
+class Satellite(_SkyObject):
+    SatelliteName = _enum('SatelliteName', 'InvalidSatellite Moon Phobos Deimos Io Europa Ganymede Callisto '
+                                           'Mimas Enceladus Tethys Dione Rhea Titan Hyperion Iapetus Atlas Pan '
+                                           'Miranda Arial Umbriel Titania Oberon Triton Charon Nix Hydra '
+                                           'SatelliteCount')
+
+class Galaxy(_SkyObject):
+    GalaxyName = _enum('GalaxyName', 'InvalidGalaxy MilkyWay LMC SMC SgrDSph And CenA M32 M110 GalaxyCount')
+
+class Nebula(_SkyObject):
+    NebulaName = _enum('NebulaName', 'InvalidNebula Helix BUG ROTTENEGG CATEYE REDRECTANGLE SATURN BUTTERFLY '
+                                     'ANT SNR0509_67_5 ABELL39 DUMBBELL LITTLEDUMBBELL OWL NGC2346 ESKIMO '
+                                     'EIGHTBURST GHOSTOFJUPITER SOUTHERNER REDSPIDER GLOWINGEYE BLINKINGNEBULA '
+                                     'NGC7027 ORION HH47 EAGLE CRAB NebulaCount')
+
+class InsertText(_SkyObject):
+    InsertTextName = _enum('InsertTextName', ' '.join(['InvalidInsertText']
+                                                      + [f"InsertText{index:03d}" for index in range(1, 501)]
+                                                      + ['InsertTextCount']))
+
+class Audio(_SkyObject):
+    pass
+
+class AudioLayer(_SkyObject):
+    pass
+
+class Clock(_SkyObject):
+    ClockName = _enum('ClockName', ' '.join(['InvalidClock'] + [f"Clock{index:03d}" for index in range(1, 11)]
+                                            + ['StudioReservedClock', 'ClockCount']))
+
+class DateManager(_SkyObject):
+    pass
@@ -0,0 +1,25 @@
+"""Run the suite on the headless skyExplorer stand-in"""
+import os
+import sys
+
+import pytest
+
+os.environ["SKY_ENGINE_BACKEND"] = "headless"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sky_explorer_headless
+from sky_engine import SkyEngine, configure_logging
+
+configure_logging(console=False)
+
+@pytest.fixture
+def engine():
+    sky_explorer_headless.reset_calls()
+    return SkyEngine()
+
+def last_sent(sky_object, name: str):
+    """Arguments of the latest recorded call (or 'name=' assignment) on sky_object"""
+    for _, object_id, method, args in reversed(sky_explorer_headless.calls):
+        if object_id == sky_object.id and method == name:
+            return args[0] if len(args) == 1 else args
+    return None
@@ -0,0 +1,22 @@
+from sky_engine import GameObject, PlanetComponent, keyframe
+from sky_engine import engine as engine_module
+from sky_explorer_headless import Planet
+
+def run_in_keyframe(engine, cue):
+    wrapped = keyframe(0.0, 0.0, 0)(cue)
+    try:
+        return wrapped(engine)
+    finally:
+        engine_module.all_frames.pop()
+
+def test_create_objects_inside_keyframe(engine):
+    objects = run_in_keyframe(engine, lambda engine: engine.create_objects(["a", "b"]))
+    assert [obj.name for obj in objects] == ["a", "b"]
+    assert all(isinstance(obj.obj, GameObject) for obj in objects)
+    assert engine.get_object_by_name("a") is objects[0].obj
+
+def test_acquire_object_inside_keyframe(engine):
+    acquired = run_in_keyframe(
+        engine, lambda engine: engine.acquire_object("mars", PlanetComponent, Planet.PlanetName.Mars))
+    assert isinstance(acquired.obj, GameObject)
+    assert acquired.get_component("Planet").sky_object is not None
@@ -0,0 +1,46 @@
+import sky_explorer_headless
+from conftest import last_sent
+from sky_engine import PlanetComponent, Vec
+from sky_explorer_headless import Planet
+
+def make_planet(engine, name="mars", planet_name=Planet.PlanetName.Mars):
+    obj = engine.create_object(name)
+    planet = PlanetComponent(planet_name)
+    obj.add_component(planet)
+    return obj, planet
+
+def test_discarded_value_is_sent_again(engine):
+    obj, planet = make_planet(engine)
+    engine.set_deferred_commands(True)
+    planet.set_intensity(0.3)
+    obj.set_position(Vec(1, 2, 3))
+    engine.command_queue.discard()
+    
+    planet.set_intensity(0.3)
+    engine.update(0.0)
+    assert last_sent(planet.sky_object, 'setIntensity') == 0.3
+    assert last_sent(planet.sky_object, 'setPosition').x == 1.0
+
+def test_clear_all_objects_drops_their_queued_calls(engine):
+    _, planet = make_planet(engine)
+    engine.set_deferred_commands(True)
+    planet.set_intensity(0.3)
+    engine.clear_all_objects()
+    
+    assert len(engine.command_queue) == 0
+    sky_explorer_headless.reset_calls()
+    engine.flush()
+    assert not sky_explorer_headless.calls
+
+def test_destroy_object_drops_only_its_queued_calls(engine):
+    doomed, doomed_planet = make_planet(engine, "doomed")
+    _, kept_planet = make_planet(engine, "kept", Planet.PlanetName.Earth)
+    engine.set_deferred_commands(True)
+    doomed_planet.set_intensity(0.3)
+    kept_planet.set_intensity(0.4)
+    engine.destroy_object(doomed)
+    
+    sky_explorer_headless.reset_calls()
+    assert engine.flush() == 1
+    assert last_sent(kept_planet.sky_object, 'setIntensity') == 0.4
+    assert last_sent(doomed_planet.sky_object, 'setIntensity') is None
@@ -0,0 +1,28 @@
+from conftest import last_sent
+from sky_engine import ConstellationComponent, TextComponent
+
+def test_standalone_constellation_shows_boundaries():
+    constellation = ConstellationComponent("Orion")
+    assert constellation.sky_object is None
+    constellation.turn_boundaries_on()
+    assert constellation.sky_object is not None
+    assert last_sent(constellation.sky_object, 'setBoundaryIntensity') == 1.0
+
+def test_standalone_constellation_pointer_creates_backend():
+    constellation = ConstellationComponent("Lyra")
+    constellation.set_pointer_intensity(0.5)
+    assert last_sent(constellation.sky_object, 'setPointerIntensity') == 0.5
+
+def test_standalone_text_is_created_when_set():
+    text = TextComponent()
+    assert text.sky_object is None
+    text.set_text("Welcome")
+    assert text.sky_object is not None
+    assert last_sent(text.sky_object, 'setText') == "Welcome"
+    assert last_sent(text.sky_object, 'setIntensity') == 1.0
+
+def test_hidden_text_stays_lazy():
+    text = TextComponent()
+    text.set_intensity(0.0)
+    text.set_text("Later")
+    assert text.sky_object is None
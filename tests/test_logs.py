@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_logging(script: str) -> subprocess.CompletedProcess:
+    """Run script in a fresh interpreter, outside pytest's log capture"""
+    environment = dict(os.environ, SKY_ENGINE_BACKEND="headless", PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, "-c", "from sky_engine import configure_logging, log\n" + script],
+                          capture_output=True, text=True, env=environment, check=True)
+
+def test_silenced_console_does_not_fall_back_to_stderr():
+    result = run_logging("configure_logging(console=False)\nlog.warning('hidden')\nlog.error('hidden')")
+    assert result.stdout == "" and result.stderr == ""
+
+def test_console_comes_back_after_silencing():
+    result = run_logging("configure_logging(console=False)\nconfigure_logging(console=True)\nlog.warning('shown')")
+    assert result.stdout == "Warning: shown\n" and result.stderr == ""
@@ -0,0 +1,40 @@
+from conftest import last_sent
+from sky_engine import CometComponent, ObjectPool, PlanetComponent, get_catalog
+from sky_explorer_headless import Comet, Planet
+
+def test_reuse_sends_back_backend_attributes(engine):
+    pool = ObjectPool(engine)
+    comet_name = get_catalog(Comet.CometName).first
+    obj = pool.acquire("comet", CometComponent, comet_name)
+    comet = obj.get_component("Comet")
+    comet.set_tail_intensity(0.9)
+    pool.release(obj)
+    
+    assert pool.acquire("comet", CometComponent, comet_name) is obj
+    assert comet.tail_intensity == 0.5
+    assert last_sent(comet.sky_object, 'tailIntensity=') == 0.5
+
+def test_reuse_restores_backend_value_of_unset_property(engine):
+    Planet(Planet.PlanetName.Mars).setAtmosphereIntensity(1.0)
+    pool = ObjectPool(engine)
+    obj = pool.acquire("mars", PlanetComponent, Planet.PlanetName.Mars)
+    planet = obj.get_component("Planet")
+    planet.set_atmosphere_intensity(0.7)
+    pool.release(obj)
+    
+    pool.acquire("mars", PlanetComponent, Planet.PlanetName.Mars)
+    assert planet.atmosphere_intensity is None
+    assert planet.sky_object.atmosphereIntensity == 1.0
+    assert last_sent(planet.sky_object, 'setIntensity') == 1.0
+
+def test_reuse_restores_vec_mutated_in_place(engine):
+    pool = ObjectPool(engine)
+    obj = pool.acquire("mars", PlanetComponent, Planet.PlanetName.Mars)
+    planet = obj.get_component("Planet")
+    planet.live_patch_gamma.x = 2.0
+    planet.set_live_patch_gamma(planet.live_patch_gamma)
+    pool.release(obj)
+    
+    pool.acquire("mars", PlanetComponent, Planet.PlanetName.Mars)
+    assert planet.live_patch_gamma.x == 1.0
+    assert last_sent(planet.sky_object, 'setLivePatchGamma').x == 1.0
@@ -0,0 +1,50 @@
+from sky_engine import Vec
+
+def test_child_position_under_zero_scale_parent(engine):
+    parent = engine.create_object("parent")
+    child = engine.create_object("child")
+    parent.add_child(child)
+    parent.set_position(Vec(1, 2, 3))
+    parent.set_scale(Vec(0, 0, 0))
+    
+    child.set_position(Vec(4, 2, 3))
+    assert tuple(engine.transforms.local_position[child._slot]) == (3.0, 0.0, 0.0)
+
+def test_child_position_under_scaled_parent(engine):
+    parent = engine.create_object("parent")
+    child = engine.create_object("child")
+    parent.add_child(child)
+    parent.set_position(Vec(1, 0, 0))
+    parent.set_scale(Vec(2, 2, 2))
+    
+    child.set_position(Vec(5, 0, 0))
+    assert tuple(engine.transforms.local_position[child._slot]) == (2.0, 0.0, 0.0)
+
+def test_spatial_index_skips_non_finite_positions(engine):
+    near = engine.create_object("near")
+    near.set_position(Vec(1, 0, 0))
+    lost = engine.create_object("lost")
+    lost.set_position(Vec(float('inf'), 0, 0))
+    
+    assert engine.get_nearest_object(Vec(0, 0, 0)) is near
+    lost.set_position(Vec(0.5, 0, 0))
+    assert engine.get_nearest_object(Vec(0, 0, 0)) is lost
+    lost.set_position(Vec(0, float('nan'), 0))
+    assert engine.get_nearest_object(Vec(0, 0, 0)) is near
+
+def test_unpushed_slots_only_reports_changed_slots(engine):
+    from sky_engine import PlanetComponent
+    from sky_explorer_headless import Planet
+    objects = engine.create_objects([f"planet{i}" for i in range(4)],
+                                    components=[lambda: PlanetComponent(Planet.PlanetName.Mars)] * 4)
+    store = engine.transforms
+    engine.update(0.0)
+    slots, _, _ = store.unpushed_slots()
+    assert len(slots) == 0 and not store._unpushed
+    
+    store.local_position[objects[2]._slot] = (7.0, 0.0, 0.0)
+    store.mark_dirty(objects[2]._slot)
+    store.update()
+    slots, moved, rescaled = store.unpushed_slots()
+    assert slots.tolist() == [objects[2]._slot]
+    assert moved.tolist() == [True] and rescaled.tolist() == [False]
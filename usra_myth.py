@@ -1,4 +1,4 @@
-from sky_engine import *
+from sky_engine import SkyEngine, SunComponent, Vec
 
 sun_obj = None
 